@@ -2,6 +2,8 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 
+from region_extraction import crop_regions, extract
+
 # Load the image
 image_path = 'film_grain_synthesis.png'
 image = cv2.imread(image_path)
@@ -14,21 +16,16 @@ else:
     image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
     # Define the positions and size for the sections to be extracted
-    positions = [(500, 190), (1209, 190), (1918, 190)]
-    section_size_x = 50
-    section_size_y = 30
+    regions = crop_regions([(500, 190), (1209, 190), (1918, 190)], width=50, height=30)
 
-    # Extract the sections
-    sections = []
-    for (x, y) in positions:
-        section = image_rgb[y:y+section_size_y, x:x+section_size_x]
-        sections.append(section)
+    # Extract the sections (views into image_rgb)
+    sections = extract(image_rgb, regions)
 
     # Display the sections side by side
     plt.figure(figsize=(15, 5))
 
     for i, section in enumerate(sections):
-        plt.subplot(1, 3, i+1)
+        plt.subplot(1, len(sections), i+1)
         plt.imshow(section)
         plt.axis('off')
 
@@ -0,0 +1,215 @@
+import concurrent.futures
+import os
+import sys
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'encoding_loop_intra_modes'))
+
+from block_transform import frame_to_blocks, blocks_to_frame, dct2_blocks, idct2_blocks  # noqa: E402
+
+# Denoising front-end of the film grain pipeline.
+#
+# Adding_film_grain_synthesis_to_mulberry.py calls
+#   cv2.fastNlMeansDenoisingColored(image_rgb, None, h=10, templateWindowSize=7, searchWindowSize=21)
+# which takes seconds per full-resolution frame. Here the denoiser is a
+# pluggable stage:
+#
+#   nlm         OpenCV non-local means (the script's denoiser)
+#   bilateral   OpenCV bilateral filter, edge preserving and fast
+#   temporal    motion-adaptive average with neighbouring frames; pixels that
+#               differ from the current frame by more than the noise are
+#               left out, so moving content is not smeared
+#   dct         shrinkage in the block DCT of block_transform.py: 8x8 DCT on
+#               several shifted block grids, coefficients below
+#               DCT_THRESHOLD * sigma are zeroed and the shifted
+#               reconstructions are averaged, weighted by their sparsity
+#
+# Every denoiser has a 'fast' and a 'quality' mode (smaller windows and
+# fewer DCT grid shifts in the fast one). The noise sigma is estimated once
+# per frame from the finest DCT coefficients unless it is given. The frame
+# is split into tiles with TILE_OVERLAP pixels of context on every side;
+# the tiles run in a process pool and only their centres are written back,
+# so there are no seams between tiles.
+
+MODES = ('fast', 'quality')
+TILE_SIZE = 512
+TILE_OVERLAP = 16  # covers the widest support (NLM quality: 21 // 2 + 7 // 2)
+DCT_BLOCK_SIZE = 8
+DCT_THRESHOLD = 2.7
+NLM_WINDOWS = {'fast': (5, 11), 'quality': (7, 21)}  # (template, search)
+BILATERAL_DIAMETER = {'fast': 5, 'quality': 9}
+DCT_SHIFT_STEP = {'fast': 4, 'quality': 2}
+TEMPORAL_WINDOW = {'fast': 3, 'quality': 5}
+NLM_STRENGTH = 0.6  # h / sigma
+MAD_TO_SIGMA = 1.4826  # median absolute deviation -> standard deviation of a Gaussian
+
+
+def estimate_noise_sigma(image):
+    """Noise standard deviation per channel, from the highest-frequency 4x4 DCT coefficient."""
+    image = np.asarray(image, dtype=np.float64)
+    channels = image.reshape(image.shape[:2] + (-1,))
+    sigma = []
+    for channel in np.moveaxis(channels, -1, 0):
+        size = 4
+        coefficients = dct2_blocks(frame_to_blocks(channel[:channel.shape[0] // size * size,
+                                                           :channel.shape[1] // size * size], size))
+        sigma.append(MAD_TO_SIGMA * float(np.median(np.abs(coefficients[..., -1, -1]))))
+    return np.array(sigma)
+
+
+def _nlm(tile, sigma, mode, neighbours):
+    template, search = NLM_WINDOWS[mode]
+    if tile.ndim == 3:
+        h = NLM_STRENGTH * float(np.mean(sigma))
+        return cv2.fastNlMeansDenoisingColored(tile, None, h, h, template, search)
+    return cv2.fastNlMeansDenoising(tile, None, NLM_STRENGTH * float(sigma[0]), template, search)
+
+
+def _bilateral(tile, sigma, mode, neighbours):
+    diameter = BILATERAL_DIAMETER[mode]
+    return cv2.bilateralFilter(tile, diameter, 3 * float(np.mean(sigma)), diameter / 2)
+
+
+def _temporal(tile, sigma, mode, neighbours):
+    window = TEMPORAL_WINDOW[mode]
+    current = tile.astype(np.float32)
+    total = current.copy()
+    weight = np.ones(tile.shape[:2], dtype=np.float32)
+    # Differences are box filtered so the noise alone stays below the limit
+    limit = 2 * float(np.mean(sigma)) + 1
+    for neighbour in neighbours:
+        neighbour = neighbour.astype(np.float32)
+        difference = np.abs(cv2.blur(neighbour - current, (window, window)))
+        if difference.ndim == 3:
+            difference = difference.max(axis=2)
+        similar = np.clip(2 - difference / limit, 0, 1)
+        total += neighbour * (similar[..., None] if tile.ndim == 3 else similar)
+        weight += similar
+    return total / (weight[..., None] if tile.ndim == 3 else weight)
+
+
+def _dct_shrink(plane, sigma, step):
+    size = DCT_BLOCK_SIZE
+    height, width = plane.shape
+    padded = np.pad(plane.astype(np.float32), size, mode='reflect')
+    total = np.zeros_like(padded)
+    weight = np.zeros_like(padded)
+    threshold = DCT_THRESHOLD * sigma
+    for dy in range(0, size, step):
+        for dx in range(0, size, step):
+            shifted = padded[dy:, dx:]
+            rows, cols = shifted.shape[0] // size, shifted.shape[1] // size
+            coefficients = dct2_blocks(frame_to_blocks(shifted[:rows * size, :cols * size], size))
+            keep = np.abs(coefficients) >= threshold
+            keep[..., 0, 0] = True
+            # Sparser blocks are more likely noise-free, so they get a larger weight
+            block_weight = 1 / keep.sum(axis=(-2, -1), dtype=np.float32)
+            reconstructed = idct2_blocks(coefficients * keep) * block_weight[..., None, None]
+            total[dy:dy + rows * size, dx:dx + cols * size] += blocks_to_frame(reconstructed)
+            weight[dy:dy + rows * size, dx:dx + cols * size] += blocks_to_frame(
+                np.broadcast_to(block_weight[..., None, None], reconstructed.shape))
+    return (total / weight)[size:size + height, size:size + width]
+
+
+def _dct(tile, sigma, mode, neighbours):
+    step = DCT_SHIFT_STEP[mode]
+    if tile.ndim == 2:
+        return _dct_shrink(tile, sigma[0], step)
+    return np.stack([_dct_shrink(tile[:, :, c], sigma[c], step) for c in range(tile.shape[2])], axis=2)
+
+
+DENOISERS = {
+    'nlm': _nlm,
+    'bilateral': _bilateral,
+    'temporal': _temporal,
+    'dct': _dct,
+}
+
+
+def _denoise_tile(task):
+    method, tile, sigma, mode, neighbours = task
+    return DENOISERS[method](tile, sigma, mode, neighbours)
+
+
+def tiles(shape, tile_size=TILE_SIZE, overlap=TILE_OVERLAP):
+    """(inner, outer) slice pairs: the tile's own region and the region read with context."""
+    height, width = shape[:2]
+    regions = []
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            bottom, right = min(top + tile_size, height), min(left + tile_size, width)
+            inner = (slice(top, bottom), slice(left, right))
+            outer = (slice(max(top - overlap, 0), min(bottom + overlap, height)),
+                     slice(max(left - overlap, 0), min(right + overlap, width)))
+            regions.append((inner, outer))
+    return regions
+
+
+def default_workers():
+    """All cores for the tile pool, or None (serial) when there is one core or the count is unknown."""
+    cpu_count = os.cpu_count() or 1
+    return cpu_count if cpu_count > 1 else None
+
+
+def denoise(image, method='dct', mode='fast', sigma=None, neighbours=(), tile_size=TILE_SIZE, workers=None):
+    """Denoises an (H, W) plane or (H, W, C) image; the result has the input's dtype.
+
+    sigma: noise standard deviation (scalar or per channel), estimated when None.
+    neighbours: frames next to this one, used by the temporal denoiser.
+    workers: None or 0 runs the tiles serially, otherwise the number of worker processes.
+    """
+    if method not in DENOISERS:
+        raise ValueError(f"Unknown denoiser {method!r}, expected one of {sorted(DENOISERS)}")
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+    image = np.asarray(image)
+    channels = image.shape[2] if image.ndim == 3 else 1
+    if sigma is None:
+        sigma = estimate_noise_sigma(image)
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=np.float64), (channels,))
+
+    regions = tiles(image.shape, tile_size)
+    tasks = [(method, image[outer], sigma, mode, [np.asarray(n)[outer] for n in neighbours])
+             for _, outer in regions]
+    if workers:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_denoise_tile, tasks))
+    else:
+        results = [_denoise_tile(task) for task in tasks]
+
+    output = np.empty_like(image)
+    limits = np.iinfo(image.dtype) if np.issubdtype(image.dtype, np.integer) else None
+    for (inner, outer), result in zip(regions, results):
+        centre = result[tuple(slice(i.start - o.start, i.stop - o.start) for i, o in zip(inner, outer))]
+        if limits is not None:
+            centre = np.clip(np.round(centre), limits.min, limits.max)
+        output[inner] = centre
+    return output
+
+
+if __name__ == "__main__":
+    import time
+
+    # Mulberry picture with added Gaussian noise of a known sigma
+    image = cv2.cvtColor(cv2.imread('mulberry.jpg'), cv2.COLOR_BGR2RGB)
+    rng = np.random.default_rng(0)
+    noise_sigma = 8
+    noisy = np.clip(image + rng.normal(0, noise_sigma, image.shape), 0, 255).astype(np.uint8)
+    print(f"{image.shape[1]}x{image.shape[0]}, added sigma {noise_sigma}, "
+          f"estimated {np.round(estimate_noise_sigma(noisy), 2)}")
+
+    def psnr(a, b):
+        return 10 * np.log10(255 ** 2 / np.mean((a.astype(np.float64) - b) ** 2))
+
+    # Two later "frames" for the temporal denoiser: the same picture with fresh noise
+    neighbours = [np.clip(image + rng.normal(0, noise_sigma, image.shape), 0, 255).astype(np.uint8)
+                  for _ in range(2)]
+    workers = default_workers()
+    print(f"noisy: {psnr(noisy, image):.2f} dB")
+    for method in DENOISERS:
+        for mode in MODES:
+            start = time.perf_counter()
+            denoised = denoise(noisy, method, mode, neighbours=neighbours, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{method:9s} {mode:7s}: {psnr(denoised, image):.2f} dB, {elapsed:.2f} s")
@@ -0,0 +1,264 @@
+import numpy as np
+from scipy.signal import lfilter
+
+from film_grain_synthesis import (film_grain_params, num_ar_positions, _ar_taps, AR_PADDING,
+                                  CHROMA_GRAIN_SIZES, DEFAULT_GRAIN_SEED, LUMA_GRAIN_SIZE, MAX_LUMA_POINTS,
+                                  MAX_CHROMA_POINTS)
+
+# Film grain parameter estimation from an original / denoised pair.
+#
+# Adding_film_grain_synthesis_to_mulberry.py denoises with
+# cv2.fastNlMeansDenoisingColored and then picks the grain strength by hand.
+# Here the grain is measured: noise = original - denoised, looked at only in
+# flat blocks (lowest gradient energy of the denoised plane), where it is
+# grain and not removed texture. Per plane:
+#
+#   AR filter   the causal lag-L neighbourhood (plus the co-located luma
+#               noise for chroma) predicts each noise sample; the taps of all
+#               sampled blocks go into one normal-equation solve
+#   scaling     the noise standard deviation per intensity bin, divided by
+#               the standard deviation the synthesized grain template gets
+#               from the fitted AR filter, as up to 14 / 10 scaling points
+#
+# Flatness is judged on a 2x decimated plane and only max_blocks blocks
+# (evenly spread over the flat ones) are fitted; the template deviation comes
+# from a float simulation with one IIR filter per template row. A 1080p
+# frame is estimated in milliseconds, so this can run inline in an encode.
+# The result is a FilmGrainParams for film_grain_synthesis.add_film_grain().
+
+BLOCK_SIZE = 32
+MAX_BLOCKS = 128
+FLAT_QUANTILE = 0.25
+MIN_BIN_SAMPLES = 256
+MAX_AR_SHIFT = 9  # ar_coeff_shift_minus_6 is 2 bits
+GAUSSIAN_SEQUENCE_STD = 512  # standard deviation of Gaussian_Sequence (12-bit)
+SIMULATION_ROWS = 2
+
+
+def flat_blocks(plane, block_size=BLOCK_SIZE, max_blocks=MAX_BLOCKS, quantile=FLAT_QUANTILE, bit_depth=8):
+    """(rows, cols) indices of up to max_blocks of the flattest, unclipped blocks of a plane."""
+    rows, cols = plane.shape[0] // block_size, plane.shape[1] // block_size
+    half = block_size // 2
+    decimated = np.asarray(plane)[:rows * block_size:2, :cols * block_size:2].astype(np.float32)
+    blocks = decimated.reshape(rows, half, cols, half)
+    energy = (np.square(np.diff(blocks, axis=1)).mean(axis=(1, 3)) +
+              np.square(np.diff(blocks, axis=3)).mean(axis=(1, 3)))
+    # Grain is clipped away near black and white
+    mean = blocks.mean(axis=(1, 3))
+    margin = 8 << (bit_depth - 8)
+    usable = (mean > margin) & (mean < (1 << bit_depth) - 1 - margin)
+    if not usable.any():
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    threshold = np.quantile(energy[usable], quantile)
+    block_rows, block_cols = np.nonzero(usable & (energy <= threshold))
+    if len(block_rows) > max_blocks:
+        keep = np.linspace(0, len(block_rows) - 1, max_blocks).astype(np.intp)
+        block_rows, block_cols = block_rows[keep], block_cols[keep]
+    return block_rows, block_cols
+
+
+def gather_blocks(plane, block_rows, block_cols, block_shape):
+    """(K, h, w) stack of the selected blocks (int32)."""
+    height, width = block_shape
+    ys = block_rows[:, None] * height + np.arange(height)
+    xs = block_cols[:, None] * width + np.arange(width)
+    return np.asarray(plane)[ys[:, :, None], xs[:, None, :]].astype(np.int32)
+
+
+def fit_ar(noise, lag, luma=None):
+    """Least-squares AR coefficients (spec tap order, luma tap last) over a (K, h, w) noise stack."""
+    height, width = noise.shape[1:]
+    features = [noise[:, lag + dy:height + dy, lag + dx:width - lag + dx] for dy, dx in _ar_taps(lag)]
+    if luma is not None:
+        features.append(luma[:, lag:, lag:width - lag])
+    if not features:
+        return np.zeros(0)
+    design = np.empty((features[0].size, len(features)), dtype=np.float32)
+    for i, feature in enumerate(features):
+        design[:, i] = feature.ravel()
+    target = noise[:, lag:, lag:width - lag].ravel().astype(np.float32)
+    normal = (design.T @ design).astype(np.float64)
+    normal += 1e-6 * np.trace(normal) / len(normal) * np.eye(len(normal))
+    return np.linalg.solve(normal, (design.T @ target).astype(np.float64))
+
+
+def ar_shift(*coefficients):
+    """Finest coefficient shift (6..9) at which all coefficients fit in 8 signed bits."""
+    largest = max(float(np.abs(c).max(initial=0)) for c in coefficients)
+    shift = 6
+    while shift < MAX_AR_SHIFT and largest * (1 << (shift + 1)) <= 127:
+        shift += 1
+    return shift
+
+
+def quantize_ar(coefficients, shift):
+    """ar_coeffs_*_plus_128 tuple of float coefficients at the given shift."""
+    quantized = np.clip(np.round(np.asarray(coefficients) * (1 << shift)), -128, 127).astype(int)
+    return tuple((quantized + 128).tolist())
+
+
+def noise_strength(intensity, noise, num_points, bit_depth=8):
+    """(8-bit intensity of each bin, noise standard deviation) for bins with enough samples."""
+    intensity = np.asarray(intensity).ravel() >> (bit_depth - 8)
+    noise = np.asarray(noise, dtype=np.float64).ravel()
+    bins = np.minimum(intensity * num_points // 256, num_points - 1)
+    counts = np.bincount(bins, minlength=num_points)
+    used = counts >= MIN_BIN_SAMPLES
+    if not used.any():
+        return np.zeros(0, dtype=int), np.zeros(0)
+    sums = np.bincount(bins, noise, minlength=num_points)[used]
+    squares = np.bincount(bins, noise * noise, minlength=num_points)[used]
+    centres = np.bincount(bins, intensity, minlength=num_points)[used]
+    counts = counts[used]
+    std = np.sqrt(np.maximum(squares / counts - (sums / counts) ** 2, 0))
+    centres, first = np.unique(np.round(centres / counts).astype(int), return_index=True)
+    return centres, std[first]
+
+
+def _simulate_ar(white, lag, coefficients, extra=None):
+    """Float version of the synthesis AR filter; the same-row taps run as one IIR filter per row."""
+    grain = white.copy()
+    height, width = grain.shape
+    taps = _ar_taps(lag)
+    feedback = np.zeros(lag + 1)
+    feedback[0] = 1
+    for (dy, dx), c in zip(taps, coefficients):
+        if dy == 0:
+            feedback[-dx] = -c
+    for y in range(AR_PADDING, height):
+        fixed = grain[y, AR_PADDING:width - AR_PADDING].copy()
+        for (dy, dx), c in zip(taps, coefficients):
+            if dy < 0:
+                fixed += c * grain[y + dy, AR_PADDING + dx:width - AR_PADDING + dx]
+        if extra is not None:
+            fixed += extra[y - AR_PADDING]
+        if lag:
+            # Lead-in inputs that make the filter output the (unfiltered) padding first
+            lead_in = np.convolve(grain[y, :AR_PADDING], feedback)[:AR_PADDING]
+            fixed = lfilter([1], feedback, np.concatenate([lead_in, fixed]))[AR_PADDING:]
+        grain[y, AR_PADDING:width - AR_PADDING] = fixed
+    return grain
+
+
+def synthesized_std(lag, luma_coefficients, chroma_coefficients=(), subsampling=(1, 1), bit_depth=8,
+                    grain_scale_shift=0):
+    """Standard deviations of the luma and chroma grain templates for the given AR coefficients."""
+    rng = np.random.default_rng(0)
+    white_std = GAUSSIAN_SEQUENCE_STD / (1 << (12 - bit_depth + grain_scale_shift))
+    # Templates SIMULATION_ROWS times taller than the real ones, for a steadier estimate
+    luma_height = LUMA_GRAIN_SIZE[0] * SIMULATION_ROWS
+    luma = _simulate_ar(rng.normal(0, white_std, (luma_height, LUMA_GRAIN_SIZE[1])), lag, luma_coefficients)
+    stds = [float(np.std(luma[AR_PADDING:, AR_PADDING:-AR_PADDING]))]
+    sub_x, sub_y = subsampling
+    height = ((luma_height - 1 - AR_PADDING - sub_y) >> sub_y) + AR_PADDING + 1
+    width = CHROMA_GRAIN_SIZES[subsampling][1]
+    ys = ((np.arange(AR_PADDING, height) - AR_PADDING) << sub_y) + AR_PADDING
+    xs = ((np.arange(AR_PADDING, width - AR_PADDING) - AR_PADDING) << sub_x) + AR_PADDING
+    co_located = sum(luma[ys[:, None] + i, xs[None, :] + j] for i in range(sub_y + 1)
+                     for j in range(sub_x + 1)) / (1 << (sub_x + sub_y))
+    for coefficients in chroma_coefficients:
+        chroma = _simulate_ar(rng.normal(0, white_std, (height, width)), lag, coefficients[:-1],
+                              co_located * coefficients[-1])
+        stds.append(float(np.std(chroma[AR_PADDING:, AR_PADDING:-AR_PADDING])))
+    return stds
+
+
+def estimate_film_grain(original, denoised, bit_depth=8, lag=3, block_size=BLOCK_SIZE, max_blocks=MAX_BLOCKS,
+                        grain_seed=DEFAULT_GRAIN_SEED, num_luma_points=8, num_chroma_points=4):
+    """FilmGrainParams from (y, u, v) plane tuples (u/v may be None) of the original and denoised frame."""
+    if not isinstance(original, (tuple, list)):
+        original, denoised = (original,), (denoised,)
+    original = list(original) + [None] * (3 - len(original))
+    denoised = list(denoised) + [None] * (3 - len(denoised))
+    y, y_denoised = original[0], denoised[0]
+    sub_x = sub_y = 1
+    if original[1] is not None:
+        sub_x = int(np.shape(original[1])[1] < np.shape(y)[1])
+        sub_y = int(np.shape(original[1])[0] < np.shape(y)[0])
+
+    block_rows, block_cols = flat_blocks(y_denoised, block_size, max_blocks, bit_depth=bit_depth)
+    if len(block_rows) == 0:
+        return film_grain_params(apply_grain=0, grain_seed=grain_seed)
+    level = gather_blocks(y_denoised, block_rows, block_cols, (block_size, block_size))
+    noise = gather_blocks(y, block_rows, block_cols, (block_size, block_size)) - level
+    luma_coefficients = fit_ar(noise, lag)
+    strengths = {'y': noise_strength(level, noise, min(num_luma_points, MAX_LUMA_POINTS), bit_depth)}
+    if len(strengths['y'][0]) == 0:
+        return film_grain_params(apply_grain=0, grain_seed=grain_seed)
+
+    # Co-located luma noise of the chroma blocks, averaged like the synthesis does
+    chroma_shape = (block_size >> sub_y, block_size >> sub_x)
+    co_located = noise.reshape(len(noise), chroma_shape[0], 1 << sub_y, chroma_shape[1], 1 << sub_x).mean(axis=(2, 4))
+    fields = dict(grain_seed=grain_seed, ar_coeff_lag=lag)
+    chroma_coefficients = {}
+    for plane, name in ((1, 'cb'), (2, 'cr')):
+        if original[plane] is None:
+            continue
+        chroma_level = gather_blocks(denoised[plane], block_rows, block_cols, chroma_shape)
+        chroma_noise = gather_blocks(original[plane], block_rows, block_cols, chroma_shape) - chroma_level
+        chroma_coefficients[name] = fit_ar(chroma_noise, lag, co_located)
+        values, strength = noise_strength(chroma_level, chroma_noise, min(num_chroma_points, MAX_CHROMA_POINTS),
+                                          bit_depth)
+        if len(values):
+            strengths[name] = values, strength
+            # Scaling indexed by the chroma sample itself: merged = (64 * chroma) >> 6
+            fields.update({f'{name}_mult': 192, f'{name}_luma_mult': 128, f'{name}_offset': 256})
+
+    shift = ar_shift(luma_coefficients, *chroma_coefficients.values())
+    fields['ar_coeff_shift_minus_6'] = shift - 6
+    fields['ar_coeffs_y_plus_128'] = quantize_ar(luma_coefficients, shift)
+    for name in ('cb', 'cr'):
+        coefficients = chroma_coefficients.get(name, np.zeros(num_ar_positions(lag) + 1))
+        fields[f'ar_coeffs_{name}_plus_128'] = quantize_ar(coefficients, shift)
+
+    # Scaling: measured noise std over the std of unit-scaled grain with the quantized filters
+    dequantized = [(np.array(fields[f'ar_coeffs_{name}_plus_128']) - 128) / (1 << shift) for name in ('y', 'cb', 'cr')]
+    template_std = dict(zip(('y', 'cb', 'cr'), synthesized_std(lag, dequantized[0], dequantized[1:], (sub_x, sub_y),
+                                                                bit_depth)))
+    relative = {name: strength / max(template_std[name], 1e-9) for name, (_, strength) in strengths.items()}
+    largest = max(float(r.max()) for r in relative.values())
+    grain_scaling_minus_8 = 0
+    while grain_scaling_minus_8 < 3 and largest * (1 << (grain_scaling_minus_8 + 9)) <= 255:
+        grain_scaling_minus_8 += 1
+    fields['grain_scaling_minus_8'] = grain_scaling_minus_8
+    for name, (values, _) in strengths.items():
+        fields[f'point_{name}_value'] = tuple(values.tolist())
+        fields[f'point_{name}_scaling'] = tuple(
+            np.clip(np.round(relative[name] * (1 << (grain_scaling_minus_8 + 8))), 0, 255).astype(int).tolist())
+    return film_grain_params(**fields)
+
+
+if __name__ == "__main__":
+    import time
+    import cv2
+    from film_grain_synthesis import add_film_grain
+
+    # Grain estimated on the mulberry picture, which has visible film grain
+    image = cv2.imread('mulberry.jpg')
+    height, width = (s - s % 2 for s in image.shape[:2])
+    yuv = cv2.cvtColor(image[:height, :width], cv2.COLOR_BGR2YUV_I420)
+
+    def planes(frame):
+        return (frame[:height], frame[height:height + height // 4].reshape(height // 2, width // 2),
+                frame[height + height // 4:].reshape(height // 2, width // 2))
+
+    start = time.perf_counter()
+    denoised_yuv = cv2.fastNlMeansDenoising(yuv, None, h=5, templateWindowSize=7, searchWindowSize=21)
+    denoise_time = time.perf_counter() - start
+    original, denoised = planes(yuv), planes(denoised_yuv)
+
+    start = time.perf_counter()
+    params = estimate_film_grain(original, denoised, grain_seed=7391)
+    estimate_time = time.perf_counter() - start
+    print(f"Denoise {denoise_time:.2f} s, estimation {estimate_time * 1000:.1f} ms")
+    for name, value in params._asdict().items():
+        print(f"  {name}: {value}")
+
+    # Re-synthesized grain against the measured noise, in the flat blocks the fit used
+    grained = add_film_grain(*denoised, params=params)
+    block_rows, block_cols = flat_blocks(denoised[0])
+    measured = gather_blocks(original[0], block_rows, block_cols, (32, 32)) - gather_blocks(
+        denoised[0], block_rows, block_cols, (32, 32))
+    synthesized = gather_blocks(grained[0], block_rows, block_cols, (32, 32)) - gather_blocks(
+        denoised[0], block_rows, block_cols, (32, 32))
+    print(f"Flat-block luma noise std: measured {np.std(measured):.2f}, synthesized {np.std(synthesized):.2f}")
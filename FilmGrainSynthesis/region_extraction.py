@@ -0,0 +1,227 @@
+import collections
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'encoding_loop_intra_modes'))
+
+from quality_metrics import mse, mse_to_psnr, ssim  # noqa: E402
+
+# Region extraction and spot-check metrics.
+#
+# Cut_three_parts_from_image.py hard-codes positions [(500, 190), (1209, 190),
+# (1918, 190)] and a 50x30 size, and VMAF/split_an_image_into_two.py splits a
+# side-by-side picture with 3 and 9 pixel margins. Here regions are data:
+#
+#   crop_regions()          a list of positions and one size
+#   side_by_side_regions()  equal panels of a side-by-side picture, from its
+#                           outer border and the gap between panels
+#
+# extract() returns the regions as NumPy views (plain slices, nothing is
+# copied). region_metrics() scores many frames in one batch: the regions of
+# every frame are gathered into a (frames, regions, h, w) stack, only the
+# region pixels are read (with frame_source.py's memory-mapped Y4M/YUV frames
+# the rest of the frame is never paged in), and the quality_metrics.py
+# functions run once over the whole stack:
+#
+#   mse, psnr, ssim   reference against test
+#   grain             for both: variance after removing the best-fit plane
+#                     (so gradients are not counted as grain) and the noise
+#                     power spectrum of that residual, radially averaged into
+#                     NPS_BINS bins from 0 to 0.5 cycles/pixel
+#
+# comparison_image() tiles the regions of several frames into one picture
+# (a row per frame, a column per region) and can write it out.
+
+Region = collections.namedtuple('Region', ['name', 'x', 'y', 'width', 'height'])
+GrainStatistics = collections.namedtuple('GrainStatistics', ['variance', 'noise_power'])
+RegionMetrics = collections.namedtuple('RegionMetrics', ['mse', 'psnr', 'ssim', 'reference_grain', 'test_grain'])
+
+NPS_BINS = 8
+SSIM_WINDOW = 7
+
+
+def crop_regions(positions, width, height, names=None):
+    """Regions of one size at the given (x, y) top-left positions."""
+    if names is None:
+        names = [f"region_{i}" for i in range(len(positions))]
+    return [Region(name, int(x), int(y), width, height) for name, (x, y) in zip(names, positions)]
+
+
+def side_by_side_regions(shape, panels=2, border=0, gap=0, names=None):
+    """Full-height equal panels of a side-by-side picture of the given shape.
+
+    border: background columns left and right of the picture.
+    gap: background columns between two panels.
+    """
+    height, width = shape[:2]
+    panel_width = (width - 2 * border - (panels - 1) * gap) // panels
+    if panel_width <= 0:
+        raise ValueError(f"{panels} panels with border {border} and gap {gap} do not fit in {width}x{height}")
+    positions = [(border + i * (panel_width + gap), 0) for i in range(panels)]
+    return crop_regions(positions, panel_width, height, names)
+
+
+def _check_bounds(shape, region):
+    height, width = shape[:2]
+    if region.x < 0 or region.y < 0 or region.x + region.width > width or region.y + region.height > height:
+        raise ValueError(f"Region {region.name} ({region.width}x{region.height} at {region.x},{region.y}) "
+                         f"is outside the {width}x{height} frame")
+
+
+def extract(image, regions):
+    """Zero-copy views of the regions, in the order given."""
+    image = np.asarray(image)
+    views = []
+    for region in regions:
+        _check_bounds(image.shape, region)
+        views.append(image[region.y:region.y + region.height, region.x:region.x + region.width])
+    return views
+
+
+def _region_indices(regions):
+    """{(h, w): (region indices, ys, xs)} to gather all regions of one size with a single fancy index."""
+    groups = collections.OrderedDict()
+    for index, region in enumerate(regions):
+        groups.setdefault((region.height, region.width), []).append(index)
+    indices = collections.OrderedDict()
+    for (height, width), members in groups.items():
+        ys = np.array([regions[i].y for i in members])[:, None] + np.arange(height)
+        xs = np.array([regions[i].x for i in members])[:, None] + np.arange(width)
+        indices[height, width] = (members, ys[:, :, None], xs[:, None, :])
+    return indices
+
+
+def _planes_last(stack):
+    # (..., h, w, C) -> (..., C, h, w) so the metrics see the image in the last two axes
+    return np.moveaxis(stack, -1, -3) if stack.ndim == 5 else stack
+
+
+def _detrend(patches):
+    height, width = patches.shape[-2:]
+    ys, xs = np.mgrid[0:height, 0:width]
+    design = np.stack([np.ones(height * width), ys.ravel(), xs.ravel()], axis=1)
+    values = patches.reshape(patches.shape[:-2] + (height * width,)).astype(np.float64)
+    residual = values - (values @ np.linalg.pinv(design).T) @ design.T
+    return residual.reshape(patches.shape)
+
+
+def grain_statistics(patches, bins=NPS_BINS):
+    """GrainStatistics over the last two axes of a patch stack (leading axes are kept)."""
+    residual = _detrend(patches)
+    height, width = residual.shape[-2:]
+    variance = (residual * residual).sum(axis=(-2, -1)) / (height * width - 3)
+    power = np.abs(np.fft.fft2(residual)) ** 2 / (height * width)
+    radius = np.hypot(*np.meshgrid(np.fft.fftfreq(height), np.fft.fftfreq(width), indexing='ij'))
+    bin_index = np.minimum((radius / 0.5 * bins).astype(int), bins - 1).ravel()
+    counts = np.bincount(bin_index, minlength=bins)
+    membership = np.eye(bins)[bin_index] / np.maximum(counts, 1)
+    noise_power = power.reshape(power.shape[:-2] + (height * width,)) @ membership
+    return GrainStatistics(variance, noise_power)
+
+
+def _channel_mean(values, stack):
+    return values.mean(axis=-1) if stack.ndim == 5 else values
+
+
+def region_metrics(reference_frames, test_frames, regions, bit_depth=8, win_size=SSIM_WINDOW, bins=NPS_BINS):
+    """RegionMetrics of many frame pairs, every field shaped (frames, regions[, bins]).
+
+    The frames may be arrays, lists or iterables (read once); colour images
+    are scored per channel and averaged.
+    """
+    indices = _region_indices(regions)
+    crops = {size: ([], []) for size in indices}
+    count = 0
+    for reference_frame, test_frame in zip(reference_frames, test_frames):
+        reference_frame, test_frame = np.asarray(reference_frame), np.asarray(test_frame)
+        if count == 0:
+            for region in regions:
+                _check_bounds(reference_frame.shape, region)
+                _check_bounds(test_frame.shape, region)
+        for size, (_, ys, xs) in indices.items():
+            crops[size][0].append(reference_frame[ys, xs])
+            crops[size][1].append(test_frame[ys, xs])
+        count += 1
+    if count == 0:
+        raise ValueError("No frames to score")
+
+    fields = {name: np.zeros((count, len(regions))) for name in ('mse', 'psnr', 'ssim')}
+    grain = {name: GrainStatistics(np.zeros((count, len(regions))), np.zeros((count, len(regions), bins)))
+             for name in ('reference_grain', 'test_grain')}
+    for size, (members, _, _) in indices.items():
+        reference_stack, test_stack = np.stack(crops[size][0]), np.stack(crops[size][1])
+        x, y = _planes_last(reference_stack), _planes_last(test_stack)
+        mse_values = mse(x, y)
+        fields['mse'][:, members] = _channel_mean(mse_values, reference_stack)
+        fields['psnr'][:, members] = mse_to_psnr(fields['mse'][:, members], (1 << bit_depth) - 1)
+        if min(size) >= win_size:
+            fields['ssim'][:, members] = _channel_mean(ssim(x, y, win_size, bit_depth=bit_depth), reference_stack)
+        else:
+            fields['ssim'][:, members] = np.nan
+        for name, stack in (('reference_grain', x), ('test_grain', y)):
+            statistics = grain_statistics(stack, bins)
+            grain[name].variance[:, members] = _channel_mean(statistics.variance, reference_stack)
+            noise_power = statistics.noise_power
+            if reference_stack.ndim == 5:
+                noise_power = noise_power.mean(axis=-2)
+            grain[name].noise_power[:, members] = noise_power
+    return RegionMetrics(**fields, **grain)
+
+
+def comparison_image(images, regions, scale=4, gap=4, background=255, path=None):
+    """Tiles the regions of each image (a row per image), enlarged scale times, optionally writing it to path."""
+    crops = [extract(image, regions) for image in images]
+    sample = np.asarray(images[0])
+    row_height = max(region.height for region in regions) * scale
+    widths = [region.width * scale for region in regions]
+    height = len(images) * row_height + (len(images) + 1) * gap
+    width = sum(widths) + (len(regions) + 1) * gap
+    canvas = np.full((height, width) + sample.shape[2:], background, dtype=sample.dtype)
+    for row, row_crops in enumerate(crops):
+        top = gap + row * (row_height + gap)
+        left = gap
+        for crop, tile_width in zip(row_crops, widths):
+            tile = np.repeat(np.repeat(crop, scale, axis=0), scale, axis=1)
+            canvas[top:top + tile.shape[0], left:left + tile_width] = tile
+            left += tile_width + gap
+    if path is not None:
+        import cv2
+        cv2.imwrite(path, canvas)
+    return canvas
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    import cv2
+    from film_grain_synthesis import add_film_grain, film_grain_params
+
+    # The three sections of Cut_three_parts_from_image.py
+    image = cv2.imread('film_grain_synthesis.png')
+    regions = crop_regions([(500, 190), (1209, 190), (1918, 190)], 50, 30, names=['left', 'middle', 'right'])
+    views = extract(image, regions)
+    print(f"{len(views)} views of {views[0].shape}, sharing memory: {np.shares_memory(views[0], image)}")
+
+    # 60 luma frames: a gradient with film grain against the same frames without it
+    height, width, count = 720, 1280, 60
+    clean = np.broadcast_to(np.linspace(40, 200, width).astype(np.uint8), (count, height, width))
+    params = film_grain_params(point_y_value=(0, 255), point_y_scaling=(96, 96),
+                               grain_scaling_minus_8=1, ar_coeff_lag=1, ar_coeff_shift_minus_6=1,
+                               ar_coeffs_y_plus_128=(136, 144, 136, 152))
+    grained = [add_film_grain(frame, params=params._replace(grain_seed=7391 + index))[0]
+               for index, frame in enumerate(clean)]
+    spots = crop_regions([(64, 64), (600, 300), (1100, 600)], 64, 64)
+
+    start = time.perf_counter()
+    metrics = region_metrics(clean, grained, spots)
+    elapsed = time.perf_counter() - start
+    print(f"{len(grained)} frames x {len(spots)} regions in {elapsed * 1000:.1f} ms")
+    print(f"PSNR {metrics.psnr.mean(axis=0).round(2)} dB, SSIM {metrics.ssim.mean(axis=0).round(3)}")
+    print(f"Grain variance {metrics.test_grain.variance.mean(axis=0).round(2)} "
+          f"(reference {metrics.reference_grain.variance.mean(axis=0).round(2)})")
+    print(f"Noise power spectrum (region 0): {metrics.test_grain.noise_power[:, 0].mean(axis=0).round(1)}")
+
+    path = os.path.join(tempfile.gettempdir(), 'region_comparison.png')
+    comparison_image([clean[0], grained[0]], spots, scale=2, path=path)
+    print(f"Wrote {path}")
@@ -1,21 +1,21 @@
+import os
+import sys
 import cv2
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'FilmGrainSynthesis'))
+
+from region_extraction import side_by_side_regions, extract  # noqa: E402
+
 # Load the combined image
 combined_image_path = "original_and_quantized_image.png"
 combined_image = cv2.imread(combined_image_path, cv2.IMREAD_GRAYSCALE)
 
-# Get the dimensions of the image
-height, width = combined_image.shape
-
-# Adjust the boundaries for accurate splitting
-midpoint = width // 2
-left_margin = 3
-right_margin = 9
-split_width = midpoint - left_margin - right_margin
+# Two panels with a 3 pixel border on the left and right and an 18 pixel
+# separator between them (see region_extraction.py)
+regions = side_by_side_regions(combined_image.shape, panels=2, border=3, gap=18, names=['original', 'quantized'])
 
 # Split the image into left (original) and right (quantized) parts
-original_image = combined_image[:, left_margin:midpoint - right_margin]
-quantized_image = combined_image[:, midpoint + right_margin:midpoint + right_margin + split_width]
+original_image, quantized_image = extract(combined_image, regions)
 
 # Save the split images
 original_image_path = "original_image.png"
@@ -0,0 +1,389 @@
+import collections
+import concurrent.futures
+import json
+import os
+import re
+import sys
+import numpy as np
+from scipy.ndimage import correlate1d
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'encoding_loop_intra_modes'))
+
+from frame_source import y4m_frames  # noqa: E402
+
+# In-process VMAF (float features, libsvm nu-SVR model).
+#
+# PASPReadMe.txt computes VMAF by running ffmpeg.exe with libvmaf and the
+# vmaf_float_v0.6.1.json model. This module computes the same elementary
+# features in NumPy:
+#
+#   vif_scale0..3  visual information fidelity at 4 scales (Gaussian windows
+#                  of 17, 9, 5 and 3 taps, 2x decimation between scales)
+#   adm2           detail loss measure: db2 wavelet at 4 scales, decoupling
+#                  of the distorted bands into restored + additive parts,
+#                  contrast sensitivity weighting and contrast masking
+#   motion2        mean absolute difference of consecutive blurred reference
+#                  frames, minimum of the current and the next difference
+#
+# and feeds them to the SVM of a libvmaf JSON model. Frames of the two videos
+# are decoded one pair at a time and the per-frame features are computed in a
+# process pool, so many encodes can be scored without spawning ffmpeg. The
+# features see the decoded Y plane itself (frame_source.py for Y4M, PyAV for
+# compressed video), scaled to 8 bits for higher bit depths as libvmaf does.
+#
+# The features follow the libvmaf float extractors, but boundary handling and
+# a few constants are simplified, so scores are close to, not bit-exact with,
+# libvmaf.
+
+FrameScore = collections.namedtuple('FrameScore', ['frame', 'features', 'vmaf'])
+
+FEATURE_NAMES = ('adm2', 'motion2', 'vif_scale0', 'vif_scale1', 'vif_scale2', 'vif_scale3')
+
+VIF_SIGMA_NSQ = 2.0
+VIF_EPS = 1e-10
+VIF_GAIN_LIMIT = 100.0
+
+MOTION_FILTER = np.array([0.054488685, 0.244201342, 0.402619947, 0.244201342, 0.054488685])
+
+ADM_SCALES = 4
+ADM_BORDER_FACTOR = 0.1
+ADM_COS_1DEG_SQ = np.cos(np.deg2rad(1.0)) ** 2
+ADM_VIEW_DISTANCE = 3.0
+ADM_DISPLAY_HEIGHT = 1080
+DB2_LO = np.array([0.482962913144690, 0.836516303737469, 0.224143868041857, -0.129409522550921])
+DB2_HI = np.array([-0.129409522550921, -0.224143868041857, 0.836516303737469, -0.482962913144690])
+
+# Watson et al. DWT basis function amplitudes [scale][orientation] and the
+# luma threshold model (a, k, f0, g[orientation]) used for the CSF weights
+DWT_BASIS_AMPLITUDES = (
+    (0.62171, 0.67234, 0.72709, 0.67234),
+    (0.34537, 0.41317, 0.49428, 0.41317),
+    (0.18004, 0.22727, 0.28688, 0.22727),
+    (0.091401, 0.11792, 0.15214, 0.11792),
+)
+DWT_THRESHOLD_Y = (0.495, 0.466, 0.401, (1.501, 1.0, 0.534, 1.0))
+
+
+def _filter_2d(image, taps):
+    """Separable correlation with mirrored borders."""
+    return correlate1d(correlate1d(image, taps, axis=0, mode='mirror'), taps, axis=1, mode='mirror')
+
+
+def vif_filter(scale):
+    """Gaussian window of scale 0..3: 2^(4-scale)+1 taps, sigma = taps / 5."""
+    taps = (1 << (4 - scale)) + 1
+    x = np.arange(taps) - taps // 2
+    window = np.exp(-x * x / (2 * (taps / 5.0) ** 2))
+    return window / window.sum()
+
+
+def vif_features(reference, distorted):
+    """Returns the four vif_scale scores of one frame."""
+    ref = np.asarray(reference, dtype=np.float64)
+    dis = np.asarray(distorted, dtype=np.float64)
+    scores = []
+    for scale in range(4):
+        window = vif_filter(scale)
+        if scale > 0:
+            ref = _filter_2d(ref, window)[::2, ::2]
+            dis = _filter_2d(dis, window)[::2, ::2]
+        mu1 = _filter_2d(ref, window)
+        mu2 = _filter_2d(dis, window)
+        sigma1_sq = np.maximum(_filter_2d(ref * ref, window) - mu1 * mu1, 0.0)
+        sigma2_sq = np.maximum(_filter_2d(dis * dis, window) - mu2 * mu2, 0.0)
+        sigma12 = _filter_2d(ref * dis, window) - mu1 * mu2
+
+        g = sigma12 / (sigma1_sq + VIF_EPS)
+        sv_sq = sigma2_sq - g * sigma12
+        flat_ref = sigma1_sq < VIF_EPS
+        g = np.where(flat_ref, 0.0, g)
+        sv_sq = np.where(flat_ref, sigma2_sq, sv_sq)
+        sigma1_sq = np.where(flat_ref, 0.0, sigma1_sq)
+        flat_dis = sigma2_sq < VIF_EPS
+        g = np.where(flat_dis, 0.0, g)
+        sv_sq = np.where(flat_dis, 0.0, sv_sq)
+        negative = g < 0
+        sv_sq = np.where(negative, sigma2_sq, sv_sq)
+        g = np.where(negative, 0.0, g)
+        sv_sq = np.maximum(sv_sq, VIF_EPS)
+        g = np.minimum(g, VIF_GAIN_LIMIT)
+
+        num = np.log2(1.0 + g * g * sigma1_sq / (sv_sq + VIF_SIGMA_NSQ)).sum()
+        den = np.log2(1.0 + sigma1_sq / VIF_SIGMA_NSQ).sum()
+        scores.append(1.0 if den == 0 else num / den)
+    return scores
+
+
+def _dwt_1d(image, axis):
+    """One db2 analysis step along axis, output length ceil(n / 2)."""
+    n = image.shape[axis]
+    pad = [(0, 0)] * image.ndim
+    pad[axis] = (1, 3)
+    padded = np.pad(image, pad, mode='reflect')
+    half = (n + 1) // 2
+
+    def tap(k):
+        return np.take(padded, np.arange(half) * 2 + k, axis=axis)
+
+    taps = [tap(k) for k in range(4)]
+    lo = sum(DB2_LO[k] * taps[k] for k in range(4))
+    hi = sum(DB2_HI[k] * taps[k] for k in range(4))
+    return lo, hi
+
+
+def dwt2(image):
+    """Returns the db2 bands (a, h, v, d) of one decomposition level."""
+    lo, hi = _dwt_1d(image, axis=0)
+    a, v = _dwt_1d(lo, axis=1)
+    h, d = _dwt_1d(hi, axis=1)
+    return a, h, v, d
+
+
+def csf_weight(scale, orientation):
+    """Reciprocal of the Watson quantization step of one DWT band."""
+    a, k, f0, g = DWT_THRESHOLD_Y
+    r = ADM_VIEW_DISTANCE * ADM_DISPLAY_HEIGHT * np.pi / 180.0
+    temp = np.log10(2.0 ** (scale + 1) * f0 * g[orientation] / r)
+    step = 2.0 * a * 10.0 ** (k * temp * temp) / DWT_BASIS_AMPLITUDES[scale][orientation]
+    return 1.0 / step
+
+
+def _decouple(ref_bands, dis_bands):
+    """Splits the distorted detail bands into restored (detail loss) and additive parts."""
+    oh, ov, od = ref_bands
+    th, tv, td = dis_bands
+    ot_dp = oh * th + ov * tv
+    o_mag_sq = oh * oh + ov * ov
+    t_mag_sq = th * th + tv * tv
+    angle_flag = (ot_dp >= 0) & (ot_dp * ot_dp >= ADM_COS_1DEG_SQ * o_mag_sq * t_mag_sq)
+    restored = []
+    for o, t in zip(ref_bands, dis_bands):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = np.where(o == 0, 1.0, np.clip(t / o, 0.0, 1.0))
+        restored.append(np.where(angle_flag, t, k * o))
+    artifacts = [t - r for t, r in zip(dis_bands, restored)]
+    return restored, artifacts
+
+
+def _interior(band):
+    height, width = band.shape
+    top = max(int(height * ADM_BORDER_FACTOR - 0.5), 0)
+    left = max(int(width * ADM_BORDER_FACTOR - 0.5), 0)
+    return slice(top, height - top), slice(left, width - left)
+
+
+def _cube_root_pool(values, rows, cols):
+    area = (rows.stop - rows.start) * (cols.stop - cols.start)
+    return np.cbrt(np.sum(np.abs(values[rows, cols]) ** 3)) + np.cbrt(area / 32.0)
+
+
+def adm_features(reference, distorted):
+    """Returns the adm2 score of one frame (detail preserved / detail in the reference)."""
+    ref = np.asarray(reference, dtype=np.float64)
+    dis = np.asarray(distorted, dtype=np.float64)
+    mask_window = np.array([1.0, 1.0, 1.0])
+    num = 0.0
+    den = 0.0
+    for scale in range(ADM_SCALES):
+        ref, *ref_bands = dwt2(ref)
+        dis, *dis_bands = dwt2(dis)
+        restored, artifacts = _decouple(ref_bands, dis_bands)
+        # h and v share orientation 1, the diagonal band is orientation 2
+        weights = [csf_weight(scale, 1), csf_weight(scale, 1), csf_weight(scale, 2)]
+
+        # Contrast masking threshold from the 3x3 neighbourhood of all artifact bands
+        artifact_energy = sum(np.abs(a) * w for a, w in zip(artifacts, weights)) / 30.0
+        threshold = _filter_2d(artifact_energy, mask_window) + artifact_energy
+
+        rows, cols = _interior(ref_bands[0])
+        for r, o, w in zip(restored, ref_bands, weights):
+            masked = np.maximum(np.abs(r * w) - threshold, 0.0)
+            num += _cube_root_pool(masked, rows, cols)
+            den += _cube_root_pool(o * w, rows, cols)
+    return 1.0 if den == 0 else num / den
+
+
+def motion_blur(frame):
+    """Blurred frame used by the motion feature."""
+    return _filter_2d(np.asarray(frame, dtype=np.float64), MOTION_FILTER)
+
+
+def motion_difference(previous_reference, reference):
+    """Mean absolute difference of two blurred reference frames (0 for the first frame)."""
+    if previous_reference is None:
+        return 0.0
+    return float(np.mean(np.abs(motion_blur(reference) - motion_blur(previous_reference))))
+
+
+def frame_features(reference, distorted, previous_reference=None):
+    """Computes all features of one frame pair except the motion2 look-ahead."""
+    adm2 = adm_features(reference, distorted)
+    vif = vif_features(reference, distorted)
+    return {
+        'adm2': adm2,
+        'motion': motion_difference(previous_reference, reference),
+        'vif_scale0': vif[0],
+        'vif_scale1': vif[1],
+        'vif_scale2': vif[2],
+        'vif_scale3': vif[3],
+    }
+
+
+def _frame_features_task(args):
+    return frame_features(*args)
+
+
+class VMAFModel:
+    """libsvm nu-SVR model with linear feature rescaling, loaded from a libvmaf JSON model."""
+
+    def __init__(self, feature_names, slopes, intercepts, gamma, rho, coefficients, support_vectors,
+                 score_clip=(0.0, 100.0)):
+        self.feature_names = feature_names
+        self.slopes = np.asarray(slopes, dtype=np.float64)
+        self.intercepts = np.asarray(intercepts, dtype=np.float64)
+        self.gamma = gamma
+        self.rho = rho
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.support_vectors = np.asarray(support_vectors, dtype=np.float64)
+        self.score_clip = score_clip
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path) as file:
+            model_dict = json.load(file)['model_dict']
+        if model_dict.get('model_type') != 'LIBSVMNUSVR' or model_dict.get('norm_type') != 'linear_rescale':
+            raise ValueError("Only LIBSVMNUSVR models with linear_rescale normalization are supported")
+        # 'VMAF_feature_adm2_score' / 'VMAF_integer_feature_adm2_score' -> 'adm2'
+        feature_names = [re.sub(r'^.*feature_(.*)_score$', r'\1', name) for name in model_dict['feature_names']]
+        gamma, rho, coefficients, support_vectors = _parse_libsvm(model_dict['model'], len(feature_names))
+        return cls(feature_names, model_dict['slopes'], model_dict['intercepts'], gamma, rho,
+                   coefficients, support_vectors, tuple(model_dict.get('score_clip', (0.0, 100.0))))
+
+    def predict(self, features):
+        """features: (N, F) in feature_names order, or a list of feature dicts. Returns (N,) scores."""
+        if isinstance(features, (list, tuple)) and features and isinstance(features[0], dict):
+            features = [[f[name] for name in self.feature_names] for f in features]
+        x = np.atleast_2d(np.asarray(features, dtype=np.float64))
+        x = x * self.slopes[1:] + self.intercepts[1:]
+        distances = ((x[:, np.newaxis, :] - self.support_vectors[np.newaxis]) ** 2).sum(axis=-1)
+        y = np.exp(-self.gamma * distances) @ self.coefficients - self.rho
+        scores = (y - self.intercepts[0]) / self.slopes[0]
+        if self.score_clip:
+            scores = np.clip(scores, *self.score_clip)
+        return scores
+
+
+def _parse_libsvm(text, num_features):
+    lines = text.strip().splitlines()
+    header = {}
+    index = 0
+    while lines[index].strip() != 'SV':
+        key, _, value = lines[index].partition(' ')
+        header[key] = value
+        index += 1
+    if header.get('kernel_type') != 'rbf':
+        raise ValueError(f"Unsupported kernel {header.get('kernel_type')}")
+    coefficients = []
+    support_vectors = []
+    for line in lines[index + 1:]:
+        parts = line.split()
+        if not parts:
+            continue
+        coefficients.append(float(parts[0]))
+        vector = np.zeros(num_features)
+        for item in parts[1:]:
+            position, value = item.split(':')
+            vector[int(position) - 1] = float(value)
+        support_vectors.append(vector)
+    return float(header['gamma']), float(header['rho'].split()[0]), coefficients, support_vectors
+
+
+def _pyav_luma(frame):
+    """Y plane of a decoded PyAV frame as stored, and its bit depth."""
+    if frame.format.is_rgb:
+        frame = frame.reformat(format='gray')
+    plane = frame.planes[0]
+    bit_depth = frame.format.components[0].bits
+    dtype = np.dtype('<u2') if bit_depth > 8 else np.dtype(np.uint8)
+    rows = np.frombuffer(plane, dtype).reshape(plane.height, plane.line_size // dtype.itemsize)
+    return rows[:, :plane.width], bit_depth
+
+
+def read_luma_frames(path):
+    """Yields the decoded luma plane of every frame of a .y4m or compressed video, as float64 on the 8-bit scale."""
+    if os.path.splitext(path)[1].lower() == '.y4m':
+        frames = y4m_frames(path)
+        header = next(frames)
+        for frame in frames:
+            yield frame.y.astype(np.float64) / (1 << (header.bit_depth - 8))
+        return
+    try:
+        import av
+    except ImportError:
+        raise ImportError(f"Decoding {path} needs PyAV (pip install av, see README.txt); "
+                          "Y4M input works without it") from None
+    with av.open(path) as container:
+        for frame in container.decode(video=0):
+            luma, bit_depth = _pyav_luma(frame)
+            yield luma.astype(np.float64) / (1 << (bit_depth - 8))
+
+
+def _frame_pairs(reference_frames, distorted_frames):
+    previous = None
+    for reference, distorted in zip(reference_frames, distorted_frames):
+        yield reference, distorted, previous
+        previous = reference
+
+
+def compute_features(reference_frames, distorted_frames, workers=None):
+    """Per-frame feature dicts for two frame iterables, with motion2 resolved.
+
+    workers: None computes the frames in this process, otherwise the number of
+    worker processes. At most 2 * workers frame pairs are in flight, so long
+    videos are streamed instead of decoded up front.
+    """
+    pairs = _frame_pairs(reference_frames, distorted_frames)
+    if workers:
+        features = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque()
+            for pair in pairs:
+                pending.append(pool.submit(_frame_features_task, pair))
+                if len(pending) >= 2 * workers:
+                    features.append(pending.popleft().result())
+            features.extend(future.result() for future in pending)
+    else:
+        features = [_frame_features_task(pair) for pair in pairs]
+
+    # motion2 is the smaller of this frame's and the next frame's motion
+    for index, current in enumerate(features):
+        following = features[index + 1]['motion'] if index + 1 < len(features) else current['motion']
+        current['motion2'] = min(current['motion'], following)
+    return features
+
+
+def compute_vmaf(reference_path, distorted_path, model_path=None, workers=None):
+    """Scores two videos frame by frame. Without a model only the features are returned (vmaf=None)."""
+    features = compute_features(read_luma_frames(reference_path), read_luma_frames(distorted_path), workers)
+    scores = [None] * len(features)
+    if model_path is not None and features:
+        scores = VMAFModel.from_json(model_path).predict(features).tolist()
+    return [FrameScore(index, f, score) for index, (f, score) in enumerate(zip(features, scores))]
+
+
+if __name__ == "__main__":
+    import time
+
+    # Usage: python vmaf.py [path/to/vmaf_float_v0.6.1.json]
+    model_path = sys.argv[1] if len(sys.argv) > 1 else None
+    start = time.perf_counter()
+    frame_scores = compute_vmaf("original_video.mp4", "quantized_video.mp4", model_path, workers=4)
+    elapsed = time.perf_counter() - start
+
+    for frame_score in frame_scores:
+        features = ", ".join(f"{name} {frame_score.features[name]:.4f}" for name in FEATURE_NAMES)
+        vmaf_text = "" if frame_score.vmaf is None else f"  VMAF {frame_score.vmaf:.2f}"
+        print(f"frame {frame_score.frame:3d}: {features}{vmaf_text}")
+    if model_path is not None:
+        print(f"VMAF score: {np.mean([f.vmaf for f in frame_scores]):.6f}")
+    print(f"{len(frame_scores)} frames in {elapsed:.2f} s")
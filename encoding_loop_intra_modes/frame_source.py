@@ -0,0 +1,242 @@
+import collections
+import os
+import numpy as np
+
+# Streaming frame sources: IVF, Y4M and raw planar YUV.
+#
+# The scripts start from inline np.array blocks. Here a file is memory-mapped
+# once and every frame is handed out by a generator as NumPy views into the
+# map, so nothing is read until a plane is touched and a long sequence is
+# processed at constant memory (the OS pages frames in and out).
+#
+# IVF carries compressed AV1 frames: ivf_frames() yields each frame payload
+# together with its size and timestamp. Y4M and raw YUV carry pixels:
+# y4m_frames() and raw_yuv_frames() yield the Y, U and V planes of each frame
+# as (height, width) uint8 arrays, or uint16 for 10-bit content.
+
+IVFHeader = collections.namedtuple(
+    'IVFHeader', ['fourcc', 'width', 'height', 'timebase_den', 'timebase_num', 'num_frames', 'header_size'])
+IVFFrame = collections.namedtuple('IVFFrame', ['index', 'timestamp', 'offset', 'size', 'data'])
+Y4MHeader = collections.namedtuple(
+    'Y4MHeader', ['width', 'height', 'fps_num', 'fps_den', 'chroma', 'bit_depth', 'header_size'])
+YUVFrame = collections.namedtuple('YUVFrame', ['index', 'y', 'u', 'v'])
+
+IVF_SIGNATURE = b'DKIF'
+IVF_FRAME_HEADER_SIZE = 12
+Y4M_SIGNATURE = b'YUV4MPEG2 '
+Y4M_FRAME_TAG = b'FRAME'
+
+# Chroma subsampling (x shift, y shift) per layout, None for monochrome
+CHROMA_SUBSAMPLING = {'420': (1, 1), '422': (1, 0), '444': (0, 0), 'mono': None}
+
+_IVF_HEADER_DTYPE = np.dtype([
+    ('signature', 'S4'), ('version', '<u2'), ('header_size', '<u2'), ('fourcc', 'S4'),
+    ('width', '<u2'), ('height', '<u2'), ('timebase_den', '<u4'), ('timebase_num', '<u4'),
+    ('num_frames', '<u4'), ('unused', '<u4'),
+])
+_IVF_FRAME_HEADER_DTYPE = np.dtype([('size', '<u4'), ('timestamp', '<u8')])
+
+
+def _map_file(path):
+    return np.memmap(path, dtype=np.uint8, mode='r')
+
+
+def read_ivf_header(data):
+    """Parses the 32-byte IVF file header from a uint8 array."""
+    header = np.frombuffer(data[:_IVF_HEADER_DTYPE.itemsize].tobytes(), dtype=_IVF_HEADER_DTYPE)[0]
+    if header['signature'] != IVF_SIGNATURE:
+        raise ValueError("Not an IVF file (missing DKIF signature)")
+    return IVFHeader(
+        fourcc=header['fourcc'].decode('ascii'),
+        width=int(header['width']),
+        height=int(header['height']),
+        timebase_den=int(header['timebase_den']),
+        timebase_num=int(header['timebase_num']),
+        num_frames=int(header['num_frames']),
+        header_size=int(header['header_size']),
+    )
+
+
+def ivf_frames(path):
+    """Yields the header, then an IVFFrame per frame whose data is a view into the mapped file."""
+    data = _map_file(path)
+    header = read_ivf_header(data)
+    yield header
+    offset = header.header_size
+    index = 0
+    while offset + IVF_FRAME_HEADER_SIZE <= len(data):
+        frame_header = data[offset:offset + IVF_FRAME_HEADER_SIZE].view(_IVF_FRAME_HEADER_DTYPE)[0]
+        size = int(frame_header['size'])
+        start = offset + IVF_FRAME_HEADER_SIZE
+        if start + size > len(data):
+            raise ValueError(f"Truncated IVF frame {index}: {size} bytes at offset {start}")
+        yield IVFFrame(index, int(frame_header['timestamp']), start, size, data[start:start + size])
+        offset = start + size
+        index += 1
+
+
+def ivf_frame_sizes(path):
+    """Returns (header, sizes) with the compressed size of every frame as an array."""
+    frames = ivf_frames(path)
+    header = next(frames)
+    return header, np.array([frame.size for frame in frames], dtype=np.int64)
+
+
+def plane_shapes(width, height, chroma='420'):
+    """Returns the (height, width) of the luma and of each chroma plane (None for mono)."""
+    subsampling = CHROMA_SUBSAMPLING[chroma]
+    if subsampling is None:
+        return (height, width), None
+    sx, sy = subsampling
+    return (height, width), ((height + sy) >> sy, (width + sx) >> sx)
+
+
+def frame_size(width, height, chroma='420', bit_depth=8):
+    """Size of one raw planar frame in bytes."""
+    luma, chroma_shape = plane_shapes(width, height, chroma)
+    samples = luma[0] * luma[1]
+    if chroma_shape is not None:
+        samples += 2 * chroma_shape[0] * chroma_shape[1]
+    return samples * (2 if bit_depth > 8 else 1)
+
+
+def _plane_views(data, offset, width, height, chroma, bit_depth):
+    """Y, U, V views of one frame starting at offset (no copies)."""
+    dtype = np.dtype('<u2') if bit_depth > 8 else np.dtype(np.uint8)
+    luma, chroma_shape = plane_shapes(width, height, chroma)
+    planes = []
+    for shape in (luma, chroma_shape, chroma_shape):
+        if shape is None:
+            planes.append(None)
+            continue
+        size = shape[0] * shape[1] * dtype.itemsize
+        planes.append(data[offset:offset + size].view(dtype).reshape(shape))
+        offset += size
+    return planes
+
+
+def raw_yuv_frames(path, width, height, chroma='420', bit_depth=8, start=0, count=None):
+    """Yields YUVFrame views of a headerless planar YUV file (8-bit, or 10-bit little-endian words)."""
+    data = _map_file(path)
+    size = frame_size(width, height, chroma, bit_depth)
+    total = len(data) // size
+    stop = total if count is None else min(total, start + count)
+    for index in range(start, stop):
+        yield YUVFrame(index, *_plane_views(data, index * size, width, height, chroma, bit_depth))
+
+
+def _parse_y4m_chroma(tag):
+    """Maps a Y4M C tag (420jpeg, 420paldv, 420p10, 444, mono10, ...) to (layout, bit_depth)."""
+    if tag.startswith('mono'):
+        # mono, mono10, mono12, mono16 (no 'p' before the depth)
+        if tag[4:] and not tag[4:].isdigit():
+            raise ValueError(f"Unsupported Y4M colorspace {tag}")
+        return 'mono', int(tag[4:]) if tag[4:] else 8
+    layout, suffix = tag[:3], tag[3:]
+    # 444alpha carries a fourth plane, which the YUVFrame layout has no room for
+    if layout not in CHROMA_SUBSAMPLING or suffix == 'alpha':
+        raise ValueError(f"Unsupported Y4M colorspace {tag}")
+    # Only p<digits> is a bit depth; 420paldv, 420mpeg2, 420jpeg are 8-bit siting variants
+    if suffix[:1] == 'p' and suffix[1:].isdigit():
+        return layout, int(suffix[1:])
+    return layout, 8
+
+
+def _y4m_chroma_tag(chroma, bit_depth):
+    """Y4M C tag of a layout and bit depth, the inverse of _parse_y4m_chroma()."""
+    if chroma == 'mono':
+        return f'mono{bit_depth}' if bit_depth > 8 else 'mono'
+    if bit_depth > 8:
+        return f'{chroma}p{bit_depth}'
+    return '420jpeg' if chroma == '420' else chroma
+
+
+def read_y4m_header(data):
+    """Parses the Y4M stream header line from a uint8 array."""
+    end = int(np.argmax(data[:1024] == ord('\n')))
+    line = data[:end].tobytes()
+    if not line.startswith(Y4M_SIGNATURE):
+        raise ValueError("Not a Y4M file (missing YUV4MPEG2 signature)")
+    params = {token[:1]: token[1:] for token in line[len(Y4M_SIGNATURE):].decode('ascii').split()}
+    fps_num, fps_den = (int(v) for v in params.get('F', '30:1').split(':'))
+    chroma, bit_depth = _parse_y4m_chroma(params.get('C', '420jpeg'))
+    return Y4MHeader(int(params['W']), int(params['H']), fps_num, fps_den, chroma, bit_depth, end + 1)
+
+
+def y4m_frames(path):
+    """Yields the header, then a YUVFrame of plane views per frame."""
+    data = _map_file(path)
+    header = read_y4m_header(data)
+    yield header
+    size = frame_size(header.width, header.height, header.chroma, header.bit_depth)
+    offset = header.header_size
+    index = 0
+    while offset < len(data):
+        if data[offset:offset + len(Y4M_FRAME_TAG)].tobytes() != Y4M_FRAME_TAG:
+            raise ValueError(f"Missing FRAME tag at offset {offset}")
+        # Frame headers may carry parameters, skip to the end of the line
+        offset += int(np.argmax(data[offset:offset + 256] == ord('\n'))) + 1
+        if offset + size > len(data):
+            raise ValueError(f"Truncated Y4M frame {index}")
+        yield YUVFrame(index, *_plane_views(data, offset, header.width, header.height,
+                                            header.chroma, header.bit_depth))
+        offset += size
+        index += 1
+
+
+def write_y4m(path, frames, fps=(30, 1), chroma='420', bit_depth=8):
+    """Writes an iterable of (y, u, v) planes as Y4M, one frame at a time."""
+    frames = iter(frames)
+    first = next(frames)
+    height, width = first[0].shape
+    tag = _y4m_chroma_tag(chroma, bit_depth)
+    dtype = '<u2' if bit_depth > 8 else np.uint8
+    with open(path, 'wb') as file:
+        file.write(f"YUV4MPEG2 W{width} H{height} F{fps[0]}:{fps[1]} Ip A1:1 C{tag}\n".encode('ascii'))
+        for planes in (first, *frames):
+            file.write(Y4M_FRAME_TAG + b'\n')
+            for plane in planes:
+                if plane is not None:
+                    file.write(np.ascontiguousarray(plane, dtype=dtype).tobytes())
+
+
+def open_frames(path, width=None, height=None, chroma='420', bit_depth=8):
+    """Yields YUVFrame views of a .y4m or raw .yuv file (raw files need width and height)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.y4m':
+        frames = y4m_frames(path)
+        next(frames)
+        yield from frames
+    elif extension == '.ivf':
+        raise ValueError("IVF files hold compressed frames, use ivf_frames() to read them")
+    else:
+        if width is None or height is None:
+            raise ValueError("Raw YUV input needs width and height")
+        yield from raw_yuv_frames(path, width, height, chroma, bit_depth)
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    # IVF container of the AV1 clip in the repository root
+    ivf_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'img_Johnny_1280x720.ivf')
+    header, sizes = ivf_frame_sizes(ivf_path)
+    print(f"{header.fourcc} {header.width}x{header.height}, timebase {header.timebase_num}/{header.timebase_den}, "
+          f"{header.num_frames} frames")
+    print(f"Frame sizes: first {sizes[0]} bytes, mean {sizes.mean():.1f} bytes, total {sizes.sum()} bytes")
+
+    # Write a synthetic 10-bit 720p Y4M sequence and stream it back
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        y4m_path = os.path.join(directory, 'sequence.y4m')
+        luma_shape, chroma_shape = plane_shapes(1280, 720)
+        write_y4m(y4m_path, ((rng.integers(0, 1024, luma_shape), rng.integers(0, 1024, chroma_shape),
+                              rng.integers(0, 1024, chroma_shape)) for _ in range(30)), bit_depth=10)
+        start = time.perf_counter()
+        frames = y4m_frames(y4m_path)
+        print(next(frames))
+        mean_luma = [float(frame.y.mean()) for frame in frames]
+        elapsed = time.perf_counter() - start
+        print(f"Streamed {len(mean_luma)} frames in {elapsed * 1000:.1f} ms, mean luma {np.mean(mean_luma):.1f}")
+        del frames
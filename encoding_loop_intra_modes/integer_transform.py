@@ -0,0 +1,429 @@
+import numpy as np
+
+from adst_transform import TX_TYPES
+
+# Integer, bit-exact AV1 inverse transforms.
+#
+# The other scripts use floating point scipy dct/idct with norm='ortho'.
+# Real AV1 decoders use the integer butterfly network from the AV1 spec
+# (section 7.13.2) with 12-bit cosine constants (cos_bit = 12), Round2()
+# after every rotation and clamping of intermediate values. This module
+# implements that network for DCT4/8/16/32, ADST4/8/16 and the identity
+# transforms, plus the 2D inverse transform process (7.13.3) with the row
+# shift, rectangular scaling and clamping stages, so reconstructions match
+# libaom/dav1d.
+#
+# Every stage is applied to all rows (or columns) of all blocks at once:
+# T[i] holds coefficient i of every 1D vector in the batch. Values are kept
+# in int32; products use int64 only for bit depths above 8 where the
+# 12-bit constants could overflow 32 bits.
+
+COS_BIT = 12
+
+# Cos128_Lookup from the spec: round(4096 * cos(angle * pi / 128)), angle = 0..64
+COS128_LOOKUP = [
+    4096, 4095, 4091, 4085, 4076, 4065, 4052, 4036, 4017, 3996, 3973, 3948, 3920,
+    3889, 3857, 3822, 3784, 3745, 3703, 3659, 3612, 3564, 3513, 3461, 3406, 3349,
+    3290, 3229, 3166, 3102, 3035, 2967, 2896, 2824, 2751, 2675, 2598, 2520, 2440,
+    2359, 2276, 2191, 2106, 2019, 1931, 1842, 1751, 1660, 1567, 1474, 1380, 1285,
+    1189, 1092, 995, 897, 799, 700, 601, 501, 401, 301, 201, 101, 0
+]
+
+SINPI_1_9 = 1321
+SINPI_2_9 = 2482
+SINPI_3_9 = 3344
+SINPI_4_9 = 3803
+
+# Transform_Row_Shift from the spec, keyed by (width, height)
+TRANSFORM_ROW_SHIFT = {
+    (4, 4): 0, (8, 8): 1, (16, 16): 2, (32, 32): 2,
+    (4, 8): 0, (8, 4): 0, (8, 16): 1, (16, 8): 1,
+    (16, 32): 1, (32, 16): 1, (4, 16): 1, (16, 4): 1,
+    (8, 32): 2, (32, 8): 2,
+}
+
+SUPPORTED_SIZES = {'DCT': (4, 8, 16, 32), 'ADST': (4, 8, 16), 'FLIPADST': (4, 8, 16), 'IDTX': (4, 8, 16, 32)}
+
+
+def round2(x, n):
+    """Spec Round2(): rounds x / 2^n to nearest, works on integer NumPy arrays."""
+    if n == 0:
+        return x
+    return (x + (1 << (n - 1))) >> n
+
+
+def cos128(angle):
+    angle2 = angle & 255
+    if angle2 <= 64:
+        return COS128_LOOKUP[angle2]
+    if angle2 <= 128:
+        return -COS128_LOOKUP[128 - angle2]
+    if angle2 <= 192:
+        return -COS128_LOOKUP[angle2 - 128]
+    return COS128_LOOKUP[256 - angle2]
+
+
+def sin128(angle):
+    return cos128(angle - 64)
+
+
+def brev(num_bits, x):
+    """Reverses the lowest num_bits bits of x."""
+    result = 0
+    for i in range(num_bits):
+        bit = (x >> i) & 1
+        result += bit << (num_bits - 1 - i)
+    return result
+
+
+class _Butterflies:
+    """The B() and H() primitives of the spec acting on a batch T[i] of 1D vectors."""
+
+    def __init__(self, T, r, wide):
+        self.T = T
+        self.low = -(1 << (r - 1))
+        self.high = (1 << (r - 1)) - 1
+        self.mul_dtype = np.int64 if wide else np.int32
+
+    def B(self, a, b, angle, flip=0):
+        """Butterfly rotation, optionally followed by swapping T[a] and T[b]."""
+        T = self.T
+        ta = T[a].astype(self.mul_dtype)
+        tb = T[b].astype(self.mul_dtype)
+        x = ta * cos128(angle) - tb * sin128(angle)
+        y = ta * sin128(angle) + tb * cos128(angle)
+        x = round2(x, COS_BIT).astype(np.int32)
+        y = round2(y, COS_BIT).astype(np.int32)
+        if flip:
+            T[a], T[b] = y, x
+        else:
+            T[a], T[b] = x, y
+
+    def H(self, a, b, flip=0):
+        """Hadamard rotation with clamping to the intermediate range."""
+        if flip:
+            a, b = b, a
+        T = self.T
+        x, y = T[a], T[b]
+        T[a] = np.clip(x + y, self.low, self.high)
+        T[b] = np.clip(x - y, self.low, self.high)
+
+
+def _inverse_dct(T, n, bf):
+    """Inverse DCT process (spec 7.13.2.3) for 2^n points."""
+    B, H = bf.B, bf.H
+    copy = list(T)
+    for i in range(1 << n):
+        T[i] = copy[brev(n, i)]
+
+    if n == 6:
+        for i in range(16):
+            B(32 + i, 63 - i, 63 - 4 * brev(4, i))
+    if n >= 5:
+        for i in range(8):
+            B(16 + i, 31 - i, 6 + (brev(3, 7 - i) << 3))
+    if n == 6:
+        for i in range(16):
+            H(32 + i * 2, 33 + i * 2, i & 1)
+    if n >= 4:
+        for i in range(4):
+            B(8 + i, 15 - i, 12 + (brev(2, 3 - i) << 4))
+    if n >= 5:
+        for i in range(8):
+            H(16 + 2 * i, 17 + 2 * i, i & 1)
+    if n == 6:
+        for i in range(4):
+            for j in range(2):
+                B(62 - i * 4 - j, 33 + i * 4 + j, 60 - 16 * brev(2, i) + 64 * j, 1)
+    if n >= 3:
+        for i in range(2):
+            B(4 + i, 7 - i, 56 - 32 * i)
+    if n >= 4:
+        for i in range(4):
+            H(8 + 2 * i, 9 + 2 * i, i & 1)
+    if n >= 5:
+        for i in range(2):
+            for j in range(2):
+                B(30 - 4 * i - j, 17 + 4 * i + j, 24 + (j << 6) + ((1 - i) << 5), 1)
+    if n == 6:
+        for i in range(8):
+            for j in range(2):
+                H(32 + i * 4 + j, 35 + i * 4 - j, i & 1)
+    for i in range(2):
+        B(2 * i, 2 * i + 1, 32 + 16 * i, 1 - i)
+    if n >= 3:
+        for i in range(2):
+            H(4 + 2 * i, 5 + 2 * i, i)
+    if n >= 4:
+        for i in range(2):
+            B(14 - i, 9 + i, 48 + 64 * i, 1)
+    if n >= 5:
+        for i in range(4):
+            for j in range(2):
+                H(16 + 4 * i + j, 19 + 4 * i - j, i & 1)
+    if n == 6:
+        for i in range(2):
+            for j in range(4):
+                B(61 - i * 8 - j, 34 + i * 8 + j, 56 - i * 32 + (j >> 1) * 64, 1)
+    for i in range(2):
+        H(i, 3 - i)
+    if n >= 3:
+        B(6, 5, 32, 1)
+    if n >= 4:
+        for i in range(2):
+            for j in range(2):
+                H(8 + 4 * i + j, 11 + 4 * i - j, i)
+    if n >= 5:
+        for i in range(4):
+            B(29 - i, 18 + i, 48 + (i >> 1) * 64, 1)
+    if n == 6:
+        for i in range(4):
+            for j in range(4):
+                H(32 + 8 * i + j, 39 + 8 * i - j, i & 1)
+    if n >= 3:
+        for i in range(4):
+            H(i, 7 - i)
+    if n >= 4:
+        for i in range(2):
+            B(13 - i, 10 + i, 32, 1)
+    if n >= 5:
+        for i in range(2):
+            for j in range(4):
+                H(16 + i * 8 + j, 23 + i * 8 - j, i)
+    if n == 6:
+        for i in range(8):
+            B(59 - i, 36 + i, 48 if i < 4 else 112, 1)
+    if n >= 4:
+        for i in range(8):
+            H(i, 15 - i)
+    if n >= 5:
+        for i in range(4):
+            B(27 - i, 20 + i, 32, 1)
+    if n == 6:
+        for i in range(8):
+            H(32 + i, 47 - i)
+            H(48 + i, 63 - i, 1)
+    if n >= 5:
+        for i in range(16):
+            H(i, 31 - i)
+    if n == 6:
+        for i in range(8):
+            B(55 - i, 40 + i, 32, 1)
+    if n == 6:
+        for i in range(32):
+            H(i, 63 - i)
+
+
+def _inverse_adst4(T, bf):
+    """Inverse ADST4 process (spec 7.13.2.6)."""
+    dtype = bf.mul_dtype
+    t0, t1, t2, t3 = (T[i].astype(dtype) for i in range(4))
+    s0 = SINPI_1_9 * t0
+    s1 = SINPI_2_9 * t0
+    s2 = SINPI_3_9 * t1
+    s3 = SINPI_4_9 * t2
+    s4 = SINPI_1_9 * t2
+    s5 = SINPI_2_9 * t3
+    s6 = SINPI_4_9 * t3
+    b7 = t0 - t2 + t3
+    s0 = s0 + s3
+    s1 = s1 - s4
+    s3 = s2
+    s2 = SINPI_3_9 * b7
+    s0 = s0 + s5
+    s1 = s1 - s6
+    x0 = s0 + s3
+    x1 = s1 + s3
+    x2 = s2
+    x3 = s0 + s1 - s3
+    for i, x in enumerate((x0, x1, x2, x3)):
+        T[i] = round2(x, COS_BIT).astype(np.int32)
+
+
+def _adst_input_permutation(T, n):
+    n0 = 1 << n
+    copy = list(T)
+    for i in range(n0):
+        idx = i - 1 if i & 1 else n0 - i - 1
+        T[i] = copy[idx]
+
+
+def _adst_output_permutation(T, order):
+    copy = list(T)
+    for i, idx in enumerate(order):
+        T[i] = copy[idx] if i % 2 == 0 else -copy[idx]
+
+
+def _inverse_adst8(T, bf):
+    """Inverse ADST8 process (spec 7.13.2.7)."""
+    B, H = bf.B, bf.H
+    _adst_input_permutation(T, 3)
+    for i in range(4):
+        B(2 * i, 2 * i + 1, 60 - 16 * i, 1)
+    for i in range(4):
+        H(i, 4 + i)
+    for i in range(2):
+        B(4 + 3 * i, 5 + i, 48 - 32 * i, 1)
+    for i in range(2):
+        for j in range(2):
+            H(4 * j + i, 2 + 4 * j + i)
+    for i in range(2):
+        B(2 + 4 * i, 3 + 4 * i, 32, 1)
+    _adst_output_permutation(T, (0, 4, 6, 2, 3, 7, 5, 1))
+
+
+def _inverse_adst16(T, bf):
+    """Inverse ADST16 process (spec 7.13.2.8)."""
+    B, H = bf.B, bf.H
+    _adst_input_permutation(T, 4)
+    for i in range(8):
+        B(2 * i, 2 * i + 1, 62 - 8 * i, 1)
+    for i in range(8):
+        H(i, 8 + i)
+    for i in range(2):
+        B(8 + 2 * i, 9 + 2 * i, 56 - 32 * i, 1)
+        B(13 + 2 * i, 12 + 2 * i, 8 + 32 * i, 1)
+    for i in range(4):
+        for j in range(2):
+            H(8 * j + i, 4 + 8 * j + i)
+    for i in range(2):
+        for j in range(2):
+            B(4 + 8 * j + 3 * i, 5 + 8 * j + i, 48 - 32 * i, 1)
+    for i in range(2):
+        for j in range(4):
+            H(4 * j + i, 2 + 4 * j + i)
+    for i in range(4):
+        B(2 + 4 * i, 3 + 4 * i, 32, 1)
+    _adst_output_permutation(T, (0, 8, 12, 4, 6, 14, 10, 2, 3, 11, 15, 7, 5, 13, 9, 1))
+
+
+def _inverse_identity(T, n, bf):
+    """Inverse identity transform process (spec 7.13.2.15)."""
+    for i in range(1 << n):
+        t = T[i].astype(bf.mul_dtype)
+        if n == 2:
+            T[i] = round2(t * 5793, 12).astype(np.int32)
+        elif n == 3:
+            T[i] = T[i] * 2
+        elif n == 4:
+            T[i] = round2(t * 11586, 12).astype(np.int32)
+        else:
+            T[i] = T[i] * 4
+
+
+def inverse_transform_1d(vectors, kind, r, wide=False):
+    """Applies an integer inverse 1D transform along axis 0 of an int32 (n, M) array.
+
+    Column m of the array is one 1D vector. r is the intermediate clamping range in bits.
+    """
+    vectors = np.asarray(vectors, dtype=np.int32)
+    size = vectors.shape[0]
+    if size not in SUPPORTED_SIZES.get(kind, ()):
+        raise ValueError(f"No integer {kind} transform of size {size}")
+    n = size.bit_length() - 1
+    T = list(vectors)
+    bf = _Butterflies(T, r, wide)
+    if kind == 'DCT':
+        _inverse_dct(T, n, bf)
+    elif kind in ('ADST', 'FLIPADST'):
+        if n == 2:
+            _inverse_adst4(T, bf)
+        elif n == 3:
+            _inverse_adst8(T, bf)
+        else:
+            _inverse_adst16(T, bf)
+    else:
+        _inverse_identity(T, n, bf)
+    return np.stack(T)
+
+
+def inverse_transform_2d(coefficients, tx_type='DCT_DCT', bit_depth=8):
+    """2D inverse transform process (spec 7.13.3) for a (N, h, w) stack of dequantized coefficients.
+
+    Returns the int32 (N, h, w) residual, including the FLIPADST flips.
+    """
+    coefficients = np.asarray(coefficients, dtype=np.int32)
+    squeeze = coefficients.ndim == 2
+    if squeeze:
+        coefficients = coefficients[np.newaxis]
+    num_blocks, height, width = coefficients.shape
+    if (width, height) not in TRANSFORM_ROW_SHIFT:
+        raise ValueError(f"Unsupported transform size {width}x{height}")
+    col_kind, row_kind = TX_TYPES[tx_type]
+    log2w = width.bit_length() - 1
+    log2h = height.bit_length() - 1
+    row_shift = TRANSFORM_ROW_SHIFT[(width, height)]
+    col_shift = 4
+    row_clamp_range = bit_depth + 8
+    col_clamp_range = max(bit_depth + 6, 16)
+    wide = bit_depth > 8
+
+    # Row transforms: all rows of all blocks, laid out as (w, N*h)
+    T = np.ascontiguousarray(coefficients.reshape(-1, width).T)
+    if abs(log2w - log2h) == 1:
+        T = round2(T.astype(np.int64) * 2896, 12).astype(np.int32)
+    T = np.clip(T, -(1 << (row_clamp_range - 1)), (1 << (row_clamp_range - 1)) - 1)
+    T = inverse_transform_1d(T, row_kind, row_clamp_range, wide)
+    T = round2(T, row_shift)
+    T = np.clip(T, -(1 << (col_clamp_range - 1)), (1 << (col_clamp_range - 1)) - 1)
+
+    # Column transforms: (w, N, h) -> (h, N*w)
+    T = np.ascontiguousarray(T.reshape(width, num_blocks, height).transpose(2, 1, 0).reshape(height, -1))
+    T = inverse_transform_1d(T, col_kind, col_clamp_range, wide)
+    T = round2(T, col_shift)
+    residual = T.reshape(height, num_blocks, width).transpose(1, 0, 2)
+
+    if col_kind == 'FLIPADST':
+        residual = residual[:, ::-1, :]
+    if row_kind == 'FLIPADST':
+        residual = residual[:, :, ::-1]
+    residual = np.ascontiguousarray(residual)
+    return residual[0] if squeeze else residual
+
+
+def reconstruct(prediction, residual, bit_depth=8):
+    """Adds a residual to a prediction and clips to the pixel range (spec Clip1)."""
+    return np.clip(prediction.astype(np.int32) + residual, 0, (1 << bit_depth) - 1)
+
+
+def coefficient_scale(width, height):
+    """Factor between orthonormal float coefficients and AV1 integer coefficients.
+
+    round(ortho_coefficients * coefficient_scale(w, h)) gives coefficients that
+    inverse_transform_2d() maps back to (approximately) the same residual.
+    """
+    shift = TRANSFORM_ROW_SHIFT[(width, height)] + 4
+    scale = (1 << shift) / np.sqrt(width * height / 4.0)
+    if abs((width.bit_length() - 1) - (height.bit_length() - 1)) == 1:
+        scale *= np.sqrt(2.0)
+    return scale
+
+
+if __name__ == "__main__":
+    from block_transform import dct2_blocks, idct2_blocks
+
+    # Residual block (smooth gradient) as used in the RDO script
+    residual_block = np.array([
+        [0, 50, 100, 150],
+        [50, 100, 150, 200],
+        [100, 150, 200, 250],
+        [150, 200, 250, 300],
+    ]) - 150
+
+    av1_coefficients = np.round(dct2_blocks(residual_block) * coefficient_scale(4, 4)).astype(np.int32)
+    integer_residual = inverse_transform_2d(av1_coefficients, 'DCT_DCT')
+    float_residual = idct2_blocks(av1_coefficients / coefficient_scale(4, 4))
+
+    print("AV1 integer coefficients:")
+    print(av1_coefficients)
+    print("\nInteger inverse transform:")
+    print(integer_residual)
+    print("\nFloat inverse transform:")
+    print(np.round(float_residual, 2))
+
+    # Batch of 32x32 blocks with random coefficients
+    rng = np.random.default_rng(0)
+    coefficients = rng.integers(-512, 512, size=(900, 32, 32)).astype(np.int32)
+    residual = inverse_transform_2d(coefficients, 'DCT_DCT')
+    reference = idct2_blocks(coefficients / coefficient_scale(32, 32))
+    print(f"\n32x32 batch: max |integer - float| = {np.abs(residual - reference).max():.2f}")
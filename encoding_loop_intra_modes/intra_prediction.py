@@ -0,0 +1,411 @@
+import collections
+import numpy as np
+
+# AV1 intra predictors operating on batches of blocks.
+#
+# The scripts predict a block with np.full_like(original_block,
+# np.mean(original_block)), which uses the block's own pixels and could never
+# be decoded. Real AV1 intra prediction (spec section 7.11.2) only looks at
+# the reconstructed row above and column to the left of the block. Here the
+# edges of many blocks are gathered from the reconstructed frame at once and
+# every predictor (DC, V, H, the directional modes with angle delta, SMOOTH,
+# SMOOTH_V, SMOOTH_H, PAETH and chroma-from-luma) produces an (N, h, w)
+# stack of predictions with NumPy, following the spec's integer rounding.
+#
+# Edges are stored with the top-left pixel first:
+#   above[:, 0] = AboveRow[-1], above[:, 1 + k] = AboveRow[k], k = 0..w+h-1
+#   left[:, 0]  = LeftCol[-1],  left[:, 1 + k]  = LeftCol[k],  k = 0..w+h-1
+
+DC_PRED = 0
+V_PRED = 1
+H_PRED = 2
+D45_PRED = 3
+D135_PRED = 4
+D113_PRED = 5
+D157_PRED = 6
+D203_PRED = 7
+D67_PRED = 8
+SMOOTH_PRED = 9
+SMOOTH_V_PRED = 10
+SMOOTH_H_PRED = 11
+PAETH_PRED = 12
+UV_CFL_PRED = 13
+
+MODE_NAMES = {
+    DC_PRED: 'DC_PRED', V_PRED: 'V_PRED', H_PRED: 'H_PRED', D45_PRED: 'D45_PRED',
+    D135_PRED: 'D135_PRED', D113_PRED: 'D113_PRED', D157_PRED: 'D157_PRED',
+    D203_PRED: 'D203_PRED', D67_PRED: 'D67_PRED', SMOOTH_PRED: 'SMOOTH_PRED',
+    SMOOTH_V_PRED: 'SMOOTH_V_PRED', SMOOTH_H_PRED: 'SMOOTH_H_PRED',
+    PAETH_PRED: 'PAETH_PRED', UV_CFL_PRED: 'UV_CFL_PRED',
+}
+
+MODE_TO_ANGLE = {
+    V_PRED: 90, H_PRED: 180, D45_PRED: 45, D135_PRED: 135,
+    D113_PRED: 113, D157_PRED: 157, D203_PRED: 203, D67_PRED: 67,
+}
+DIRECTIONAL_MODES = tuple(MODE_TO_ANGLE)
+NON_DIRECTIONAL_MODES = (DC_PRED, SMOOTH_PRED, SMOOTH_V_PRED, SMOOTH_H_PRED, PAETH_PRED)
+
+ANGLE_STEP = 3
+MAX_ANGLE_DELTA = 3
+
+# Dr_Intra_Derivative, only the angles reachable by mode angle +- 3 * delta are defined
+DR_INTRA_DERIVATIVE = {
+    3: 1023, 6: 547, 9: 372, 14: 273, 17: 215, 20: 178, 23: 151, 26: 132, 29: 116,
+    32: 102, 36: 90, 39: 80, 42: 71, 45: 64, 48: 57, 51: 51, 54: 45, 58: 40, 61: 35,
+    64: 31, 67: 27, 70: 23, 73: 19, 76: 15, 81: 11, 84: 7, 87: 3,
+}
+
+# Sm_Weights_Tx_* from the spec
+SM_WEIGHTS = {
+    4: [255, 149, 85, 64],
+    8: [255, 197, 146, 105, 73, 50, 37, 32],
+    16: [255, 225, 196, 170, 145, 123, 102, 84, 68, 54, 43, 33, 26, 20, 17, 16],
+    32: [255, 240, 225, 210, 196, 182, 169, 157, 145, 133, 122, 111, 101, 92, 83, 74,
+         66, 59, 52, 45, 39, 34, 29, 25, 21, 17, 14, 12, 10, 9, 8, 8],
+    64: [255, 248, 240, 233, 225, 218, 210, 203, 196, 189, 182, 176, 169, 163, 156, 150,
+         144, 138, 133, 127, 121, 116, 111, 106, 101, 96, 91, 86, 82, 77, 73, 69,
+         65, 61, 57, 54, 50, 47, 44, 41, 38, 35, 32, 29, 27, 25, 22, 20,
+         18, 16, 15, 13, 12, 10, 9, 8, 7, 6, 6, 5, 5, 4, 4, 4],
+}
+
+INTRA_EDGE_KERNEL = np.array([
+    [0, 4, 8, 4, 0],
+    [0, 5, 6, 5, 0],
+    [2, 4, 4, 4, 2],
+])
+
+IntraEdges = collections.namedtuple('IntraEdges', ['above', 'left', 'have_above', 'have_left'])
+
+
+def _round2(x, n):
+    return (x + (1 << (n - 1))) >> n
+
+
+def gather_edges(frame, ys, xs, width, height, bit_depth=8, have_above_right=None, have_below_left=None):
+    """Builds the AboveRow/LeftCol edges of N blocks from the reconstructed frame (spec 7.11.2).
+
+    ys, xs: (N,) top-left pixel positions of the blocks, all of size width x height.
+    have_above_right / have_below_left: (N,) bool arrays telling whether those
+    pixels are already reconstructed. By default above-right is used when it
+    lies inside the frame and below-left is not (raster/wavefront order).
+    """
+    frame = np.asarray(frame)
+    frame_h, frame_w = frame.shape
+    ys = np.asarray(ys)
+    xs = np.asarray(xs)
+    have_above = ys > 0
+    have_left = xs > 0
+    if have_above_right is None:
+        have_above_right = have_above & (xs + width < frame_w)
+    if have_below_left is None:
+        have_below_left = np.zeros_like(have_left)
+    base = 1 << (bit_depth - 1)
+    k = np.arange(width + height)
+
+    above_cols = xs[:, None] + k[None, :]
+    above_cols = np.where((k[None, :] >= width) & ~have_above_right[:, None], xs[:, None] + width - 1, above_cols)
+    above = frame[np.maximum(ys - 1, 0)[:, None], np.minimum(above_cols, frame_w - 1)].astype(np.int32)
+
+    left_rows = ys[:, None] + k[None, :]
+    left_rows = np.where((k[None, :] >= height) & ~have_below_left[:, None], ys[:, None] + height - 1, left_rows)
+    left = frame[np.minimum(left_rows, frame_h - 1), np.maximum(xs - 1, 0)[:, None]].astype(np.int32)
+
+    pixel_left = frame[ys, np.maximum(xs - 1, 0)].astype(np.int32)
+    pixel_above = frame[np.maximum(ys - 1, 0), xs].astype(np.int32)
+    pixel_top_left = frame[np.maximum(ys - 1, 0), np.maximum(xs - 1, 0)].astype(np.int32)
+
+    above = np.where(have_above[:, None], above,
+                     np.where(have_left, pixel_left, base - 1)[:, None])
+    left = np.where(have_left[:, None], left,
+                    np.where(have_above, pixel_above, base + 1)[:, None])
+    top_left = np.where(have_above & have_left, pixel_top_left,
+                        np.where(have_above, pixel_above,
+                                 np.where(have_left, pixel_left, base)))
+    return IntraEdges(
+        above=np.concatenate([top_left[:, None], above], axis=1),
+        left=np.concatenate([top_left[:, None], left], axis=1),
+        have_above=have_above,
+        have_left=have_left,
+    )
+
+
+def _above(edges, width):
+    return edges.above[:, 1:width + 1]
+
+
+def _left(edges, height):
+    return edges.left[:, 1:height + 1]
+
+
+def dc_predict(edges, width, height, bit_depth=8):
+    above = _above(edges, width).astype(np.int64)
+    left = _left(edges, height).astype(np.int64)
+    sum_above = above.sum(axis=1)
+    sum_left = left.sum(axis=1)
+    both = (sum_above + sum_left + ((width + height) >> 1)) // (width + height)
+    only_above = (sum_above + (width >> 1)) >> (width.bit_length() - 1)
+    only_left = (sum_left + (height >> 1)) >> (height.bit_length() - 1)
+    ha, hl = edges.have_above, edges.have_left
+    dc = np.where(ha & hl, both, np.where(ha, only_above, np.where(hl, only_left, 1 << (bit_depth - 1))))
+    return np.broadcast_to(dc[:, None, None], (len(dc), height, width)).astype(np.int32)
+
+
+def smooth_predict(edges, width, height, mode=SMOOTH_PRED):
+    above = _above(edges, width)[:, None, :]
+    left = _left(edges, height)[:, :, None]
+    below_pred = edges.left[:, height][:, None, None]   # LeftCol[h - 1]
+    right_pred = edges.above[:, width][:, None, None]   # AboveRow[w - 1]
+    weights_y = np.array(SM_WEIGHTS[height]).reshape(1, -1, 1)
+    weights_x = np.array(SM_WEIGHTS[width]).reshape(1, 1, -1)
+    if mode == SMOOTH_PRED:
+        total = (weights_y * above + (256 - weights_y) * below_pred
+                 + weights_x * left + (256 - weights_x) * right_pred)
+        return _round2(total, 9).astype(np.int32)
+    if mode == SMOOTH_V_PRED:
+        return _round2(weights_y * above + (256 - weights_y) * below_pred, 8).astype(np.int32)
+    return _round2(weights_x * left + (256 - weights_x) * right_pred, 8).astype(np.int32)
+
+
+def paeth_predict(edges, width, height):
+    above = _above(edges, width)[:, None, :]
+    left = _left(edges, height)[:, :, None]
+    top_left = edges.above[:, 0][:, None, None]
+    base = above + left - top_left
+    p_left = np.abs(base - left)
+    p_top = np.abs(base - above)
+    p_top_left = np.abs(base - top_left)
+    return np.where((p_left <= p_top) & (p_left <= p_top_left), left,
+                    np.where(p_top <= p_top_left, above, top_left)).astype(np.int32)
+
+
+def _filter_strength(width, height, filter_type, delta):
+    """Intra edge filter strength selection (spec 7.11.2.9)."""
+    d = abs(delta)
+    blk_wh = width + height
+    strength = 0
+    if filter_type == 0:
+        if blk_wh <= 8:
+            strength = 1 if d >= 56 else 0
+        elif blk_wh <= 16:
+            strength = 1 if d >= 40 else 0
+        elif blk_wh <= 24:
+            strength = 3 if d >= 32 else 2 if d >= 16 else 1 if d >= 8 else 0
+        elif blk_wh <= 32:
+            strength = 3 if d >= 32 else 2 if d >= 4 else 1 if d >= 1 else 0
+        else:
+            strength = 3 if d >= 1 else 0
+    else:
+        if blk_wh <= 8:
+            strength = 2 if d >= 64 else 1 if d >= 40 else 0
+        elif blk_wh <= 16:
+            strength = 2 if d >= 48 else 1 if d >= 20 else 0
+        elif blk_wh <= 24:
+            strength = 3 if d >= 4 else 0
+        else:
+            strength = 3 if d >= 1 else 0
+    return strength
+
+
+def _use_upsample(width, height, filter_type, delta):
+    """Intra edge upsample selection (spec 7.11.2.10)."""
+    d = abs(delta)
+    if d <= 0 or d >= 40:
+        return 0
+    return int(width + height <= (16 if filter_type == 0 else 8))
+
+
+def _edge_filter(buffer, size, strength):
+    """Intra edge filter process (spec 7.11.2.12) on buffer columns 0..size-1 (index -1..size-2)."""
+    if strength == 0:
+        return buffer
+    i = np.arange(1, size)
+    taps = np.clip(i[:, None] - 2 + np.arange(5)[None, :], 0, size - 1)
+    edge = buffer[:, :size]
+    filtered = (edge[:, taps] * INTRA_EDGE_KERNEL[strength - 1]).sum(axis=2)
+    result = buffer.copy()
+    result[:, 1:size] = (filtered + 8) >> 4
+    return result
+
+
+def _upsample(buffer, num_px, bit_depth):
+    """Intra edge upsample process (spec 7.11.2.11). Input offset 1, output offset 2."""
+    dup = np.concatenate([buffer[:, :1], buffer[:, :num_px + 1], buffer[:, num_px:num_px + 1]], axis=1)
+    i = np.arange(num_px)
+    s = -dup[:, i] + 9 * dup[:, i + 1] + 9 * dup[:, i + 2] - dup[:, i + 3]
+    s = np.clip((s + 8) >> 4, 0, (1 << bit_depth) - 1)
+    result = np.empty((buffer.shape[0], 2 * num_px + 1), dtype=buffer.dtype)
+    result[:, 0] = dup[:, 0]            # index -2
+    result[:, 2 * i + 1] = s            # index 2i - 1
+    result[:, 2 * i + 2] = dup[:, i + 2]  # index 2i
+    return result
+
+
+def _interpolate(buffer, offset, base, shift):
+    """Round2(buf[base] * (32 - shift) + buf[base + 1] * shift, 5) for (h, w) base/shift arrays."""
+    last = buffer.shape[1] - 1
+    b0 = np.clip(base + offset, 0, last)
+    b1 = np.clip(base + offset + 1, 0, last)
+    return _round2(buffer[:, b0] * (32 - shift) + buffer[:, b1] * shift, 5)
+
+
+def directional_predict(edges, width, height, p_angle, bit_depth=8, edge_filter=True, filter_type=0):
+    """Directional intra prediction process (spec 7.11.2.4) for prediction angle p_angle.
+
+    filter_type is 1 when a neighbouring block uses a smooth mode (spec get_filter_type()).
+    """
+    above = edges.above.astype(np.int32)
+    left = edges.left.astype(np.int32)
+    above_offset = left_offset = 1
+    upsample_above = upsample_left = 0
+    ha = edges.have_above[:, None]
+    hl = edges.have_left[:, None]
+
+    if edge_filter:
+        if p_angle != 90 and p_angle != 180:
+            if 90 < p_angle < 180 and width + height >= 24:
+                corner = _round2(left[:, 1] * 5 + above[:, 0] * 6 + above[:, 1] * 5, 4)
+                above = above.copy()
+                left = left.copy()
+                above[:, 0] = corner
+                left[:, 0] = corner
+            strength = _filter_strength(width, height, filter_type, p_angle - 90)
+            num_px = width + (height if p_angle < 90 else 0) + 1
+            above = np.where(ha, _edge_filter(above, num_px, strength), above)
+            strength = _filter_strength(width, height, filter_type, p_angle - 180)
+            num_px = height + (width if p_angle > 180 else 0) + 1
+            left = np.where(hl, _edge_filter(left, num_px, strength), left)
+        upsample_above = _use_upsample(width, height, filter_type, p_angle - 90)
+        if upsample_above:
+            above = _upsample(above, width + (height if p_angle < 90 else 0), bit_depth)
+            above_offset = 2
+        upsample_left = _use_upsample(width, height, filter_type, p_angle - 180)
+        if upsample_left:
+            left = _upsample(left, height + (width if p_angle > 180 else 0), bit_depth)
+            left_offset = 2
+
+    i = np.arange(height).reshape(-1, 1)
+    j = np.arange(width).reshape(1, -1)
+    if p_angle == 90:
+        prediction = np.broadcast_to(above[:, None, above_offset:above_offset + width], (len(above), height, width))
+    elif p_angle == 180:
+        prediction = np.broadcast_to(left[:, left_offset:left_offset + height, None], (len(left), height, width))
+    elif p_angle < 90:
+        dx = DR_INTRA_DERIVATIVE[p_angle]
+        idx = (i + 1) * dx
+        base = (idx >> (6 - upsample_above)) + (j << upsample_above)
+        shift = ((idx << upsample_above) >> 1) & 0x1F
+        max_base_x = (width + height - 1) << upsample_above
+        prediction = np.where(base < max_base_x, _interpolate(above, above_offset, base, shift),
+                              above[:, max_base_x + above_offset][:, None, None])
+    elif p_angle < 180:
+        dx = DR_INTRA_DERIVATIVE[180 - p_angle]
+        dy = DR_INTRA_DERIVATIVE[p_angle - 90]
+        idx_x = (j << 6) - (i + 1) * dx
+        base_x = idx_x >> (6 - upsample_above)
+        shift_x = ((idx_x << upsample_above) >> 1) & 0x1F
+        idx_y = (i << 6) - (j + 1) * dy
+        base_y = idx_y >> (6 - upsample_left)
+        shift_y = ((idx_y << upsample_left) >> 1) & 0x1F
+        prediction = np.where(base_x >= -(1 << upsample_above),
+                              _interpolate(above, above_offset, base_x, shift_x),
+                              _interpolate(left, left_offset, base_y, shift_y))
+    else:
+        dy = DR_INTRA_DERIVATIVE[270 - p_angle]
+        idx = (j + 1) * dy
+        base = (idx >> (6 - upsample_left)) + (i << upsample_left)
+        shift = ((idx << upsample_left) >> 1) & 0x1F
+        max_base_y = (width + height - 1) << upsample_left
+        prediction = np.where(base < max_base_y, _interpolate(left, left_offset, base, shift),
+                              left[:, max_base_y + left_offset][:, None, None])
+    return np.ascontiguousarray(prediction, dtype=np.int32)
+
+
+def cfl_predict(dc_prediction, luma, alpha, subsampling=(1, 1), bit_depth=8):
+    """Chroma-from-luma prediction (spec 7.11.5).
+
+    dc_prediction: (N, h, w) DC prediction of the chroma blocks.
+    luma: (N, h << sub_y, w << sub_x) reconstructed co-located luma.
+    alpha: CflAlpha in 1/8 units (-16..16), scalar or (N,).
+    subsampling: (sub_x, sub_y), (1, 1) for 4:2:0.
+    """
+    sub_x, sub_y = subsampling
+    luma = np.asarray(luma, dtype=np.int32)
+    num_blocks, height, width = dc_prediction.shape
+    summed = luma.reshape(num_blocks, height, 1 + sub_y, width, 1 + sub_x).sum(axis=(2, 4))
+    scaled = summed << (3 - sub_x - sub_y)
+    shift = (width.bit_length() - 1) + (height.bit_length() - 1)
+    average = _round2(scaled.sum(axis=(1, 2), dtype=np.int64), shift)[:, None, None]
+    ac = np.asarray(alpha).reshape(-1, 1, 1) * (scaled - average)
+    scaled_luma = np.where(ac >= 0, _round2(ac, 6), -_round2(-ac, 6))
+    return np.clip(dc_prediction + scaled_luma, 0, (1 << bit_depth) - 1).astype(np.int32)
+
+
+def predict(mode, edges, width, height, angle_delta=0, bit_depth=8, edge_filter=True, filter_type=0):
+    """Predicts all N blocks of the edge batch with one luma/chroma intra mode."""
+    if mode == DC_PRED:
+        return dc_predict(edges, width, height, bit_depth)
+    if mode in MODE_TO_ANGLE:
+        p_angle = MODE_TO_ANGLE[mode] + angle_delta * ANGLE_STEP
+        return directional_predict(edges, width, height, p_angle, bit_depth, edge_filter, filter_type)
+    if mode in (SMOOTH_PRED, SMOOTH_V_PRED, SMOOTH_H_PRED):
+        return smooth_predict(edges, width, height, mode)
+    if mode == PAETH_PRED:
+        return paeth_predict(edges, width, height)
+    raise ValueError(f"Mode {MODE_NAMES.get(mode, mode)} needs a dedicated call (use cfl_predict for UV_CFL_PRED)")
+
+
+def intra_candidates(angle_deltas=(0,)):
+    """Lists the (mode, angle_delta) candidates of a mode search."""
+    candidates = [(mode, 0) for mode in NON_DIRECTIONAL_MODES]
+    for mode in DIRECTIONAL_MODES:
+        candidates.extend((mode, delta) for delta in angle_deltas)
+    return candidates
+
+
+def predict_all_modes(edges, width, height, candidates=None, bit_depth=8, edge_filter=True, filter_type=0):
+    """Returns (P, N, h, w) predictions for every (mode, angle_delta) candidate.
+
+    AV1 only signals angle deltas for blocks of at least 8x8.
+    """
+    if candidates is None:
+        candidates = intra_candidates(range(-MAX_ANGLE_DELTA, MAX_ANGLE_DELTA + 1)
+                                      if min(width, height) >= 8 else (0,))
+    return np.stack([predict(mode, edges, width, height, delta, bit_depth, edge_filter, filter_type)
+                     for mode, delta in candidates])
+
+
+if __name__ == "__main__":
+    import time
+
+    # Original block from script 8 placed in a small frame with reconstructed neighbours
+    original_block = np.array([
+        [0,  64, 128, 192],
+        [64, 85, 149, 213],
+        [128, 149, 170, 234],
+        [192, 213, 234, 255]
+    ])
+    frame = np.zeros((8, 12), dtype=np.int32)
+    frame[:4, :] = np.linspace(0, 255, 12).astype(np.int32)
+    frame[4:, :4] = np.linspace(64, 255, 4).astype(np.int32)[:, None]
+    frame[4:8, 4:8] = original_block
+
+    edges = gather_edges(frame, np.array([4]), np.array([4]), 4, 4)
+    print("AboveRow[-1..7]:", edges.above[0])
+    print("LeftCol[-1..7]: ", edges.left[0])
+    for mode, delta in intra_candidates():
+        prediction = predict(mode, edges, 4, 4, delta)[0]
+        sad = np.abs(prediction - original_block).sum()
+        print(f"\n{MODE_NAMES[mode]} (SAD {sad}):")
+        print(prediction)
+
+    # One wavefront worth of 8x8 blocks from a 720p frame, all modes and angle deltas
+    rng = np.random.default_rng(0)
+    reconstructed = rng.integers(0, 256, size=(720, 1280))
+    ys = np.arange(0, 720, 8)
+    xs = (np.arange(len(ys)) * 8)
+    edges = gather_edges(reconstructed, ys, xs, 8, 8)
+    start = time.perf_counter()
+    predictions = predict_all_modes(edges, 8, 8)
+    elapsed = time.perf_counter() - start
+    print(f"\n{predictions.shape[1]} blocks x {predictions.shape[0]} candidates in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,192 @@
+import collections
+import numpy as np
+
+from block_transform import frame_to_blocks
+
+# Batched quality metrics: MSE, PSNR, SSIM and MS-SSIM.
+#
+# Script 8 and new_o_pb_rb_DCT_tb_LOW_qb_iqb_itb_r_mse_psnr_ssim.py call the
+# skimage metrics once per 4x4 block, and the Huffman scripts recompute PSNR
+# by hand. Here every metric works on whole stacks: the last two axes are the
+# image or block, any leading axes (blocks of a frame, RDO candidates, ...)
+# are computed in the same pass.
+#
+# The SSIM windows are box windows whose sums come from integral images, so
+# each window statistic costs four lookups whatever the window size. With the
+# defaults (box window, sample covariance, K1=0.01, K2=0.03) the values equal
+# skimage's structural_similarity(). uint8/uint16 input is never converted to
+# a float64 image: differences, squares and integral images stay in exact
+# int64 and only the window means/variances are floating point.
+
+BlockMetrics = collections.namedtuple('BlockMetrics', ['mse', 'psnr', 'ssim'])
+
+MS_SSIM_WEIGHTS = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333)
+
+
+def _difference(original, reconstructed):
+    original = np.asarray(original)
+    reconstructed = np.asarray(reconstructed)
+    if original.dtype.kind in 'ui' and reconstructed.dtype.kind in 'ui':
+        return original.astype(np.int64) - reconstructed.astype(np.int64)
+    return original.astype(np.float64) - reconstructed.astype(np.float64)
+
+
+def _data_range(data_range, bit_depth):
+    return (1 << bit_depth) - 1 if data_range is None else data_range
+
+
+def mse(original, reconstructed):
+    """Mean squared error over the last two axes."""
+    difference = _difference(original, reconstructed)
+    return (difference * difference).sum(axis=(-2, -1)) / (difference.shape[-2] * difference.shape[-1])
+
+
+def psnr(original, reconstructed, data_range=None, bit_depth=8):
+    """PSNR in dB over the last two axes (inf where the images are identical)."""
+    return mse_to_psnr(mse(original, reconstructed), _data_range(data_range, bit_depth))
+
+
+def mse_to_psnr(mse_values, data_range=255):
+    mse_values = np.asarray(mse_values, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        return 10 * np.log10(np.square(data_range, dtype=np.float64) / mse_values)
+
+
+def _integral_image(x):
+    dtype = np.int64 if x.dtype.kind in 'uib' else np.float64
+    integral = np.cumsum(np.cumsum(x, axis=-2, dtype=dtype), axis=-1)
+    pad = [(0, 0)] * (x.ndim - 2) + [(1, 0), (1, 0)]
+    return np.pad(integral, pad)
+
+
+def window_sums(x, win_size):
+    """Sums over every win_size x win_size window fully inside the last two axes."""
+    c = _integral_image(x)
+    w = win_size
+    return c[..., w:, w:] - c[..., :-w, w:] - c[..., w:, :-w] + c[..., :-w, :-w]
+
+
+def ssim_map(original, reconstructed, win_size=7, data_range=None, bit_depth=8, k1=0.01, k2=0.03):
+    """Returns (ssim, contrast_structure) maps, one value per window position."""
+    x = np.asarray(original)
+    y = np.asarray(reconstructed)
+    if x.dtype.kind in 'ui':
+        x = x.astype(np.int64)
+        y = y.astype(np.int64)
+    n = win_size * win_size
+    sx = window_sums(x, win_size)
+    sy = window_sums(y, win_size)
+    sxx = window_sums(x * x, win_size)
+    syy = window_sums(y * y, win_size)
+    sxy = window_sums(x * y, win_size)
+
+    ux = sx / n
+    uy = sy / n
+    cov_norm = n / (n - 1)
+    vx = cov_norm * (sxx / n - ux * ux)
+    vy = cov_norm * (syy / n - uy * uy)
+    vxy = cov_norm * (sxy / n - ux * uy)
+
+    data_range = np.asarray(_data_range(data_range, bit_depth), dtype=np.float64)
+    if data_range.ndim:
+        data_range = data_range[..., np.newaxis, np.newaxis]
+    c1 = (k1 * data_range) ** 2
+    c2 = (k2 * data_range) ** 2
+    contrast_structure = (2 * vxy + c2) / (vx + vy + c2)
+    luminance = (2 * ux * uy + c1) / (ux * ux + uy * uy + c1)
+    return luminance * contrast_structure, contrast_structure
+
+
+def ssim(original, reconstructed, win_size=7, data_range=None, bit_depth=8):
+    """Mean SSIM over the last two axes, same as skimage structural_similarity() on each image."""
+    return ssim_map(original, reconstructed, win_size, data_range, bit_depth)[0].mean(axis=(-2, -1))
+
+
+def _downsample(x):
+    height, width = x.shape[-2] // 2 * 2, x.shape[-1] // 2 * 2
+    x = x[..., :height, :width]
+    summed = x[..., 0::2, 0::2] + x[..., 1::2, 0::2] + x[..., 0::2, 1::2] + x[..., 1::2, 1::2]
+    return summed / 4.0
+
+
+def ms_ssim(original, reconstructed, win_size=7, data_range=None, bit_depth=8, weights=MS_SSIM_WEIGHTS):
+    """Multi-scale SSIM (Wang et al. 2003) with box windows and 2x2 average downsampling."""
+    x = np.asarray(original)
+    y = np.asarray(reconstructed)
+    min_size = win_size * (1 << (len(weights) - 1))
+    if min(x.shape[-2:]) < min_size:
+        raise ValueError(f"MS-SSIM with {len(weights)} scales and win_size {win_size} needs images of at least {min_size} pixels")
+    result = 1.0
+    for scale, weight in enumerate(weights):
+        ssim_values, cs_values = ssim_map(x, y, win_size, data_range, bit_depth)
+        if scale == len(weights) - 1:
+            value = ssim_values.mean(axis=(-2, -1))
+        else:
+            value = cs_values.mean(axis=(-2, -1))
+            x = _downsample(x.astype(np.float64))
+            y = _downsample(y.astype(np.float64))
+        result = result * np.maximum(value, 0.0) ** weight
+    return result
+
+
+def block_metrics(original, reconstructed, block_size=4, win_size=3, data_range=None, bit_depth=8):
+    """Per-block MSE, PSNR and SSIM maps of a frame, shape (rows, cols) each.
+
+    Each block is scored on its own, like calling the skimage metrics per block
+    in script 8, but all blocks are computed at once.
+    """
+    original_blocks = frame_to_blocks(original, block_size)
+    reconstructed_blocks = frame_to_blocks(reconstructed, block_size)
+    mse_values = mse(original_blocks, reconstructed_blocks)
+    data_range = _data_range(data_range, bit_depth)
+    return BlockMetrics(
+        mse=mse_values,
+        psnr=mse_to_psnr(mse_values, data_range),
+        ssim=ssim(original_blocks, reconstructed_blocks, win_size, data_range),
+    )
+
+
+def frame_metrics(original, reconstructed, win_size=7, data_range=None, bit_depth=8):
+    """Whole-frame MSE, PSNR and SSIM (works on (..., H, W) stacks of frames too)."""
+    mse_values = mse(original, reconstructed)
+    data_range = _data_range(data_range, bit_depth)
+    return BlockMetrics(
+        mse=mse_values,
+        psnr=mse_to_psnr(mse_values, data_range),
+        ssim=ssim(original, reconstructed, win_size, data_range),
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    # Original and reconstructed blocks from script 8 (rounded reconstruction)
+    original_block = np.array([
+        [0,  64, 128, 192],
+        [64, 85, 149, 213],
+        [128, 149, 170, 234],
+        [192, 213, 234, 255]
+    ])
+    reconstructed_block = np.array([
+        [6,  58, 124, 188],
+        [60, 93, 150, 211],
+        [131, 148, 168, 232],
+        [187, 214, 238, 252]
+    ])
+    block_range = original_block.max() - original_block.min()
+    print(f"MSE: {mse(original_block, reconstructed_block):.4f}")
+    print(f"PSNR: {psnr(original_block, reconstructed_block, data_range=block_range):.2f} dB")
+    print(f"SSIM: {ssim(original_block, reconstructed_block, win_size=3, data_range=block_range):.4f}")
+
+    # Per-block and per-frame maps of a noisy 720p frame
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(720, 1280), dtype=np.uint8)
+    noisy = np.clip(frame + rng.normal(0, 5, frame.shape), 0, 255).astype(np.uint8)
+    start = time.perf_counter()
+    maps = block_metrics(frame, noisy)
+    whole = frame_metrics(frame, noisy)
+    multi_scale = ms_ssim(frame, noisy)
+    elapsed = time.perf_counter() - start
+    print(f"\n{maps.mse.size} blocks: mean block PSNR {maps.psnr.mean():.2f} dB, mean block SSIM {maps.ssim.mean():.4f}")
+    print(f"Frame: PSNR {whole.psnr:.2f} dB, SSIM {whole.ssim:.4f}, MS-SSIM {multi_scale:.4f}")
+    print(f"All metrics in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,185 @@
+import functools
+import numpy as np
+
+from quantizer_tables import DC_QLOOKUP, AC_QLOOKUP, QM_32X32_TRIANGULAR
+
+# Vectorized AV1 quantize/dequantize stage.
+#
+# The scripts quantize one block with np.round(transformed_block /
+# quantization_matrix) against a hand-typed 4x4 matrix. Here the step sizes
+# come from the AV1 DC/AC lookup tables (all 256 qindex values, 8/10/12 bit)
+# with optional quantizer matrix levels, and a whole (N, h, w) stack of
+# integer coefficients is quantized with a multiply-and-shift by a
+# precomputed reciprocal instead of a float division.
+#
+# Coefficients are expected in the AV1 integer domain, i.e. the domain of
+# integer_transform.inverse_transform_2d(). Orthonormal float coefficients
+# can be converted with integer_transform.coefficient_scale().
+
+QINDEX_RANGE = 256
+BIT_DEPTHS = (8, 10, 12)
+NUM_QM_LEVELS = 16  # level 15 means a flat matrix (no weighting)
+QM_BITS = 5         # quantizer matrix weights are in units of 1/32
+
+# Reciprocal precision. floor(a * ceil(2^s / q) / 2^s) == floor(a / q) as long
+# as a * q < 2^s, which holds for 12-bit coefficients and the largest
+# qm-weighted step size, and a * multiplier still fits in int64.
+QUANT_SHIFT = 40
+
+DC_QLOOKUP_ARRAY = np.array(DC_QLOOKUP, dtype=np.int32)
+AC_QLOOKUP_ARRAY = np.array(AC_QLOOKUP, dtype=np.int32)
+
+# Offsets used to subsample the smaller square matrices from the 32x32 one
+_QM_SUBSAMPLE_OFFSET = {4: 3, 8: 1, 16: 0, 32: 0}
+
+
+def _bit_depth_index(bit_depth):
+    if bit_depth not in BIT_DEPTHS:
+        raise ValueError(f"Unsupported bit depth {bit_depth}, expected one of {BIT_DEPTHS}")
+    return (bit_depth - 8) >> 1
+
+
+def dc_q(qindex, bit_depth=8, delta_q=0):
+    """Returns the DC quantizer step size (spec dc_q()), works on arrays of qindex."""
+    qindex = np.clip(np.asarray(qindex) + delta_q, 0, QINDEX_RANGE - 1)
+    return DC_QLOOKUP_ARRAY[_bit_depth_index(bit_depth)][qindex]
+
+
+def ac_q(qindex, bit_depth=8, delta_q=0):
+    """Returns the AC quantizer step size (spec ac_q()), works on arrays of qindex."""
+    qindex = np.clip(np.asarray(qindex) + delta_q, 0, QINDEX_RANGE - 1)
+    return AC_QLOOKUP_ARRAY[_bit_depth_index(bit_depth)][qindex]
+
+
+@functools.lru_cache(maxsize=None)
+def quant_matrix(qm_level, plane, size):
+    """Returns the (size, size) quantizer matrix weights, or None for the flat level 15.
+
+    plane is 0 for luma and 1 for chroma. Only square transform sizes are
+    available since the matrices are stored as the symmetric 32x32 table.
+    """
+    if not 0 <= qm_level < NUM_QM_LEVELS:
+        raise ValueError(f"qm_level must be in 0..{NUM_QM_LEVELS - 1}, got {qm_level}")
+    if qm_level == NUM_QM_LEVELS - 1:
+        return None
+    if size not in _QM_SUBSAMPLE_OFFSET:
+        raise ValueError(f"No quantizer matrix for size {size}x{size}")
+    matrix = np.zeros((32, 32), dtype=np.int32)
+    matrix[np.tril_indices(32)] = QM_32X32_TRIANGULAR[qm_level][min(plane, 1)]
+    matrix = matrix + np.tril(matrix, -1).T
+    step = 32 // size
+    offset = _QM_SUBSAMPLE_OFFSET[size]
+    matrix = np.ascontiguousarray(matrix[offset::step, offset::step])
+    matrix.setflags(write=False)
+    return matrix
+
+
+def dequant_shift(height, width):
+    """Returns dqDenom: 0 up to 256 samples, 1 up to 1024 samples, 2 above."""
+    samples = height * width
+    return int(samples > 256) + int(samples > 1024)
+
+
+def step_sizes(qindex, height, width, bit_depth=8, qm_level=15, plane=0):
+    """Returns the effective per-coefficient step sizes, shape qindex.shape + (h, w)."""
+    qindex = np.asarray(qindex)
+    steps = np.broadcast_to(ac_q(qindex, bit_depth)[..., np.newaxis, np.newaxis],
+                            qindex.shape + (height, width)).copy()
+    steps[..., 0, 0] = dc_q(qindex, bit_depth)
+    if qm_level != NUM_QM_LEVELS - 1:
+        if height != width:
+            raise ValueError("Quantizer matrices are only available for square transforms")
+        weights = quant_matrix(qm_level, plane, height)
+        steps = (steps * weights + (1 << (QM_BITS - 1))) >> QM_BITS
+    return steps
+
+
+def _multipliers(steps):
+    return ((1 << QUANT_SHIFT) + steps.astype(np.int64) - 1) // steps
+
+
+def quantize(coefficients, qindex, bit_depth=8, qm_level=15, plane=0, rounding=64):
+    """Quantizes an integer (..., h, w) coefficient stack to int32 levels.
+
+    rounding is the rounding offset in 1/128 of a step: 64 rounds to nearest,
+    smaller values widen the dead zone. qindex may be an array, in which case
+    the result gets qindex.shape prepended (see quantize_sweep()).
+    """
+    coefficients = np.asarray(coefficients)
+    if coefficients.dtype.kind == 'f':
+        coefficients = np.round(coefficients)
+    coefficients = coefficients.astype(np.int64)
+    height, width = coefficients.shape[-2:]
+    qindex = np.asarray(qindex)
+    steps = step_sizes(qindex, height, width, bit_depth, qm_level, plane).astype(np.int64)
+    multipliers = _multipliers(steps)
+    # Add singleton axes so a (Q, h, w) step array broadcasts over (..., h, w) blocks
+    extra = coefficients.ndim - 2
+    steps = steps.reshape(qindex.shape + (1,) * extra + (height, width))
+    multipliers = multipliers.reshape(steps.shape)
+
+    magnitude = np.abs(coefficients) << dequant_shift(height, width)
+    levels = ((magnitude + ((steps * rounding) >> 7)) * multipliers) >> QUANT_SHIFT
+    return np.where(coefficients < 0, -levels, levels).astype(np.int32)
+
+
+def dequantize(levels, qindex, bit_depth=8, qm_level=15, plane=0):
+    """Dequantizes int32 levels as in the spec (7.12.3), including the 24-bit mask and clamp."""
+    levels = np.asarray(levels, dtype=np.int64)
+    height, width = levels.shape[-2:]
+    qindex = np.asarray(qindex)
+    steps = step_sizes(qindex, height, width, bit_depth, qm_level, plane).astype(np.int64)
+    # Same broadcasting as quantize(): a (Q,) qindex applies to the leading axis of levels
+    extra = levels.ndim - 2 - qindex.ndim
+    steps = steps.reshape(qindex.shape + (1,) * extra + (height, width))
+
+    dq = (np.abs(levels) * steps) & 0xFFFFFF
+    dq = dq >> dequant_shift(height, width)
+    dq = np.where(levels < 0, -dq, dq)
+    limit = 1 << (7 + bit_depth)
+    return np.clip(dq, -limit, limit - 1).astype(np.int32)
+
+
+def quantize_sweep(coefficients, qindices, bit_depth=8, qm_level=15, plane=0, rounding=64):
+    """Quantizes and dequantizes one coefficient stack at many qindex values at once.
+
+    Returns (levels, dequantized), each of shape (len(qindices),) + coefficients.shape.
+    """
+    qindices = np.asarray(qindices)
+    levels = quantize(coefficients, qindices, bit_depth, qm_level, plane, rounding)
+    return levels, dequantize(levels, qindices, bit_depth, qm_level, plane)
+
+
+if __name__ == "__main__":
+    import time
+    from block_transform import dct2_blocks
+    from integer_transform import coefficient_scale, inverse_transform_2d
+
+    # Residual block (smooth gradient) as used in the scripts
+    residual_block = np.array([
+        [0, 50, 100, 150],
+        [50, 100, 150, 200],
+        [100, 150, 200, 250],
+        [150, 200, 250, 300],
+    ]) - 150
+    coefficients = np.round(dct2_blocks(residual_block) * coefficient_scale(4, 4)).astype(np.int32)
+
+    for qindex in (0, 64, 128, 255):
+        quantized_block = quantize(coefficients, qindex)
+        dequantized_block = dequantize(quantized_block, qindex)
+        reconstructed = inverse_transform_2d(dequantized_block)
+        mse = np.mean((reconstructed - residual_block) ** 2)
+        print(f"\nqindex {qindex}: dc_q={dc_q(qindex)}, ac_q={ac_q(qindex)}, MSE={mse:.2f}")
+        print(quantized_block)
+
+    print("\nQuantizer matrix level 0 (luma, 4x4):")
+    print(quant_matrix(0, 0, 4))
+
+    # Sweep 64 qindex values over all 4x4 blocks of a 720p frame
+    rng = np.random.default_rng(0)
+    frame_coefficients = rng.integers(-2048, 2048, size=(57600, 4, 4))
+    qindices = np.arange(0, 256, 4)
+    start = time.perf_counter()
+    levels, dequantized = quantize_sweep(frame_coefficients, qindices)
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(qindices)} qindex values x {frame_coefficients.shape[0]} blocks in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,876 @@
+# AV1 quantizer lookup tables.
+#
+# Dc_Qlookup / Ac_Qlookup from the AV1 spec (section 7.12.2), indexed as
+# [bit_depth_index][qindex] with bit_depth_index 0, 1, 2 for 8, 10, 12 bit.
+#
+# QM_32X32_TRIANGULAR holds the spec Quantizer_Matrix weights (1/32 units)
+# for the 32x32 transform of qm levels 0..14, [level][plane], as the lower
+# triangle in row-major order (the square matrices are symmetric). The 4x4,
+# 8x8 and 16x16 matrices are subsampled from it, see quantizer.py.
+
+DC_QLOOKUP = [
+    [  # 8 bit
+        4, 8, 8, 9, 10, 11, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19,
+        20, 21, 22, 23, 24, 25, 26, 26, 27, 28, 29, 30, 31, 32, 32, 33,
+        34, 35, 36, 37, 38, 38, 39, 40, 41, 42, 43, 43, 44, 45, 46, 47,
+        48, 48, 49, 50, 51, 52, 53, 53, 54, 55, 56, 57, 57, 58, 59, 60,
+        61, 62, 62, 63, 64, 65, 66, 66, 67, 68, 69, 70, 70, 71, 72, 73,
+        74, 74, 75, 76, 77, 78, 78, 79, 80, 81, 81, 82, 83, 84, 85, 85,
+        87, 88, 90, 92, 93, 95, 96, 98, 99, 101, 102, 104, 105, 107, 108, 110,
+        111, 113, 114, 116, 117, 118, 120, 121, 123, 125, 127, 129, 131, 134, 136, 138,
+        140, 142, 144, 146, 148, 150, 152, 154, 156, 158, 161, 164, 166, 169, 172, 174,
+        177, 180, 182, 185, 187, 190, 192, 195, 199, 202, 205, 208, 211, 214, 217, 220,
+        223, 226, 230, 233, 237, 240, 243, 247, 250, 253, 257, 261, 265, 269, 272, 276,
+        280, 284, 288, 292, 296, 300, 304, 309, 313, 317, 322, 326, 330, 335, 340, 344,
+        349, 354, 359, 364, 369, 374, 379, 384, 389, 395, 400, 406, 411, 417, 423, 429,
+        435, 441, 447, 454, 461, 467, 475, 482, 489, 497, 505, 513, 522, 530, 539, 549,
+        559, 569, 579, 590, 602, 614, 626, 640, 654, 668, 684, 700, 717, 736, 755, 775,
+        796, 819, 843, 869, 896, 925, 955, 988, 1022, 1058, 1098, 1139, 1184, 1232, 1282, 1336,
+    ],
+    [  # 10 bit
+        4, 9, 10, 13, 15, 17, 20, 22, 25, 28, 31, 34, 37, 40, 43, 47,
+        50, 53, 57, 60, 64, 68, 71, 75, 78, 82, 86, 90, 93, 97, 101, 105,
+        109, 113, 116, 120, 124, 128, 132, 136, 140, 143, 147, 151, 155, 159, 163, 166,
+        170, 174, 178, 182, 185, 189, 193, 197, 200, 204, 208, 212, 215, 219, 223, 226,
+        230, 233, 237, 241, 244, 248, 251, 255, 259, 262, 266, 269, 273, 276, 280, 283,
+        287, 290, 293, 297, 300, 304, 307, 310, 314, 317, 321, 324, 327, 331, 334, 337,
+        343, 350, 356, 362, 369, 375, 381, 387, 394, 400, 406, 412, 418, 424, 430, 436,
+        442, 448, 454, 460, 466, 472, 478, 484, 490, 499, 507, 516, 525, 533, 542, 550,
+        559, 567, 576, 584, 592, 601, 609, 617, 625, 634, 644, 655, 666, 676, 687, 698,
+        708, 718, 729, 739, 749, 759, 770, 782, 795, 807, 819, 831, 844, 856, 868, 880,
+        891, 906, 920, 933, 947, 961, 975, 988, 1001, 1015, 1030, 1045, 1061, 1076, 1090, 1105,
+        1120, 1137, 1153, 1170, 1186, 1202, 1218, 1236, 1253, 1271, 1288, 1306, 1323, 1342, 1361, 1379,
+        1398, 1416, 1436, 1456, 1476, 1496, 1516, 1537, 1559, 1580, 1601, 1624, 1647, 1670, 1692, 1717,
+        1741, 1766, 1791, 1817, 1844, 1871, 1900, 1929, 1958, 1990, 2021, 2054, 2088, 2123, 2159, 2197,
+        2236, 2276, 2319, 2363, 2410, 2458, 2508, 2561, 2616, 2675, 2737, 2802, 2871, 2944, 3020, 3102,
+        3188, 3280, 3375, 3478, 3586, 3702, 3823, 3953, 4089, 4236, 4394, 4559, 4737, 4929, 5130, 5347,
+    ],
+    [  # 12 bit
+        4, 12, 18, 25, 33, 41, 50, 60, 70, 80, 91, 103, 115, 127, 140, 153,
+        166, 180, 194, 208, 222, 237, 251, 266, 281, 296, 312, 327, 343, 358, 374, 390,
+        405, 421, 437, 453, 469, 484, 500, 516, 532, 548, 564, 580, 596, 611, 627, 643,
+        659, 674, 690, 706, 721, 737, 752, 768, 783, 798, 814, 829, 844, 859, 874, 889,
+        904, 919, 934, 949, 964, 978, 993, 1008, 1022, 1037, 1051, 1065, 1080, 1094, 1108, 1122,
+        1136, 1151, 1165, 1179, 1192, 1206, 1220, 1234, 1248, 1261, 1275, 1288, 1302, 1315, 1329, 1342,
+        1368, 1393, 1419, 1444, 1469, 1494, 1519, 1544, 1569, 1594, 1618, 1643, 1668, 1692, 1717, 1741,
+        1765, 1789, 1814, 1838, 1862, 1885, 1909, 1933, 1957, 1992, 2027, 2061, 2096, 2130, 2165, 2199,
+        2233, 2267, 2300, 2334, 2367, 2400, 2434, 2467, 2499, 2532, 2575, 2618, 2661, 2704, 2746, 2788,
+        2830, 2872, 2913, 2954, 2995, 3036, 3076, 3127, 3177, 3226, 3275, 3324, 3373, 3421, 3469, 3517,
+        3565, 3621, 3677, 3733, 3788, 3843, 3897, 3951, 4005, 4058, 4119, 4181, 4241, 4301, 4361, 4420,
+        4479, 4546, 4612, 4677, 4742, 4807, 4871, 4942, 5013, 5083, 5153, 5222, 5291, 5367, 5442, 5517,
+        5591, 5665, 5745, 5825, 5905, 5984, 6063, 6149, 6234, 6319, 6404, 6495, 6587, 6678, 6769, 6867,
+        6966, 7064, 7163, 7269, 7376, 7483, 7599, 7715, 7832, 7958, 8085, 8214, 8352, 8492, 8635, 8788,
+        8945, 9104, 9275, 9450, 9639, 9832, 10031, 10245, 10465, 10702, 10946, 11210, 11482, 11776, 12081, 12409,
+        12750, 13118, 13501, 13913, 14343, 14807, 15290, 15812, 16356, 16943, 17575, 18237, 18949, 19718, 20521, 21387,
+    ],
+]
+
+AC_QLOOKUP = [
+    [  # 8 bit
+        4, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+        23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+        39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54,
+        55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
+        71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86,
+        87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102,
+        104, 106, 108, 110, 112, 114, 116, 118, 120, 122, 124, 126, 128, 130, 132, 134,
+        136, 138, 140, 142, 144, 146, 148, 150, 152, 155, 158, 161, 164, 167, 170, 173,
+        176, 179, 182, 185, 188, 191, 194, 197, 200, 203, 207, 211, 215, 219, 223, 227,
+        231, 235, 239, 243, 247, 251, 255, 260, 265, 270, 275, 280, 285, 290, 295, 300,
+        305, 311, 317, 323, 329, 335, 341, 347, 353, 359, 366, 373, 380, 387, 394, 401,
+        408, 416, 424, 432, 440, 448, 456, 465, 474, 483, 492, 501, 510, 520, 530, 540,
+        550, 560, 571, 582, 593, 604, 615, 627, 639, 651, 663, 676, 689, 702, 715, 729,
+        743, 757, 771, 786, 801, 816, 832, 848, 864, 881, 898, 915, 933, 951, 969, 988,
+        1007, 1026, 1046, 1066, 1087, 1108, 1129, 1151, 1173, 1196, 1219, 1243, 1267, 1292, 1317, 1343,
+        1369, 1396, 1423, 1451, 1479, 1508, 1537, 1567, 1597, 1628, 1660, 1692, 1725, 1759, 1793, 1828,
+    ],
+    [  # 10 bit
+        4, 9, 11, 13, 16, 18, 21, 24, 27, 30, 33, 37, 40, 44, 48, 51,
+        55, 59, 63, 67, 71, 75, 79, 83, 88, 92, 96, 100, 105, 109, 114, 118,
+        122, 127, 131, 136, 140, 145, 149, 154, 158, 163, 168, 172, 177, 181, 186, 190,
+        195, 199, 204, 208, 213, 217, 222, 226, 231, 235, 240, 244, 249, 253, 258, 262,
+        267, 271, 275, 280, 284, 289, 293, 297, 302, 306, 311, 315, 319, 324, 328, 332,
+        337, 341, 345, 349, 354, 358, 362, 367, 371, 375, 379, 384, 388, 392, 396, 401,
+        409, 417, 425, 433, 441, 449, 458, 466, 474, 482, 490, 498, 506, 514, 523, 531,
+        539, 547, 555, 563, 571, 579, 588, 596, 604, 616, 628, 640, 652, 664, 676, 688,
+        700, 713, 725, 737, 749, 761, 773, 785, 797, 809, 825, 841, 857, 873, 889, 905,
+        922, 938, 954, 970, 986, 1002, 1018, 1038, 1058, 1078, 1098, 1118, 1138, 1158, 1178, 1198,
+        1218, 1242, 1266, 1290, 1314, 1338, 1362, 1386, 1411, 1435, 1463, 1491, 1519, 1547, 1575, 1603,
+        1631, 1663, 1695, 1727, 1759, 1791, 1823, 1859, 1895, 1931, 1967, 2003, 2039, 2079, 2119, 2159,
+        2199, 2239, 2283, 2327, 2371, 2415, 2459, 2507, 2555, 2603, 2651, 2703, 2755, 2807, 2859, 2915,
+        2971, 3027, 3083, 3143, 3203, 3263, 3327, 3391, 3455, 3523, 3591, 3659, 3731, 3803, 3876, 3952,
+        4028, 4104, 4184, 4264, 4348, 4432, 4516, 4604, 4692, 4784, 4876, 4972, 5068, 5168, 5268, 5372,
+        5476, 5584, 5692, 5804, 5916, 6032, 6148, 6268, 6388, 6512, 6640, 6768, 6900, 7036, 7172, 7312,
+    ],
+    [  # 12 bit
+        4, 13, 19, 27, 35, 44, 54, 64, 75, 87, 99, 112, 126, 139, 154, 168,
+        183, 199, 214, 230, 247, 263, 280, 297, 314, 331, 349, 366, 384, 402, 420, 438,
+        456, 475, 493, 511, 530, 548, 567, 586, 604, 623, 642, 660, 679, 698, 716, 735,
+        753, 772, 791, 809, 828, 846, 865, 884, 902, 920, 939, 957, 976, 994, 1012, 1030,
+        1049, 1067, 1085, 1103, 1121, 1139, 1157, 1175, 1193, 1211, 1229, 1246, 1264, 1282, 1299, 1317,
+        1335, 1352, 1370, 1387, 1405, 1422, 1440, 1457, 1474, 1491, 1509, 1526, 1543, 1560, 1577, 1595,
+        1627, 1660, 1693, 1725, 1758, 1791, 1824, 1856, 1889, 1922, 1954, 1987, 2020, 2052, 2085, 2118,
+        2150, 2183, 2216, 2248, 2281, 2313, 2346, 2378, 2411, 2459, 2508, 2556, 2605, 2653, 2701, 2750,
+        2798, 2847, 2895, 2943, 2992, 3040, 3088, 3137, 3185, 3234, 3298, 3362, 3426, 3491, 3555, 3619,
+        3684, 3748, 3812, 3876, 3941, 4005, 4069, 4149, 4230, 4310, 4390, 4470, 4550, 4631, 4711, 4791,
+        4871, 4967, 5064, 5160, 5256, 5352, 5448, 5544, 5641, 5737, 5849, 5961, 6073, 6185, 6297, 6410,
+        6522, 6650, 6778, 6906, 7034, 7162, 7290, 7435, 7579, 7723, 7867, 8011, 8155, 8315, 8475, 8635,
+        8795, 8956, 9132, 9308, 9484, 9660, 9836, 10028, 10220, 10412, 10604, 10812, 11020, 11228, 11437, 11661,
+        11885, 12109, 12333, 12573, 12813, 13053, 13309, 13565, 13821, 14093, 14365, 14637, 14925, 15213, 15502, 15806,
+        16110, 16414, 16734, 17054, 17390, 17726, 18062, 18414, 18766, 19134, 19502, 19886, 20270, 20670, 21070, 21486,
+        21902, 22334, 22766, 23214, 23662, 24126, 24590, 25070, 25551, 26047, 26559, 27071, 27599, 28143, 28687, 29247,
+    ],
+]
+
+QM_32X32_TRIANGULAR = [
+    [  # level 0
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 33, 33, 32, 32, 32, 33, 34, 35, 34, 34, 33,
+            34, 35, 37, 39, 35, 34, 34, 35, 36, 37, 41, 43, 36, 35, 34, 35, 36, 38, 42, 45, 48, 39, 38, 37,
+            38, 39, 40, 45, 47, 50, 54, 44, 42, 41, 41, 42, 42, 47, 50, 54, 58, 63, 46, 44, 42, 43, 44, 44,
+            49, 52, 55, 59, 65, 67, 48, 46, 44, 45, 45, 46, 51, 53, 57, 61, 67, 69, 71, 54, 51, 49, 49, 50,
+            49, 54, 57, 60, 65, 71, 74, 76, 82, 59, 56, 54, 54, 54, 53, 58, 61, 64, 69, 75, 78, 80, 87, 92,
+            62, 59, 56, 56, 56, 55, 60, 63, 66, 71, 77, 80, 83, 89, 95, 98, 65, 62, 59, 59, 59, 58, 63, 65,
+            68, 73, 79, 82, 85, 92, 98, 101, 105, 71, 68, 65, 64, 64, 63, 68, 70, 73, 78, 84, 87, 90, 97, 103,
+            107, 111, 117, 80, 76, 72, 72, 71, 69, 74, 76, 79, 84, 90, 93, 96, 104, 110, 114, 118, 125, 134, 81, 77,
+            73, 73, 72, 70, 75, 77, 80, 85, 91, 94, 97, 105, 111, 115, 119, 126, 135, 137, 83, 78, 75, 74, 74, 72,
+            76, 79, 81, 86, 92, 95, 99, 106, 113, 117, 121, 128, 137, 138, 140, 88, 84, 80, 79, 78, 76, 80, 82, 85,
+            91, 95, 98, 103, 111, 115, 119, 126, 134, 139, 144, 147, 152, 91, 86, 83, 82, 81, 79, 81, 84, 88, 92, 95,
+            100, 107, 110, 115, 123, 127, 132, 140, 147, 151, 154, 159, 94, 89, 86, 85, 84, 82, 82, 86, 90, 92, 97, 103,
+            105, 111, 119, 121, 128, 136, 139, 146, 156, 158, 161, 166, 97, 92, 90, 88, 86, 85, 84, 89, 91, 95, 100, 102,
+            108, 114, 116, 125, 130, 133, 143, 148, 152, 163, 166, 168, 174, 101, 95, 93, 91, 89, 89, 87, 91, 93, 98, 101,
+            105, 111, 113, 120, 126, 130, 138, 142, 149, 157, 159, 171, 174, 176, 183, 104, 99, 97, 94, 93, 93, 90, 92, 96,
+            100, 102, 108, 111, 116, 122, 125, 134, 137, 144, 151, 155, 165, 169, 179, 182, 184, 191, 107, 102, 101, 97, 96, 96,
+            93, 93, 99, 101, 105, 110, 113, 120, 122, 129, 133, 140, 146, 150, 161, 163, 173, 178, 187, 191, 193, 200, 111, 105,
+            104, 101, 100, 99, 97, 96, 102, 103, 109, 111, 117, 120, 125, 131, 135, 143, 146, 156, 158, 168, 173, 180, 189, 195,
+            200, 202, 210, 115, 109, 108, 104, 104, 102, 101, 100, 103, 106, 111, 113, 119, 121, 129, 131, 140, 142, 151, 155, 162,
+            168, 176, 183, 188, 199, 204, 210, 212, 220, 119, 113, 112, 107, 107, 106, 105, 103, 105, 110, 112, 117, 120, 125, 130,
+            135, 140, 145, 152, 157, 165, 169, 179, 183, 193, 197, 210, 214, 220, 222, 231, 123, 116, 116, 111, 111, 109, 110, 107,
+            107, 114, 114, 121, 122, 130, 130, 140, 140, 150, 151, 163, 164, 176, 177, 190, 191, 204, 206, 222, 224, 230, 232, 242,
+        ],
+        [  # chroma
+            32, 31, 31, 30, 31, 32, 32, 33, 33, 35, 33, 34, 35, 37, 39, 36, 38, 40, 41, 43, 47, 41, 42, 42,
+            43, 45, 47, 48, 45, 45, 44, 45, 46, 47, 49, 50, 49, 47, 46, 47, 47, 48, 50, 51, 53, 48, 47, 45,
+            46, 46, 46, 49, 51, 53, 54, 49, 47, 45, 45, 45, 45, 49, 51, 53, 55, 58, 50, 47, 45, 46, 46, 46,
+            49, 51, 54, 56, 59, 60, 50, 48, 46, 46, 46, 46, 50, 52, 54, 56, 60, 60, 61, 52, 50, 47, 47, 47,
+            47, 50, 52, 54, 57, 61, 62, 63, 66, 54, 52, 49, 49, 49, 48, 52, 53, 55, 58, 62, 64, 65, 68, 71,
+            56, 53, 51, 50, 50, 49, 52, 54, 56, 59, 63, 64, 66, 69, 72, 73, 57, 54, 52, 51, 51, 50, 53, 55,
+            56, 60, 63, 65, 67, 70, 73, 75, 76, 60, 57, 54, 54, 53, 52, 55, 57, 58, 61, 65, 67, 68, 72, 75,
+            77, 79, 82, 63, 60, 57, 57, 56, 54, 57, 59, 60, 63, 67, 69, 71, 75, 78, 80, 82, 85, 89, 64, 61,
+            58, 57, 57, 55, 58, 59, 61, 64, 67, 69, 71, 75, 78, 80, 82, 85, 89, 90, 65, 61, 58, 58, 57, 55,
+            58, 60, 61, 64, 68, 70, 71, 75, 79, 81, 83, 86, 90, 91, 91, 67, 63, 61, 60, 59, 57, 60, 61, 63,
+            66, 69, 70, 73, 77, 79, 81, 85, 88, 90, 92, 94, 96, 68, 64, 62, 61, 60, 58, 59, 61, 64, 66, 67,
+            71, 74, 75, 78, 82, 84, 86, 90, 93, 94, 96, 98, 69, 65, 63, 62, 61, 59, 59, 62, 64, 65, 68, 71,
+            72, 75, 79, 80, 83, 87, 89, 92, 96, 97, 98, 100, 70, 66, 64, 63, 62, 61, 60, 63, 64, 66, 69, 70,
+            73, 76, 77, 81, 84, 85, 89, 92, 93, 98, 99, 100, 102, 71, 67, 66, 64, 63, 62, 61, 63, 64, 67, 68,
+            70, 74, 75, 78, 81, 83, 86, 88, 91, 94, 95, 100, 101, 102, 104, 72, 68, 67, 65, 64, 64, 61, 63, 65,
+            67, 68, 71, 73, 75, 78, 79, 84, 85, 88, 91, 93, 97, 98, 102, 103, 104, 106, 73, 69, 68, 66, 65, 65,
+            63, 63, 66, 67, 69, 71, 73, 76, 77, 81, 82, 85, 88, 90, 94, 95, 99, 101, 104, 105, 106, 109, 74, 70,
+            70, 67, 66, 66, 64, 63, 66, 67, 70, 71, 74, 75, 78, 80, 82, 86, 87, 91, 92, 96, 98, 101, 104, 106,
+            108, 108, 111, 75, 71, 71, 68, 68, 67, 66, 64, 66, 68, 70, 71, 74, 75, 79, 79, 84, 84, 88, 90, 93,
+            95, 98, 101, 103, 107, 108, 110, 111, 113, 76, 72, 72, 69, 69, 68, 67, 65, 66, 69, 70, 72, 74, 76, 78,
+            81, 83, 85, 88, 90, 93, 95, 98, 100, 104, 105, 109, 111, 112, 113, 116, 78, 74, 74, 70, 70, 69, 69, 66,
+            66, 70, 70, 74, 74, 77, 78, 82, 82, 86, 87, 92, 92, 96, 97, 102, 102, 107, 107, 112, 113, 115, 115, 118,
+        ],
+    ],
+    [  # level 1
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 33, 32, 32, 32, 33, 34, 35, 32, 33, 33,
+            33, 34, 36, 36, 34, 34, 33, 34, 35, 37, 38, 39, 36, 35, 34, 35, 36, 38, 40, 42, 48, 38, 37, 36,
+            36, 38, 39, 41, 44, 50, 51, 39, 38, 37, 38, 39, 40, 42, 45, 50, 52, 54, 44, 42, 41, 41, 42, 42,
+            44, 47, 54, 56, 58, 63, 47, 45, 44, 44, 45, 45, 47, 50, 56, 58, 60, 66, 69, 49, 47, 46, 45, 46,
+            46, 48, 51, 57, 60, 62, 68, 71, 73, 54, 51, 50, 49, 50, 49, 51, 54, 60, 63, 65, 71, 75, 77, 82,
+            59, 56, 54, 54, 54, 53, 55, 58, 64, 67, 69, 75, 79, 81, 87, 92, 61, 58, 56, 56, 56, 55, 57, 60,
+            65, 68, 70, 77, 81, 83, 89, 94, 97, 65, 62, 60, 59, 59, 58, 60, 63, 68, 71, 73, 79, 84, 87, 92,
+            98, 101, 105, 71, 68, 65, 65, 64, 63, 65, 68, 73, 76, 78, 84, 89, 92, 97, 103, 106, 111, 117, 76, 72,
+            70, 69, 68, 66, 68, 71, 76, 79, 81, 88, 92, 95, 101, 107, 110, 115, 122, 127, 80, 76, 73, 72, 71, 69,
+            71, 74, 79, 82, 84, 90, 95, 98, 104, 110, 113, 118, 125, 130, 134, 83, 78, 76, 75, 74, 72, 73, 76, 81,
+            84, 86, 92, 97, 100, 106, 113, 116, 121, 128, 133, 137, 140, 86, 82, 79, 78, 77, 74, 76, 79, 84, 87, 89,
+            95, 100, 103, 109, 116, 119, 124, 131, 136, 140, 144, 147, 89, 85, 82, 81, 79, 78, 78, 82, 86, 87, 92, 97,
+            100, 105, 112, 114, 120, 128, 131, 136, 146, 147, 150, 155, 92, 88, 85, 84, 82, 81, 80, 85, 86, 90, 95, 97,
+            102, 107, 110, 117, 122, 125, 134, 138, 142, 152, 154, 156, 162, 95, 90, 88, 86, 85, 84, 82, 86, 88, 93, 95,
+            99, 105, 106, 113, 118, 121, 129, 132, 139, 146, 148, 159, 161, 163, 169, 98, 93, 91, 89, 88, 87, 85, 87, 90,
+            94, 96, 102, 104, 109, 114, 117, 126, 128, 134, 141, 145, 154, 157, 166, 168, 170, 176, 101, 96, 95, 92, 91, 90,
+            88, 88, 93, 95, 99, 103, 106, 112, 114, 121, 124, 131, 136, 140, 149, 151, 160, 165, 173, 176, 178, 184, 104, 99,
+            98, 95, 94, 93, 91, 90, 95, 96, 102, 103, 109, 112, 117, 122, 125, 133, 136, 145, 146, 156, 160, 167, 174, 180,
+            184, 186, 193, 108, 102, 101, 98, 97, 96, 95, 93, 97, 100, 104, 106, 111, 113, 121, 122, 130, 132, 140, 143, 150,
+            155, 162, 169, 174, 183, 188, 192, 194, 201, 111, 105, 105, 101, 100, 99, 98, 96, 98, 103, 105, 109, 112, 117, 121,
+            125, 130, 135, 141, 146, 152, 156, 165, 169, 178, 181, 193, 196, 201, 202, 210, 114, 109, 109, 104, 104, 102, 102, 99,
+            100, 106, 106, 113, 113, 120, 121, 129, 130, 139, 140, 151, 151, 162, 162, 175, 176, 187, 188, 203, 204, 210, 211, 219,
+        ],
+        [  # chroma
+            32, 31, 31, 30, 31, 31, 31, 32, 32, 33, 33, 34, 35, 36, 39, 36, 38, 39, 40, 43, 47, 38, 40, 41,
+            41, 44, 47, 47, 41, 42, 42, 43, 45, 47, 48, 48, 49, 47, 46, 46, 47, 48, 49, 50, 53, 49, 47, 46,
+            46, 46, 47, 48, 50, 53, 53, 48, 47, 46, 45, 46, 46, 48, 49, 53, 54, 54, 49, 47, 45, 45, 45, 45,
+            47, 49, 53, 55, 55, 58, 50, 48, 46, 46, 46, 46, 47, 50, 54, 55, 56, 59, 61, 51, 48, 47, 46, 47,
+            46, 47, 50, 54, 55, 56, 60, 61, 62, 52, 50, 48, 47, 47, 47, 48, 50, 54, 56, 57, 61, 63, 64, 66,
+            54, 52, 50, 49, 49, 48, 49, 52, 55, 57, 58, 62, 64, 66, 68, 71, 55, 53, 51, 50, 50, 49, 50, 52,
+            56, 58, 59, 63, 65, 66, 69, 72, 73, 57, 54, 52, 51, 51, 50, 51, 53, 56, 58, 60, 63, 66, 67, 70,
+            73, 74, 76, 60, 57, 55, 54, 53, 52, 53, 55, 58, 60, 61, 65, 68, 69, 72, 75, 77, 79, 82, 62, 59,
+            57, 56, 55, 53, 54, 56, 59, 61, 63, 66, 69, 70, 74, 77, 78, 80, 84, 86, 63, 60, 58, 57, 56, 54,
+            55, 57, 60, 62, 63, 67, 70, 71, 75, 78, 79, 82, 85, 87, 89, 65, 61, 59, 58, 57, 55, 56, 58, 61,
+            63, 64, 68, 71, 72, 75, 79, 80, 83, 86, 88, 90, 91, 66, 63, 60, 59, 58, 56, 58, 59, 62, 64, 65,
+            69, 72, 73, 76, 80, 81, 84, 87, 90, 91, 93, 94, 67, 64, 62, 61, 59, 58, 58, 60, 63, 64, 66, 69,
+            71, 73, 77, 78, 81, 85, 86, 89, 93, 94, 95, 97, 68, 65, 63, 62, 60, 59, 58, 61, 62, 64, 67, 68,
+            71, 74, 75, 79, 81, 83, 87, 89, 91, 95, 96, 97, 99, 69, 66, 64, 63, 61, 61, 59, 61, 62, 65, 66,
+            68, 72, 73, 76, 78, 80, 84, 85, 88, 91, 92, 97, 98, 98, 101, 70, 67, 65, 63, 62, 62, 60, 61, 63,
+            65, 66, 69, 71, 73, 76, 77, 81, 83, 85, 88, 90, 94, 95, 99, 100, 100, 103, 71, 67, 67, 64, 63, 63,
+            61, 61, 64, 65, 67, 69, 71, 74, 75, 78, 80, 83, 85, 87, 91, 92, 95, 97, 100, 102, 102, 105, 72, 68,
+            68, 65, 65, 64, 62, 62, 64, 65, 68, 69, 72, 73, 76, 78, 80, 83, 84, 88, 89, 93, 95, 97, 100, 102,
+            104, 104, 107, 73, 69, 69, 66, 66, 65, 64, 63, 64, 66, 68, 69, 72, 73, 77, 77, 81, 82, 86, 87, 90,
+            92, 95, 97, 99, 103, 104, 106, 106, 109, 74, 70, 70, 67, 67, 66, 65, 63, 64, 67, 68, 70, 72, 74, 76,
+            78, 80, 82, 85, 87, 90, 91, 95, 96, 100, 101, 105, 106, 108, 108, 111, 75, 71, 71, 68, 68, 66, 66, 64,
+            64, 68, 68, 71, 71, 75, 75, 79, 79, 83, 84, 88, 89, 93, 93, 98, 98, 102, 103, 108, 108, 110, 110, 113,
+        ],
+    ],
+    [  # level 2
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 33, 32, 32, 32, 32, 33, 34, 32, 32, 32,
+            32, 34, 34, 35, 34, 34, 33, 33, 35, 36, 37, 39, 34, 34, 34, 34, 36, 36, 37, 41, 42, 36, 35, 34,
+            34, 36, 37, 38, 42, 45, 48, 39, 38, 38, 37, 39, 40, 40, 45, 47, 50, 54, 41, 39, 39, 38, 40, 40,
+            41, 46, 48, 51, 55, 56, 44, 42, 41, 41, 42, 42, 42, 47, 50, 54, 58, 59, 63, 48, 46, 45, 44, 45,
+            45, 45, 50, 53, 56, 61, 62, 66, 70, 49, 47, 46, 45, 46, 46, 46, 51, 53, 57, 62, 63, 68, 71, 73,
+            54, 51, 50, 49, 50, 49, 49, 54, 56, 60, 65, 67, 71, 76, 77, 82, 58, 55, 54, 53, 53, 53, 52, 57,
+            59, 63, 68, 70, 74, 79, 81, 86, 90, 59, 57, 55, 54, 54, 54, 54, 59, 61, 64, 69, 71, 75, 80, 82,
+            87, 91, 93, 65, 62, 60, 59, 59, 58, 58, 63, 65, 68, 73, 75, 79, 85, 87, 92, 97, 99, 105, 69, 66,
+            64, 63, 63, 62, 61, 66, 68, 71, 76, 78, 83, 88, 90, 96, 100, 102, 109, 113, 71, 68, 66, 65, 64, 63,
+            63, 68, 70, 73, 78, 80, 84, 90, 92, 97, 102, 104, 111, 115, 117, 80, 76, 73, 72, 71, 70, 69, 74, 76,
+            79, 84, 86, 90, 96, 98, 104, 109, 111, 118, 123, 125, 134, 81, 77, 75, 74, 73, 72, 71, 75, 77, 80, 85,
+            87, 91, 97, 99, 105, 110, 112, 120, 125, 127, 136, 137, 83, 78, 76, 75, 74, 73, 72, 76, 78, 81, 86, 88,
+            92, 98, 100, 106, 111, 113, 121, 126, 128, 137, 139, 140, 87, 83, 81, 79, 78, 77, 75, 80, 82, 85, 90, 91,
+            96, 101, 103, 110, 114, 117, 125, 129, 133, 142, 143, 145, 150, 90, 85, 83, 81, 80, 79, 78, 81, 83, 87, 89,
+            93, 98, 100, 106, 110, 114, 121, 124, 130, 136, 138, 148, 149, 151, 156, 93, 88, 86, 84, 83, 82, 80, 82, 85,
+            89, 90, 96, 98, 102, 107, 109, 118, 120, 125, 131, 134, 143, 145, 153, 156, 157, 163, 95, 90, 89, 86, 85, 85,
+            83, 83, 88, 89, 93, 97, 99, 105, 106, 113, 116, 122, 127, 130, 139, 140, 148, 153, 159, 162, 164, 169, 98, 93,
+            92, 89, 88, 87, 86, 85, 89, 90, 96, 97, 102, 105, 109, 114, 117, 124, 126, 134, 136, 144, 148, 154, 160, 166,
+            169, 170, 176, 101, 96, 95, 91, 91, 90, 89, 87, 90, 93, 97, 99, 104, 105, 112, 113, 121, 122, 130, 133, 139,
+            144, 150, 155, 160, 168, 172, 176, 177, 184, 104, 99, 98, 94, 94, 92, 92, 90, 92, 96, 98, 102, 104, 109, 112,
+            116, 121, 125, 130, 135, 141, 144, 152, 155, 163, 166, 177, 179, 184, 185, 191, 107, 101, 101, 97, 97, 95, 95, 93,
+            93, 99, 99, 105, 105, 112, 112, 120, 120, 129, 129, 139, 140, 149, 149, 161, 161, 172, 172, 185, 186, 191, 192, 199,
+        ],
+        [  # chroma
+            32, 31, 31, 30, 31, 31, 30, 31, 31, 32, 33, 34, 35, 35, 39, 35, 36, 37, 37, 41, 43, 36, 38, 39,
+            40, 43, 45, 47, 41, 42, 42, 42, 45, 46, 47, 48, 44, 44, 44, 44, 46, 46, 47, 49, 50, 49, 47, 47,
+            46, 47, 47, 48, 50, 51, 53, 48, 47, 46, 45, 46, 46, 46, 49, 51, 53, 54, 48, 47, 46, 45, 46, 46,
+            46, 49, 51, 53, 54, 55, 49, 47, 46, 45, 45, 45, 45, 49, 51, 53, 55, 56, 58, 50, 48, 47, 46, 46,
+            46, 46, 50, 51, 54, 56, 57, 59, 61, 51, 48, 47, 46, 47, 46, 46, 50, 51, 54, 56, 57, 60, 62, 62,
+            52, 50, 48, 47, 47, 47, 47, 50, 52, 54, 57, 58, 61, 63, 64, 66, 54, 51, 50, 49, 49, 48, 48, 51,
+            53, 55, 58, 59, 62, 64, 65, 68, 70, 55, 52, 51, 50, 49, 49, 48, 52, 53, 55, 59, 60, 62, 65, 66,
+            68, 70, 71, 57, 54, 53, 52, 51, 50, 50, 53, 54, 56, 60, 61, 63, 66, 67, 70, 73, 73, 76, 59, 56,
+            54, 53, 53, 52, 51, 54, 56, 58, 61, 62, 65, 68, 69, 72, 74, 75, 78, 80, 60, 57, 55, 54, 53, 53,
+            52, 55, 56, 58, 61, 63, 65, 68, 69, 72, 75, 76, 79, 81, 82, 63, 60, 58, 57, 56, 55, 54, 57, 59,
+            60, 63, 65, 67, 70, 71, 75, 77, 78, 82, 84, 85, 89, 64, 61, 59, 58, 57, 56, 55, 58, 59, 61, 64,
+            65, 68, 71, 72, 75, 78, 79, 82, 85, 86, 89, 90, 65, 61, 60, 58, 57, 56, 55, 58, 59, 61, 64, 65,
+            68, 71, 72, 75, 78, 79, 83, 85, 86, 90, 91, 91, 67, 63, 61, 60, 59, 58, 57, 60, 61, 63, 65, 66,
+            69, 72, 73, 77, 79, 80, 84, 86, 88, 92, 93, 93, 95, 68, 64, 63, 61, 60, 59, 58, 60, 61, 63, 65,
+            67, 70, 71, 74, 76, 78, 81, 83, 86, 88, 89, 94, 94, 95, 97, 68, 65, 64, 62, 61, 60, 58, 59, 61,
+            64, 64, 68, 69, 71, 74, 75, 79, 80, 83, 86, 87, 91, 92, 95, 96, 97, 99, 69, 66, 65, 63, 62, 61,
+            59, 59, 62, 63, 65, 67, 69, 72, 72, 76, 78, 80, 83, 84, 88, 89, 92, 94, 97, 98, 99, 101, 70, 67,
+            66, 63, 63, 62, 61, 60, 63, 63, 66, 67, 69, 71, 73, 76, 77, 81, 82, 85, 86, 90, 91, 94, 96, 99,
+            100, 100, 103, 71, 67, 67, 64, 64, 63, 62, 61, 62, 64, 66, 67, 70, 71, 74, 74, 78, 79, 83, 84, 87,
+            89, 91, 94, 95, 99, 100, 102, 102, 104, 72, 68, 68, 65, 65, 64, 63, 61, 62, 65, 66, 68, 69, 71, 73,
+            75, 77, 79, 82, 84, 87, 88, 92, 93, 96, 97, 101, 102, 104, 104, 106, 73, 69, 69, 66, 66, 64, 64, 62,
+            62, 66, 66, 69, 69, 72, 73, 76, 77, 81, 81, 85, 85, 89, 90, 94, 94, 99, 99, 104, 104, 106, 106, 108,
+        ],
+    ],
+    [  # level 3
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 33, 31, 32, 32, 32, 33, 33, 32, 32, 32,
+            32, 33, 34, 35, 32, 33, 33, 33, 34, 34, 36, 36, 34, 34, 34, 33, 35, 35, 37, 38, 39, 35, 35, 34,
+            34, 36, 36, 38, 39, 42, 46, 36, 35, 35, 34, 36, 36, 38, 40, 42, 47, 48, 39, 38, 38, 37, 39, 39,
+            40, 42, 45, 49, 50, 54, 41, 40, 39, 38, 40, 40, 41, 43, 46, 50, 52, 55, 57, 44, 42, 42, 41, 42,
+            42, 42, 44, 47, 52, 54, 58, 60, 63, 47, 45, 45, 44, 44, 45, 45, 47, 50, 55, 56, 60, 62, 66, 69,
+            48, 46, 45, 44, 45, 45, 46, 47, 51, 55, 57, 61, 63, 67, 70, 71, 54, 51, 50, 49, 49, 50, 49, 51,
+            54, 59, 60, 65, 67, 71, 75, 76, 82, 56, 53, 52, 51, 51, 51, 51, 53, 56, 60, 61, 66, 69, 73, 77,
+            78, 84, 86, 59, 56, 55, 54, 54, 54, 53, 55, 58, 62, 64, 69, 71, 75, 79, 80, 87, 89, 92, 64, 61,
+            60, 58, 58, 58, 57, 59, 62, 66, 67, 72, 75, 79, 83, 84, 91, 93, 97, 102, 65, 62, 61, 59, 59, 59,
+            58, 60, 63, 67, 68, 73, 75, 79, 84, 85, 92, 94, 98, 103, 105, 71, 68, 67, 65, 64, 64, 63, 65, 68,
+            72, 73, 78, 80, 84, 89, 90, 97, 100, 103, 109, 111, 117, 74, 71, 69, 68, 67, 67, 65, 67, 70, 74, 75,
+            80, 83, 86, 91, 93, 100, 102, 106, 112, 114, 120, 123, 80, 76, 74, 72, 71, 71, 69, 71, 74, 78, 79, 84,
+            86, 90, 95, 96, 104, 106, 110, 116, 118, 125, 128, 134, 82, 78, 76, 74, 73, 73, 71, 73, 76, 79, 80, 86,
+            88, 92, 97, 98, 106, 108, 112, 118, 120, 127, 131, 136, 139, 83, 78, 77, 75, 74, 74, 72, 73, 76, 80, 81,
+            86, 89, 92, 97, 99, 106, 109, 113, 119, 121, 128, 131, 137, 139, 140, 87, 83, 81, 79, 78, 78, 75, 77, 80,
+            83, 85, 90, 92, 96, 100, 102, 110, 112, 117, 122, 125, 133, 135, 142, 144, 145, 150, 90, 85, 84, 81, 80, 80,
+            78, 78, 82, 84, 87, 91, 93, 98, 99, 106, 108, 113, 118, 121, 129, 130, 137, 141, 147, 150, 151, 156, 92, 88,
+            87, 84, 83, 82, 80, 80, 84, 85, 90, 91, 95, 98, 102, 106, 109, 115, 117, 125, 126, 134, 137, 142, 148, 152,
+            155, 156, 162, 95, 90, 89, 86, 85, 84, 83, 82, 85, 87, 91, 92, 97, 98, 105, 105, 112, 114, 121, 123, 129,
+            133, 138, 143, 147, 155, 158, 161, 162, 168, 97, 92, 92, 88, 88, 86, 86, 84, 85, 90, 91, 95, 97, 101, 104,
+            108, 112, 116, 121, 125, 130, 133, 140, 143, 150, 152, 162, 164, 168, 168, 174, 100, 95, 95, 90, 90, 89, 89, 86,
+            86, 92, 92, 97, 98, 104, 104, 111, 111, 119, 119, 128, 129, 137, 137, 147, 148, 157, 158, 169, 170, 174, 175, 181,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 30, 31, 31, 32, 33, 34, 34, 34, 37, 33, 34, 35, 35, 38, 39, 36, 38, 39,
+            40, 42, 43, 47, 38, 40, 40, 41, 43, 44, 47, 47, 41, 42, 42, 42, 44, 45, 47, 48, 48, 47, 46, 46,
+            45, 46, 47, 47, 48, 50, 52, 49, 47, 47, 46, 47, 47, 48, 49, 50, 52, 53, 48, 47, 46, 45, 46, 46,
+            46, 48, 49, 52, 53, 54, 49, 47, 46, 45, 46, 46, 46, 47, 49, 52, 53, 55, 55, 49, 47, 46, 45, 45,
+            45, 45, 47, 49, 52, 53, 55, 57, 58, 50, 48, 47, 46, 46, 46, 46, 47, 50, 53, 54, 56, 57, 59, 61,
+            50, 48, 47, 46, 46, 46, 46, 47, 50, 53, 54, 56, 58, 60, 61, 61, 52, 50, 49, 47, 47, 47, 47, 48,
+            50, 53, 54, 57, 59, 61, 63, 63, 66, 53, 50, 50, 48, 48, 48, 47, 49, 51, 54, 55, 58, 59, 62, 64,
+            64, 67, 68, 54, 52, 51, 49, 49, 49, 48, 49, 52, 55, 55, 58, 60, 62, 64, 65, 68, 69, 71, 56, 54,
+            53, 51, 51, 51, 49, 51, 53, 55, 56, 59, 61, 63, 66, 66, 70, 71, 73, 75, 57, 54, 53, 52, 51, 51,
+            50, 51, 53, 56, 56, 60, 61, 63, 66, 67, 70, 71, 73, 76, 76, 60, 57, 56, 54, 53, 53, 52, 53, 55,
+            58, 58, 61, 63, 65, 68, 68, 72, 73, 75, 78, 79, 82, 61, 58, 57, 55, 55, 54, 53, 54, 56, 58, 59,
+            62, 64, 66, 69, 69, 73, 74, 76, 79, 80, 83, 84, 63, 60, 59, 57, 56, 56, 54, 55, 57, 60, 60, 63,
+            65, 67, 70, 71, 75, 76, 78, 81, 82, 85, 86, 89, 64, 61, 60, 58, 57, 57, 55, 56, 58, 60, 61, 64,
+            66, 68, 70, 71, 75, 77, 79, 82, 82, 86, 87, 90, 91, 65, 61, 60, 58, 57, 57, 55, 56, 58, 61, 61,
+            64, 66, 68, 71, 71, 75, 77, 79, 82, 83, 86, 88, 90, 91, 91, 67, 63, 62, 60, 59, 59, 57, 58, 60,
+            62, 63, 66, 67, 69, 72, 73, 77, 78, 80, 83, 84, 88, 89, 92, 93, 93, 95, 67, 64, 63, 61, 60, 60,
+            58, 58, 61, 61, 63, 65, 67, 70, 70, 74, 75, 78, 80, 81, 85, 86, 89, 91, 93, 94, 95, 97, 68, 65,
+            64, 62, 61, 60, 59, 58, 61, 61, 64, 65, 67, 69, 71, 73, 75, 78, 79, 83, 83, 87, 88, 91, 93, 95,
+            96, 97, 99, 69, 65, 65, 62, 62, 61, 60, 59, 61, 62, 64, 65, 68, 68, 72, 72, 76, 76, 80, 81, 84,
+            86, 88, 90, 92, 95, 96, 98, 98, 100, 70, 66, 66, 63, 63, 62, 61, 60, 60, 63, 64, 66, 67, 69, 71,
+            73, 75, 77, 79, 81, 84, 85, 88, 89, 93, 93, 97, 98, 100, 100, 102, 71, 67, 67, 64, 64, 62, 62, 60,
+            60, 64, 64, 67, 67, 70, 70, 74, 74, 78, 78, 82, 82, 86, 86, 91, 91, 95, 95, 100, 100, 101, 101, 104,
+        ],
+    ],
+    [  # level 4
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 32, 31, 32, 32, 32, 33, 33, 32, 32, 32,
+            32, 33, 33, 34, 32, 32, 32, 32, 33, 34, 35, 35, 33, 33, 33, 33, 34, 35, 36, 36, 38, 34, 34, 34,
+            33, 34, 35, 36, 37, 39, 39, 36, 35, 35, 34, 35, 36, 37, 38, 42, 42, 48, 36, 35, 35, 34, 35, 36,
+            38, 38, 42, 43, 48, 49, 39, 38, 38, 37, 38, 39, 40, 40, 44, 45, 50, 51, 54, 41, 39, 39, 38, 39,
+            40, 40, 41, 45, 46, 51, 52, 55, 56, 44, 42, 42, 41, 41, 42, 42, 42, 46, 47, 54, 54, 58, 59, 63,
+            46, 44, 44, 42, 43, 44, 44, 44, 48, 49, 55, 55, 59, 61, 65, 67, 48, 46, 46, 44, 45, 45, 45, 46,
+            50, 51, 57, 57, 61, 63, 67, 69, 71, 52, 50, 49, 48, 48, 48, 48, 48, 52, 53, 59, 59, 64, 65, 70,
+            72, 74, 78, 54, 51, 51, 49, 49, 50, 49, 49, 53, 54, 60, 60, 65, 67, 71, 74, 76, 80, 82, 58, 56,
+            55, 53, 53, 53, 53, 53, 57, 58, 63, 64, 68, 70, 75, 77, 80, 84, 86, 91, 59, 56, 56, 54, 54, 54,
+            53, 53, 57, 58, 64, 64, 69, 70, 75, 78, 80, 85, 87, 91, 92, 65, 62, 61, 59, 59, 59, 58, 58, 62,
+            63, 68, 68, 73, 75, 79, 82, 85, 90, 92, 97, 98, 105, 66, 63, 63, 60, 60, 60, 59, 59, 63, 64, 69,
+            69, 74, 76, 80, 83, 86, 91, 93, 98, 99, 106, 107, 71, 68, 67, 65, 65, 64, 63, 63, 67, 68, 73, 73,
+            78, 80, 84, 87, 90, 95, 97, 103, 103, 111, 112, 117, 74, 71, 70, 68, 67, 67, 66, 65, 69, 70, 75, 75,
+            80, 82, 86, 89, 93, 97, 100, 105, 106, 114, 115, 120, 123, 80, 76, 75, 72, 72, 71, 70, 69, 73, 74, 79,
+            79, 84, 86, 90, 93, 96, 101, 104, 110, 110, 118, 119, 125, 128, 134, 81, 77, 77, 74, 73, 73, 71, 71, 74,
+            75, 80, 80, 85, 87, 91, 94, 98, 103, 105, 111, 112, 120, 121, 127, 130, 136, 137, 83, 78, 78, 75, 74, 74,
+            72, 72, 75, 76, 81, 81, 86, 88, 92, 95, 99, 104, 106, 112, 113, 121, 122, 128, 131, 137, 139, 140, 86, 82,
+            81, 78, 77, 77, 75, 74, 78, 79, 84, 84, 89, 91, 95, 98, 101, 106, 109, 115, 116, 124, 125, 131, 135, 140,
+            142, 144, 147, 89, 84, 84, 80, 80, 79, 78, 77, 79, 81, 85, 86, 91, 92, 97, 98, 104, 106, 112, 114, 119,
+            123, 128, 132, 135, 142, 145, 148, 149, 153, 91, 86, 86, 82, 82, 81, 80, 79, 80, 84, 85, 88, 91, 94, 97,
+            100, 104, 107, 112, 115, 120, 123, 129, 132, 138, 140, 148, 150, 153, 154, 159, 93, 88, 88, 84, 84, 83, 83, 80,
+            81, 86, 86, 91, 91, 96, 97, 103, 103, 110, 110, 118, 119, 126, 126, 135, 136, 144, 144, 155, 155, 159, 159, 164,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 30, 31, 31, 32, 31, 32, 32, 33, 34, 33, 34, 35, 35, 37, 39, 35, 37, 37,
+            38, 39, 41, 44, 36, 38, 39, 40, 41, 43, 46, 47, 40, 41, 41, 42, 43, 44, 46, 47, 48, 41, 42, 42,
+            42, 43, 45, 46, 47, 48, 48, 49, 47, 47, 46, 46, 47, 47, 48, 50, 50, 53, 49, 47, 47, 46, 46, 47,
+            47, 47, 49, 50, 53, 53, 48, 47, 47, 45, 46, 46, 46, 46, 49, 49, 53, 53, 54, 48, 47, 46, 45, 45,
+            46, 46, 46, 49, 49, 53, 53, 54, 55, 49, 47, 46, 45, 45, 45, 45, 45, 48, 49, 53, 54, 55, 56, 58,
+            50, 47, 47, 45, 46, 46, 46, 46, 49, 49, 54, 54, 56, 57, 59, 60, 50, 48, 48, 46, 46, 46, 46, 46,
+            49, 50, 54, 54, 56, 57, 60, 60, 61, 52, 49, 49, 47, 47, 47, 47, 46, 49, 50, 54, 54, 57, 58, 61,
+            62, 63, 65, 52, 50, 49, 47, 47, 47, 47, 47, 49, 50, 54, 54, 57, 58, 61, 62, 63, 65, 66, 54, 52,
+            51, 49, 49, 49, 48, 48, 51, 52, 55, 55, 58, 59, 62, 63, 65, 67, 68, 70, 54, 52, 51, 49, 49, 49,
+            48, 48, 51, 52, 55, 56, 58, 60, 62, 64, 65, 67, 68, 70, 71, 57, 54, 54, 52, 51, 51, 50, 50, 52,
+            53, 56, 57, 60, 61, 63, 65, 67, 69, 70, 73, 73, 76, 57, 55, 54, 52, 52, 51, 51, 50, 53, 53, 57,
+            57, 60, 61, 64, 65, 67, 70, 71, 73, 74, 77, 77, 60, 57, 56, 54, 54, 53, 52, 52, 54, 55, 58, 59,
+            61, 63, 65, 67, 68, 71, 72, 75, 75, 79, 79, 82, 61, 58, 57, 55, 55, 54, 53, 53, 55, 56, 59, 59,
+            62, 63, 66, 68, 69, 72, 73, 76, 76, 80, 80, 83, 84, 63, 60, 59, 57, 57, 56, 55, 54, 57, 57, 60,
+            61, 63, 65, 67, 69, 71, 73, 75, 78, 78, 82, 82, 85, 86, 89, 64, 61, 60, 58, 57, 57, 56, 55, 57,
+            58, 61, 61, 64, 65, 68, 69, 71, 74, 75, 78, 78, 82, 83, 86, 87, 89, 90, 65, 61, 61, 58, 58, 57,
+            56, 55, 58, 58, 61, 62, 64, 65, 68, 70, 71, 74, 75, 78, 79, 83, 83, 86, 88, 90, 91, 91, 66, 63,
+            62, 60, 59, 58, 57, 56, 59, 59, 62, 63, 65, 66, 69, 70, 72, 75, 76, 79, 80, 84, 84, 87, 89, 91,
+            92, 93, 94, 67, 64, 63, 61, 60, 59, 58, 57, 59, 60, 62, 63, 66, 66, 70, 70, 73, 74, 77, 78, 81,
+            83, 85, 87, 89, 92, 93, 94, 94, 96, 68, 64, 64, 61, 61, 60, 59, 58, 59, 61, 62, 64, 65, 67, 69,
+            71, 72, 74, 77, 78, 81, 82, 85, 86, 89, 90, 94, 94, 96, 96, 98, 69, 65, 65, 62, 62, 61, 61, 58,
+            59, 62, 62, 65, 65, 68, 68, 71, 71, 75, 75, 79, 79, 83, 83, 87, 87, 91, 91, 96, 96, 97, 97, 99,
+        ],
+    ],
+    [  # level 5
+        [  # luma
+            32, 31, 32, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 32, 31, 32, 32, 32, 32, 33, 31, 32, 32,
+            32, 32, 33, 33, 32, 32, 32, 32, 32, 34, 34, 35, 32, 32, 32, 32, 32, 34, 34, 35, 35, 34, 34, 34,
+            33, 33, 35, 35, 37, 37, 39, 34, 34, 34, 33, 33, 35, 35, 37, 37, 39, 39, 36, 35, 35, 34, 34, 36,
+            36, 38, 38, 42, 42, 48, 36, 35, 35, 34, 34, 36, 36, 38, 38, 42, 42, 48, 48, 39, 38, 38, 37, 37,
+            39, 39, 40, 40, 45, 45, 50, 50, 54, 39, 38, 38, 37, 37, 39, 39, 40, 40, 45, 45, 50, 50, 54, 54,
+            44, 42, 42, 41, 41, 42, 42, 42, 42, 47, 47, 54, 54, 58, 58, 63, 44, 42, 42, 41, 41, 42, 42, 42,
+            42, 47, 47, 54, 54, 58, 58, 63, 63, 48, 46, 46, 44, 44, 45, 45, 46, 46, 51, 51, 57, 57, 61, 61,
+            67, 67, 71, 48, 46, 46, 44, 44, 45, 45, 46, 46, 51, 51, 57, 57, 61, 61, 67, 67, 71, 71, 54, 51,
+            51, 49, 49, 50, 50, 49, 49, 54, 54, 60, 60, 65, 65, 71, 71, 76, 76, 82, 54, 51, 51, 49, 49, 50,
+            50, 49, 49, 54, 54, 60, 60, 65, 65, 71, 71, 76, 76, 82, 82, 59, 56, 56, 54, 54, 54, 54, 53, 53,
+            58, 58, 64, 64, 69, 69, 75, 75, 80, 80, 87, 87, 92, 59, 56, 56, 54, 54, 54, 54, 53, 53, 58, 58,
+            64, 64, 69, 69, 75, 75, 80, 80, 87, 87, 92, 92, 65, 62, 62, 59, 59, 59, 59, 58, 58, 63, 63, 68,
+            68, 73, 73, 79, 79, 85, 85, 92, 92, 98, 98, 105, 65, 62, 62, 59, 59, 59, 59, 58, 58, 63, 63, 68,
+            68, 73, 73, 79, 79, 85, 85, 92, 92, 98, 98, 105, 105, 71, 68, 68, 65, 65, 64, 64, 63, 63, 68, 68,
+            73, 73, 78, 78, 84, 84, 90, 90, 97, 97, 103, 103, 111, 111, 117, 71, 68, 68, 65, 65, 64, 64, 63, 63,
+            68, 68, 73, 73, 78, 78, 84, 84, 90, 90, 97, 97, 103, 103, 111, 111, 117, 117, 80, 76, 76, 72, 72, 71,
+            71, 69, 69, 74, 74, 79, 79, 84, 84, 90, 90, 96, 96, 104, 104, 110, 110, 118, 118, 125, 125, 134, 80, 76,
+            76, 72, 72, 71, 71, 69, 69, 74, 74, 79, 79, 84, 84, 90, 90, 96, 96, 104, 104, 110, 110, 118, 118, 125,
+            125, 134, 134, 83, 78, 78, 75, 75, 74, 74, 72, 72, 76, 76, 81, 81, 86, 86, 92, 92, 99, 99, 106, 106,
+            113, 113, 121, 121, 128, 128, 137, 137, 140, 83, 78, 78, 75, 75, 74, 74, 72, 72, 76, 76, 81, 81, 86, 86,
+            92, 92, 99, 99, 106, 106, 113, 113, 121, 121, 128, 128, 137, 137, 140, 140, 87, 83, 83, 79, 79, 77, 77, 75,
+            75, 80, 80, 84, 84, 90, 90, 96, 96, 102, 102, 109, 109, 116, 116, 124, 124, 132, 132, 141, 141, 144, 144, 149,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 30, 31, 31, 32, 30, 31, 31, 32, 32, 33, 34, 34, 35, 35, 39, 33, 34, 34,
+            35, 35, 39, 39, 36, 38, 38, 40, 40, 43, 43, 47, 36, 38, 38, 40, 40, 43, 43, 47, 47, 41, 42, 42,
+            42, 42, 45, 45, 47, 47, 48, 41, 42, 42, 42, 42, 45, 45, 47, 47, 48, 48, 49, 47, 47, 46, 46, 47,
+            47, 48, 48, 50, 50, 53, 49, 47, 47, 46, 46, 47, 47, 48, 48, 50, 50, 53, 53, 48, 47, 47, 45, 45,
+            46, 46, 46, 46, 49, 49, 53, 53, 54, 48, 47, 47, 45, 45, 46, 46, 46, 46, 49, 49, 53, 53, 54, 54,
+            49, 47, 47, 45, 45, 45, 45, 45, 45, 49, 49, 53, 53, 55, 55, 58, 49, 47, 47, 45, 45, 45, 45, 45,
+            45, 49, 49, 53, 53, 55, 55, 58, 58, 50, 48, 48, 46, 46, 46, 46, 46, 46, 50, 50, 54, 54, 56, 56,
+            60, 60, 61, 50, 48, 48, 46, 46, 46, 46, 46, 46, 50, 50, 54, 54, 56, 56, 60, 60, 61, 61, 52, 50,
+            50, 47, 47, 47, 47, 47, 47, 50, 50, 54, 54, 57, 57, 61, 61, 63, 63, 66, 52, 50, 50, 47, 47, 47,
+            47, 47, 47, 50, 50, 54, 54, 57, 57, 61, 61, 63, 63, 66, 66, 54, 52, 52, 49, 49, 49, 49, 48, 48,
+            52, 52, 55, 55, 58, 58, 62, 62, 65, 65, 68, 68, 71, 54, 52, 52, 49, 49, 49, 49, 48, 48, 52, 52,
+            55, 55, 58, 58, 62, 62, 65, 65, 68, 68, 71, 71, 57, 54, 54, 52, 52, 51, 51, 50, 50, 53, 53, 56,
+            56, 60, 60, 63, 63, 67, 67, 70, 70, 73, 73, 76, 57, 54, 54, 52, 52, 51, 51, 50, 50, 53, 53, 56,
+            56, 60, 60, 63, 63, 67, 67, 70, 70, 73, 73, 76, 76, 60, 57, 57, 54, 54, 53, 53, 52, 52, 55, 55,
+            58, 58, 61, 61, 65, 65, 68, 68, 72, 72, 75, 75, 79, 79, 82, 60, 57, 57, 54, 54, 53, 53, 52, 52,
+            55, 55, 58, 58, 61, 61, 65, 65, 68, 68, 72, 72, 75, 75, 79, 79, 82, 82, 63, 60, 60, 57, 57, 56,
+            56, 54, 54, 57, 57, 60, 60, 63, 63, 67, 67, 71, 71, 75, 75, 78, 78, 82, 82, 85, 85, 89, 63, 60,
+            60, 57, 57, 56, 56, 54, 54, 57, 57, 60, 60, 63, 63, 67, 67, 71, 71, 75, 75, 78, 78, 82, 82, 85,
+            85, 89, 89, 65, 61, 61, 58, 58, 57, 57, 55, 55, 58, 58, 61, 61, 64, 64, 68, 68, 71, 71, 75, 75,
+            79, 79, 83, 83, 86, 86, 90, 90, 91, 65, 61, 61, 58, 58, 57, 57, 55, 55, 58, 58, 61, 61, 64, 64,
+            68, 68, 71, 71, 75, 75, 79, 79, 83, 83, 86, 86, 90, 90, 91, 91, 67, 63, 63, 60, 60, 59, 59, 57,
+            57, 60, 60, 62, 62, 66, 66, 69, 69, 72, 72, 76, 76, 80, 80, 84, 84, 88, 88, 92, 92, 93, 93, 95,
+        ],
+    ],
+    [  # level 6
+        [  # luma
+            32, 31, 31, 31, 32, 32, 31, 32, 32, 32, 31, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 31, 32, 32,
+            32, 32, 33, 33, 32, 32, 32, 32, 32, 33, 33, 34, 32, 32, 32, 32, 32, 33, 34, 34, 35, 32, 32, 32,
+            32, 33, 33, 34, 34, 35, 35, 34, 34, 34, 33, 33, 34, 35, 35, 37, 37, 39, 34, 34, 34, 33, 33, 34,
+            35, 35, 37, 37, 39, 39, 35, 35, 35, 34, 34, 35, 36, 36, 38, 38, 42, 42, 46, 36, 35, 35, 34, 34,
+            35, 36, 37, 38, 38, 42, 42, 47, 48, 38, 37, 37, 36, 36, 37, 38, 38, 39, 40, 44, 44, 48, 50, 51,
+            39, 38, 38, 38, 37, 38, 39, 39, 40, 41, 45, 45, 49, 50, 52, 54, 41, 40, 40, 39, 38, 39, 40, 40,
+            41, 41, 46, 46, 50, 52, 54, 55, 57, 44, 42, 42, 41, 41, 41, 42, 42, 42, 43, 47, 47, 52, 54, 56,
+            58, 60, 63, 45, 43, 43, 42, 41, 42, 42, 43, 43, 43, 48, 48, 53, 54, 57, 58, 60, 64, 65, 48, 46,
+            46, 45, 44, 45, 45, 45, 46, 46, 51, 51, 55, 57, 59, 61, 63, 67, 68, 71, 48, 46, 46, 45, 44, 45,
+            45, 45, 46, 46, 51, 51, 55, 57, 59, 61, 63, 67, 68, 71, 71, 53, 51, 51, 49, 49, 49, 49, 49, 49,
+            49, 54, 54, 58, 59, 62, 64, 67, 71, 72, 75, 75, 81, 54, 52, 51, 50, 49, 49, 50, 49, 49, 50, 54,
+            54, 59, 60, 63, 65, 67, 71, 72, 76, 76, 81, 82, 57, 55, 55, 53, 52, 52, 52, 52, 52, 52, 57, 57,
+            61, 62, 65, 67, 70, 74, 75, 79, 79, 85, 85, 89, 59, 56, 56, 54, 54, 54, 54, 54, 53, 54, 58, 58,
+            62, 64, 67, 69, 71, 75, 76, 80, 80, 86, 87, 90, 92, 62, 59, 59, 57, 56, 56, 56, 56, 55, 56, 60,
+            60, 64, 66, 69, 71, 73, 77, 78, 83, 83, 89, 89, 93, 95, 98, 65, 62, 62, 60, 59, 59, 59, 59, 58,
+            58, 63, 63, 67, 68, 71, 73, 75, 79, 81, 85, 85, 91, 92, 96, 98, 101, 105, 67, 64, 64, 62, 61, 61,
+            60, 60, 59, 60, 64, 64, 68, 69, 72, 74, 77, 81, 82, 87, 87, 93, 94, 98, 99, 103, 106, 108, 71, 68,
+            68, 66, 65, 64, 64, 64, 63, 63, 68, 68, 72, 73, 76, 78, 80, 84, 85, 90, 90, 97, 97, 102, 103, 107,
+            111, 113, 117, 72, 69, 69, 66, 65, 65, 65, 64, 63, 64, 68, 68, 72, 73, 76, 78, 81, 85, 86, 91, 91,
+            97, 98, 102, 104, 108, 111, 113, 118, 119, 80, 76, 76, 73, 72, 72, 71, 70, 69, 70, 74, 74, 78, 79, 82,
+            84, 86, 90, 91, 96, 96, 103, 104, 108, 110, 114, 118, 120, 125, 126, 134, 80, 76, 76, 73, 72, 72, 71, 70,
+            69, 70, 74, 74, 78, 79, 82, 84, 86, 90, 91, 96, 96, 103, 104, 108, 110, 114, 118, 120, 125, 126, 134, 134,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 30, 31, 31, 31, 30, 31, 31, 31, 32, 32, 32, 33, 33, 33, 35, 33, 34, 34,
+            35, 35, 37, 39, 34, 35, 35, 36, 36, 38, 40, 41, 36, 38, 38, 39, 40, 41, 43, 44, 47, 37, 38, 39,
+            40, 40, 42, 43, 44, 47, 47, 41, 42, 42, 42, 42, 43, 45, 45, 47, 47, 48, 41, 42, 42, 42, 42, 43,
+            45, 45, 47, 47, 48, 48, 47, 46, 46, 46, 45, 46, 47, 47, 47, 48, 50, 50, 52, 49, 48, 47, 47, 46,
+            47, 47, 47, 48, 48, 50, 50, 52, 53, 49, 47, 47, 46, 46, 46, 46, 47, 47, 47, 50, 50, 52, 53, 53,
+            48, 47, 47, 46, 45, 46, 46, 46, 46, 47, 49, 49, 52, 53, 54, 54, 49, 47, 47, 46, 45, 45, 46, 46,
+            46, 46, 49, 49, 52, 53, 54, 55, 55, 49, 47, 47, 45, 45, 45, 45, 45, 45, 45, 49, 49, 52, 53, 55,
+            55, 57, 58, 49, 47, 47, 46, 45, 45, 45, 45, 45, 46, 49, 49, 52, 53, 55, 56, 57, 59, 59, 50, 48,
+            48, 47, 46, 46, 46, 46, 46, 46, 50, 50, 53, 54, 55, 56, 58, 60, 60, 61, 50, 48, 48, 47, 46, 46,
+            46, 46, 46, 46, 50, 50, 53, 54, 55, 56, 58, 60, 60, 61, 61, 52, 50, 49, 48, 47, 47, 47, 47, 46,
+            47, 50, 50, 53, 54, 56, 57, 59, 61, 61, 63, 63, 66, 52, 50, 50, 48, 47, 47, 47, 47, 47, 47, 50,
+            50, 53, 54, 56, 57, 59, 61, 61, 63, 63, 66, 66, 54, 51, 51, 50, 49, 49, 49, 48, 48, 48, 51, 51,
+            54, 55, 57, 58, 60, 62, 62, 65, 65, 67, 68, 69, 54, 52, 52, 50, 49, 49, 49, 49, 48, 48, 52, 52,
+            55, 55, 57, 58, 60, 62, 63, 65, 65, 68, 68, 70, 71, 56, 53, 53, 51, 51, 50, 50, 50, 49, 49, 52,
+            52, 55, 56, 58, 59, 61, 63, 63, 66, 66, 69, 69, 71, 72, 73, 57, 54, 54, 52, 52, 51, 51, 51, 50,
+            50, 53, 53, 56, 56, 58, 60, 61, 63, 64, 67, 67, 70, 70, 72, 73, 75, 76, 58, 55, 55, 53, 52, 52,
+            52, 51, 50, 51, 54, 54, 56, 57, 59, 60, 62, 64, 65, 67, 67, 71, 71, 73, 74, 75, 77, 78, 60, 57,
+            57, 55, 54, 54, 53, 53, 52, 52, 55, 55, 58, 58, 60, 61, 63, 65, 66, 68, 68, 72, 72, 74, 75, 77,
+            79, 80, 82, 60, 57, 57, 55, 54, 54, 54, 53, 52, 52, 55, 55, 58, 58, 60, 62, 63, 65, 66, 69, 69,
+            72, 73, 75, 76, 77, 79, 80, 82, 82, 63, 60, 60, 58, 57, 57, 56, 55, 54, 55, 57, 57, 60, 60, 62,
+            63, 65, 67, 68, 71, 71, 74, 75, 77, 78, 80, 82, 83, 85, 85, 89, 63, 60, 60, 58, 57, 57, 56, 55,
+            54, 55, 57, 57, 60, 60, 62, 63, 65, 67, 68, 71, 71, 74, 75, 77, 78, 80, 82, 83, 85, 85, 89, 89,
+        ],
+    ],
+    [  # level 7
+        [  # luma
+            32, 31, 31, 31, 31, 32, 31, 32, 32, 32, 31, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 31, 32, 32,
+            32, 32, 32, 33, 31, 32, 32, 32, 32, 32, 33, 33, 32, 32, 32, 32, 32, 32, 33, 33, 34, 32, 32, 32,
+            32, 32, 32, 33, 34, 34, 35, 32, 32, 32, 32, 32, 32, 33, 34, 34, 35, 35, 33, 33, 33, 33, 33, 33,
+            34, 35, 35, 36, 36, 38, 34, 34, 34, 34, 33, 33, 35, 35, 36, 37, 37, 39, 39, 34, 34, 34, 34, 34,
+            34, 35, 36, 36, 37, 37, 40, 41, 42, 36, 35, 35, 35, 34, 34, 36, 36, 37, 38, 38, 42, 42, 45, 48,
+            36, 35, 35, 35, 34, 34, 36, 36, 37, 38, 38, 42, 42, 45, 48, 48, 38, 38, 38, 37, 37, 37, 38, 38,
+            39, 40, 40, 43, 44, 46, 50, 50, 52, 39, 38, 38, 38, 37, 37, 39, 39, 39, 40, 40, 44, 45, 47, 50,
+            50, 53, 54, 41, 40, 40, 39, 38, 38, 40, 40, 40, 41, 41, 45, 46, 48, 52, 52, 54, 55, 57, 44, 42,
+            42, 42, 41, 41, 42, 42, 42, 42, 42, 46, 47, 50, 54, 54, 57, 58, 60, 63, 44, 42, 42, 42, 41, 41,
+            42, 42, 42, 42, 42, 46, 47, 50, 54, 54, 57, 58, 60, 63, 63, 47, 46, 45, 45, 44, 44, 44, 45, 45,
+            45, 45, 49, 50, 52, 56, 56, 59, 60, 62, 66, 66, 69, 48, 47, 46, 45, 44, 44, 45, 45, 45, 46, 46,
+            50, 51, 53, 57, 57, 60, 61, 63, 67, 67, 70, 71, 50, 49, 48, 47, 46, 46, 47, 47, 47, 47, 47, 51,
+            52, 54, 58, 58, 61, 62, 65, 68, 68, 72, 73, 75, 54, 52, 51, 50, 49, 49, 49, 50, 49, 49, 49, 53,
+            54, 56, 60, 60, 64, 65, 67, 71, 71, 75, 76, 78, 82, 54, 52, 51, 50, 49, 49, 49, 50, 49, 49, 49,
+            53, 54, 56, 60, 60, 64, 65, 67, 71, 71, 75, 76, 78, 82, 82, 58, 56, 55, 54, 53, 53, 53, 53, 53,
+            52, 52, 56, 57, 59, 63, 63, 67, 68, 70, 74, 74, 78, 79, 82, 86, 86, 90, 59, 57, 56, 55, 54, 54,
+            54, 54, 54, 53, 53, 57, 58, 60, 64, 64, 68, 69, 71, 75, 75, 79, 80, 83, 87, 87, 91, 92, 61, 59,
+            58, 57, 56, 56, 56, 56, 55, 55, 55, 59, 60, 62, 65, 65, 69, 70, 73, 77, 77, 81, 82, 85, 89, 89,
+            93, 94, 97, 65, 63, 62, 61, 59, 59, 59, 59, 59, 58, 58, 62, 63, 65, 68, 68, 72, 73, 75, 79, 79,
+            84, 85, 88, 92, 92, 97, 98, 101, 105, 65, 63, 62, 61, 59, 59, 59, 59, 59, 58, 58, 62, 63, 65, 68,
+            68, 72, 73, 75, 79, 79, 84, 85, 88, 92, 92, 97, 98, 101, 105, 105, 70, 67, 67, 65, 64, 64, 63, 63,
+            63, 62, 62, 66, 67, 69, 72, 72, 76, 77, 79, 83, 83, 88, 89, 92, 96, 96, 101, 102, 105, 109, 109, 114,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31, 31, 32, 30, 31, 31, 31, 32, 32, 33, 33, 34,
+            34, 34, 34, 37, 33, 34, 34, 35, 35, 35, 38, 39, 34, 36, 36, 36, 37, 37, 40, 40, 42, 36, 38, 38,
+            39, 40, 40, 42, 43, 45, 47, 36, 38, 38, 39, 40, 40, 42, 43, 45, 47, 47, 40, 41, 41, 41, 42, 42,
+            44, 44, 45, 47, 47, 48, 41, 42, 42, 42, 42, 42, 44, 45, 46, 47, 47, 48, 48, 44, 44, 44, 44, 44,
+            44, 45, 46, 46, 47, 47, 49, 49, 50, 49, 48, 47, 47, 46, 46, 47, 47, 47, 48, 48, 50, 50, 51, 53,
+            49, 48, 47, 47, 46, 46, 47, 47, 47, 48, 48, 50, 50, 51, 53, 53, 48, 47, 47, 46, 45, 45, 46, 46,
+            46, 47, 47, 49, 50, 51, 53, 53, 54, 48, 47, 47, 46, 45, 45, 46, 46, 46, 46, 46, 49, 49, 51, 53,
+            53, 54, 54, 49, 47, 47, 46, 45, 45, 46, 46, 46, 46, 46, 49, 49, 51, 53, 53, 54, 55, 55, 49, 47,
+            47, 46, 45, 45, 45, 45, 45, 45, 45, 48, 49, 51, 53, 53, 55, 55, 57, 58, 49, 47, 47, 46, 45, 45,
+            45, 45, 45, 45, 45, 48, 49, 51, 53, 53, 55, 55, 57, 58, 58, 50, 48, 48, 47, 46, 46, 46, 46, 46,
+            46, 46, 49, 50, 51, 54, 54, 56, 56, 57, 59, 59, 61, 50, 49, 48, 47, 46, 46, 46, 46, 46, 46, 46,
+            49, 50, 51, 54, 54, 56, 56, 58, 60, 60, 61, 61, 51, 49, 49, 48, 47, 47, 47, 47, 47, 46, 46, 49,
+            50, 51, 54, 54, 56, 57, 58, 60, 60, 62, 62, 63, 52, 50, 50, 49, 47, 47, 47, 47, 47, 47, 47, 49,
+            50, 52, 54, 54, 57, 57, 59, 61, 61, 63, 63, 65, 66, 52, 50, 50, 49, 47, 47, 47, 47, 47, 47, 47,
+            49, 50, 52, 54, 54, 57, 57, 59, 61, 61, 63, 63, 65, 66, 66, 54, 52, 51, 50, 49, 49, 49, 49, 48,
+            48, 48, 51, 51, 53, 55, 55, 58, 58, 60, 62, 62, 64, 65, 66, 68, 68, 70, 54, 52, 52, 51, 49, 49,
+            49, 49, 49, 48, 48, 51, 52, 53, 55, 55, 58, 58, 60, 62, 62, 64, 65, 66, 68, 68, 70, 71, 55, 53,
+            53, 52, 50, 50, 50, 50, 49, 49, 49, 51, 52, 54, 56, 56, 58, 59, 60, 63, 63, 65, 66, 67, 69, 69,
+            71, 72, 73, 57, 55, 54, 53, 52, 52, 51, 51, 50, 50, 50, 52, 53, 54, 56, 56, 59, 60, 61, 63, 63,
+            66, 67, 68, 70, 70, 73, 73, 74, 76, 57, 55, 54, 53, 52, 52, 51, 51, 50, 50, 50, 52, 53, 54, 56,
+            56, 59, 60, 61, 63, 63, 66, 67, 68, 70, 70, 73, 73, 74, 76, 76, 59, 57, 56, 55, 54, 54, 53, 53,
+            52, 51, 51, 54, 55, 56, 58, 58, 60, 61, 63, 65, 65, 67, 68, 70, 72, 72, 74, 75, 76, 78, 78, 80,
+        ],
+    ],
+    [  # level 8
+        [  # luma
+            32, 31, 31, 31, 31, 32, 31, 31, 32, 32, 31, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 31, 32, 32,
+            32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 33, 31, 32, 32, 32, 32, 32, 32, 33, 33, 32, 32, 32,
+            32, 32, 32, 33, 33, 33, 34, 32, 32, 32, 32, 32, 32, 33, 34, 34, 34, 35, 32, 32, 32, 32, 32, 32,
+            33, 34, 34, 34, 35, 35, 32, 33, 33, 33, 33, 33, 33, 34, 34, 35, 36, 36, 36, 34, 34, 34, 34, 33,
+            33, 34, 35, 35, 35, 37, 37, 38, 39, 34, 34, 34, 34, 33, 33, 34, 35, 35, 35, 37, 37, 38, 39, 39,
+            35, 34, 34, 34, 34, 34, 34, 35, 36, 36, 37, 37, 39, 41, 41, 43, 36, 35, 35, 35, 34, 34, 35, 36,
+            36, 37, 38, 38, 40, 42, 42, 45, 48, 36, 35, 35, 35, 34, 34, 35, 36, 36, 37, 38, 38, 40, 42, 42,
+            45, 48, 48, 38, 37, 37, 37, 36, 36, 36, 38, 38, 38, 39, 39, 41, 44, 44, 47, 50, 50, 51, 39, 39,
+            38, 38, 37, 37, 38, 39, 39, 39, 40, 40, 42, 45, 45, 47, 50, 50, 52, 54, 39, 39, 38, 38, 37, 37,
+            38, 39, 39, 39, 40, 40, 42, 45, 45, 47, 50, 50, 52, 54, 54, 42, 41, 41, 41, 40, 40, 40, 41, 41,
+            41, 42, 42, 44, 47, 47, 49, 53, 53, 55, 56, 56, 60, 44, 43, 42, 42, 41, 41, 41, 42, 42, 42, 42,
+            42, 44, 47, 47, 50, 54, 54, 56, 58, 58, 61, 63, 44, 43, 43, 42, 41, 41, 41, 42, 42, 42, 43, 43,
+            45, 48, 48, 51, 54, 54, 56, 58, 58, 62, 64, 64, 47, 46, 45, 45, 44, 44, 44, 44, 45, 45, 45, 45,
+            47, 50, 50, 53, 56, 56, 58, 60, 60, 64, 66, 66, 69, 48, 47, 46, 46, 45, 44, 45, 45, 45, 45, 46,
+            46, 47, 51, 51, 53, 57, 57, 59, 61, 61, 65, 67, 67, 70, 71, 49, 48, 47, 47, 46, 45, 45, 46, 46,
+            46, 46, 46, 48, 51, 51, 54, 57, 57, 60, 62, 62, 66, 68, 68, 71, 72, 73, 53, 51, 51, 51, 49, 49,
+            49, 49, 49, 49, 49, 49, 51, 54, 54, 57, 59, 59, 62, 64, 64, 69, 71, 71, 74, 75, 77, 81, 54, 52,
+            51, 51, 50, 49, 49, 50, 50, 49, 49, 49, 51, 54, 54, 57, 60, 60, 63, 65, 65, 69, 71, 72, 75, 76,
+            77, 81, 82, 55, 53, 53, 52, 51, 50, 50, 51, 51, 51, 50, 50, 52, 55, 55, 58, 61, 61, 64, 66, 66,
+            70, 72, 73, 76, 77, 78, 83, 83, 85, 59, 57, 56, 56, 54, 54, 54, 54, 54, 54, 53, 53, 55, 58, 58,
+            61, 64, 64, 67, 69, 69, 73, 75, 76, 79, 80, 81, 86, 87, 88, 92, 59, 57, 56, 56, 54, 54, 54, 54,
+            54, 54, 53, 53, 55, 58, 58, 61, 64, 64, 67, 69, 69, 73, 75, 76, 79, 80, 81, 86, 87, 88, 92, 92,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31, 31, 31, 30, 31, 31, 31, 31, 32, 31, 31, 32,
+            32, 32, 32, 33, 33, 34, 34, 34, 35, 35, 35, 38, 33, 34, 34, 34, 35, 35, 36, 38, 39, 34, 35, 35,
+            36, 36, 36, 37, 40, 40, 41, 36, 38, 38, 38, 39, 40, 40, 43, 43, 44, 47, 36, 38, 38, 38, 39, 40,
+            40, 43, 43, 44, 47, 47, 38, 39, 40, 40, 41, 41, 41, 43, 44, 45, 47, 47, 47, 41, 42, 42, 42, 42,
+            42, 43, 44, 45, 45, 47, 47, 48, 48, 41, 42, 42, 42, 42, 42, 43, 44, 45, 45, 47, 47, 48, 48, 48,
+            45, 45, 45, 45, 44, 44, 44, 46, 46, 46, 47, 47, 48, 49, 49, 50, 49, 48, 47, 47, 46, 46, 46, 47,
+            47, 47, 48, 48, 49, 50, 50, 51, 53, 49, 48, 47, 47, 46, 46, 46, 47, 47, 47, 48, 48, 49, 50, 50,
+            51, 53, 53, 49, 47, 47, 47, 46, 46, 46, 46, 46, 47, 47, 47, 48, 50, 50, 51, 53, 53, 53, 48, 47,
+            47, 47, 46, 45, 45, 46, 46, 46, 46, 46, 48, 49, 49, 51, 53, 53, 54, 54, 48, 47, 47, 47, 46, 45,
+            45, 46, 46, 46, 46, 46, 48, 49, 49, 51, 53, 53, 54, 54, 54, 49, 47, 47, 47, 45, 45, 45, 45, 45,
+            45, 45, 45, 47, 49, 49, 51, 53, 53, 54, 55, 55, 57, 49, 47, 47, 46, 45, 45, 45, 45, 45, 45, 45,
+            45, 47, 49, 49, 51, 53, 53, 55, 55, 55, 57, 58, 49, 47, 47, 47, 45, 45, 45, 45, 45, 45, 45, 45,
+            47, 49, 49, 51, 53, 53, 55, 56, 56, 58, 58, 59, 50, 49, 48, 48, 46, 46, 46, 46, 46, 46, 46, 46,
+            47, 50, 50, 52, 54, 54, 55, 56, 56, 58, 59, 59, 61, 50, 49, 48, 48, 47, 46, 46, 46, 46, 46, 46,
+            46, 47, 50, 50, 52, 54, 54, 55, 56, 56, 59, 60, 60, 61, 61, 51, 49, 48, 48, 47, 46, 46, 47, 47,
+            46, 46, 46, 47, 50, 50, 52, 54, 54, 55, 56, 56, 59, 60, 60, 61, 62, 62, 52, 50, 49, 49, 48, 47,
+            47, 47, 47, 47, 46, 46, 48, 50, 50, 52, 54, 54, 56, 57, 57, 60, 61, 61, 63, 63, 64, 66, 52, 50,
+            50, 49, 48, 47, 47, 47, 47, 47, 47, 47, 48, 50, 50, 52, 54, 54, 56, 57, 57, 60, 61, 61, 63, 63,
+            64, 66, 66, 53, 51, 50, 50, 48, 48, 48, 48, 48, 48, 47, 47, 48, 51, 51, 52, 54, 54, 56, 58, 58,
+            60, 61, 62, 63, 64, 64, 67, 67, 68, 54, 53, 52, 52, 50, 49, 49, 49, 49, 49, 48, 48, 49, 52, 52,
+            53, 55, 55, 57, 58, 58, 61, 62, 63, 64, 65, 66, 68, 68, 69, 71, 54, 53, 52, 52, 50, 49, 49, 49,
+            49, 49, 48, 48, 49, 52, 52, 53, 55, 55, 57, 58, 58, 61, 62, 63, 64, 65, 66, 68, 68, 69, 71, 71,
+        ],
+    ],
+    [  # level 9
+        [  # luma
+            32, 31, 31, 31, 31, 32, 31, 31, 32, 32, 31, 31, 32, 32, 32, 31, 31, 32, 32, 32, 32, 31, 31, 32,
+            32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 32, 33, 31, 32, 32,
+            32, 32, 32, 32, 32, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 32, 32, 32, 32, 32, 32,
+            32, 33, 33, 33, 33, 34, 32, 32, 32, 32, 32, 32, 32, 33, 33, 34, 34, 35, 35, 32, 32, 32, 32, 32,
+            32, 32, 33, 33, 34, 34, 35, 35, 35, 32, 33, 33, 33, 33, 33, 33, 33, 34, 34, 34, 35, 36, 36, 36,
+            34, 34, 34, 34, 34, 33, 33, 34, 35, 35, 35, 36, 37, 37, 38, 39, 34, 34, 34, 34, 34, 33, 33, 34,
+            35, 35, 35, 36, 37, 37, 38, 39, 39, 34, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 36, 37, 37, 38,
+            40, 40, 41, 35, 35, 35, 35, 34, 34, 34, 34, 36, 36, 36, 37, 38, 38, 39, 42, 42, 43, 46, 36, 35,
+            35, 35, 35, 34, 34, 35, 36, 36, 36, 37, 38, 38, 40, 42, 42, 44, 47, 48, 36, 35, 35, 35, 35, 34,
+            34, 35, 36, 36, 36, 37, 38, 38, 40, 42, 42, 44, 47, 48, 48, 38, 37, 37, 37, 36, 36, 36, 36, 37,
+            38, 38, 39, 39, 39, 41, 44, 44, 45, 48, 50, 50, 51, 39, 39, 38, 38, 38, 37, 37, 38, 39, 39, 39,
+            40, 40, 40, 42, 45, 45, 46, 49, 50, 50, 52, 54, 39, 39, 38, 38, 38, 37, 37, 38, 39, 39, 39, 40,
+            40, 40, 42, 45, 45, 46, 49, 50, 50, 52, 54, 54, 41, 40, 40, 40, 39, 38, 38, 39, 40, 40, 40, 41,
+            41, 41, 43, 46, 46, 47, 50, 52, 52, 54, 55, 55, 57, 44, 43, 42, 42, 42, 41, 41, 41, 42, 42, 42,
+            42, 42, 42, 44, 47, 47, 49, 52, 54, 54, 56, 58, 58, 60, 63, 44, 43, 42, 42, 42, 41, 41, 41, 42,
+            42, 42, 42, 42, 42, 44, 47, 47, 49, 52, 54, 54, 56, 58, 58, 60, 63, 63, 45, 44, 43, 43, 42, 41,
+            41, 42, 42, 42, 42, 43, 43, 43, 45, 48, 48, 49, 53, 54, 54, 57, 58, 58, 60, 64, 64, 65, 47, 46,
+            45, 45, 45, 44, 44, 44, 44, 45, 45, 45, 45, 45, 47, 50, 50, 51, 55, 56, 56, 58, 60, 60, 62, 66,
+            66, 67, 69, 48, 47, 46, 46, 45, 44, 44, 45, 45, 45, 45, 45, 46, 46, 47, 51, 51, 52, 55, 57, 57,
+            59, 61, 61, 63, 67, 67, 68, 70, 71, 48, 47, 46, 46, 45, 44, 44, 45, 45, 45, 45, 45, 46, 46, 47,
+            51, 51, 52, 55, 57, 57, 59, 61, 61, 63, 67, 67, 68, 70, 71, 71, 51, 50, 49, 49, 48, 47, 47, 47,
+            48, 48, 48, 48, 48, 48, 50, 53, 53, 54, 57, 58, 58, 61, 63, 63, 66, 69, 69, 70, 73, 74, 74, 77,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31, 31, 31, 32, 30, 31, 31,
+            31, 31, 32, 32, 31, 31, 32, 32, 32, 32, 32, 33, 33, 33, 34, 34, 34, 34, 34, 35, 37, 33, 34, 34,
+            34, 35, 35, 35, 36, 38, 39, 33, 34, 34, 34, 35, 35, 35, 36, 38, 39, 39, 35, 36, 37, 37, 37, 38,
+            38, 38, 41, 41, 41, 44, 36, 37, 38, 38, 39, 40, 40, 40, 42, 43, 43, 46, 47, 36, 37, 38, 38, 39,
+            40, 40, 40, 42, 43, 43, 46, 47, 47, 38, 39, 40, 40, 40, 41, 41, 41, 43, 44, 44, 46, 47, 47, 47,
+            41, 42, 42, 42, 42, 42, 42, 43, 44, 45, 45, 46, 47, 47, 48, 48, 41, 42, 42, 42, 42, 42, 42, 43,
+            44, 45, 45, 46, 47, 47, 48, 48, 48, 43, 43, 43, 43, 43, 43, 43, 43, 45, 45, 45, 46, 47, 47, 48,
+            49, 49, 49, 47, 47, 46, 46, 46, 45, 45, 46, 46, 47, 47, 47, 47, 47, 48, 50, 50, 50, 52, 49, 48,
+            47, 47, 47, 46, 46, 46, 47, 47, 47, 47, 48, 48, 49, 50, 50, 51, 52, 53, 49, 48, 47, 47, 47, 46,
+            46, 46, 47, 47, 47, 47, 48, 48, 49, 50, 50, 51, 52, 53, 53, 49, 48, 47, 47, 46, 46, 46, 46, 46,
+            46, 46, 47, 47, 47, 48, 50, 50, 50, 52, 53, 53, 53, 48, 47, 47, 47, 46, 45, 45, 45, 46, 46, 46,
+            46, 46, 46, 48, 49, 49, 50, 52, 53, 53, 54, 54, 48, 47, 47, 47, 46, 45, 45, 45, 46, 46, 46, 46,
+            46, 46, 48, 49, 49, 50, 52, 53, 53, 54, 54, 54, 49, 47, 47, 47, 46, 45, 45, 45, 46, 46, 46, 46,
+            46, 46, 47, 49, 49, 50, 52, 53, 53, 54, 55, 55, 55, 49, 47, 47, 47, 46, 45, 45, 45, 45, 45, 45,
+            45, 45, 45, 47, 49, 49, 50, 52, 53, 53, 55, 55, 55, 57, 58, 49, 47, 47, 47, 46, 45, 45, 45, 45,
+            45, 45, 45, 45, 45, 47, 49, 49, 50, 52, 53, 53, 55, 55, 55, 57, 58, 58, 49, 48, 47, 47, 46, 45,
+            45, 45, 45, 45, 45, 45, 45, 45, 47, 49, 49, 50, 52, 53, 53, 55, 56, 56, 57, 59, 59, 59, 50, 49,
+            48, 48, 47, 46, 46, 46, 46, 46, 46, 46, 46, 46, 47, 50, 50, 50, 53, 54, 54, 55, 56, 56, 57, 59,
+            59, 60, 61, 50, 49, 48, 48, 47, 46, 46, 46, 46, 46, 46, 46, 46, 46, 47, 50, 50, 50, 53, 54, 54,
+            55, 56, 56, 58, 60, 60, 60, 61, 61, 50, 49, 48, 48, 47, 46, 46, 46, 46, 46, 46, 46, 46, 46, 47,
+            50, 50, 50, 53, 54, 54, 55, 56, 56, 58, 60, 60, 60, 61, 61, 61, 51, 50, 49, 49, 48, 47, 47, 47,
+            47, 47, 47, 47, 46, 46, 48, 50, 50, 51, 53, 54, 54, 56, 57, 57, 58, 60, 60, 61, 62, 63, 63, 64,
+        ],
+    ],
+    [  # level 10
+        [  # luma
+            32, 31, 31, 31, 31, 32, 31, 31, 32, 32, 31, 31, 32, 32, 32, 31, 31, 32, 32, 32, 32, 31, 31, 32,
+            32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 32, 31, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 31, 32, 32, 32, 32, 32,
+            32, 32, 32, 33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 33, 33, 33, 33, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 34, 34, 34, 34, 35,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 34, 34, 34, 34, 35, 35, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 33, 34, 34, 34, 34, 35, 35, 35, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 35, 36,
+            36, 36, 37, 34, 34, 34, 34, 34, 34, 33, 33, 33, 34, 35, 35, 35, 36, 37, 37, 37, 38, 39, 34, 34,
+            34, 34, 34, 34, 33, 33, 33, 34, 35, 35, 35, 36, 37, 37, 37, 38, 39, 39, 34, 34, 34, 34, 34, 34,
+            33, 33, 33, 34, 35, 35, 35, 36, 37, 37, 37, 38, 39, 39, 39, 35, 34, 34, 34, 34, 34, 34, 34, 34,
+            35, 36, 36, 36, 36, 37, 37, 37, 39, 41, 41, 41, 43, 36, 35, 35, 35, 35, 35, 34, 34, 34, 35, 36,
+            36, 36, 37, 38, 38, 38, 40, 42, 42, 42, 45, 48, 36, 35, 35, 35, 35, 35, 34, 34, 34, 35, 36, 36,
+            36, 37, 38, 38, 38, 40, 42, 42, 42, 45, 48, 48, 36, 35, 35, 35, 35, 35, 34, 34, 34, 35, 36, 36,
+            36, 37, 38, 38, 38, 40, 42, 42, 42, 45, 48, 48, 48, 37, 37, 37, 37, 37, 36, 36, 36, 36, 37, 38,
+            38, 38, 38, 39, 39, 39, 41, 44, 44, 44, 46, 49, 49, 49, 51, 39, 39, 38, 38, 38, 38, 37, 37, 37,
+            38, 39, 39, 39, 40, 40, 40, 40, 42, 45, 45, 45, 47, 50, 50, 50, 52, 54, 39, 39, 38, 38, 38, 38,
+            37, 37, 37, 38, 39, 39, 39, 40, 40, 40, 40, 42, 45, 45, 45, 47, 50, 50, 50, 52, 54, 54, 39, 39,
+            38, 38, 38, 38, 37, 37, 37, 38, 39, 39, 39, 40, 40, 40, 40, 42, 45, 45, 45, 47, 50, 50, 50, 52,
+            54, 54, 54, 41, 41, 40, 40, 40, 39, 39, 39, 39, 40, 40, 40, 40, 41, 41, 41, 41, 44, 46, 46, 46,
+            49, 52, 52, 52, 54, 56, 56, 56, 58, 44, 43, 42, 42, 42, 41, 41, 41, 41, 41, 42, 42, 42, 42, 42,
+            42, 42, 45, 47, 47, 47, 50, 54, 54, 54, 56, 58, 58, 58, 60, 63, 44, 43, 42, 42, 42, 41, 41, 41,
+            41, 41, 42, 42, 42, 42, 42, 42, 42, 45, 47, 47, 47, 50, 54, 54, 54, 56, 58, 58, 58, 60, 63, 63,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31,
+            31, 31, 31, 32, 30, 31, 31, 31, 31, 31, 32, 32, 30, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 33,
+            33, 33, 33, 33, 33, 33, 35, 33, 34, 34, 34, 34, 35, 35, 35, 35, 37, 39, 33, 34, 34, 34, 34, 35,
+            35, 35, 35, 37, 39, 39, 33, 34, 34, 34, 34, 35, 35, 35, 35, 37, 39, 39, 39, 35, 35, 36, 36, 36,
+            37, 37, 37, 37, 39, 41, 41, 41, 43, 36, 37, 38, 38, 38, 39, 40, 40, 40, 41, 43, 43, 43, 45, 47,
+            36, 37, 38, 38, 38, 39, 40, 40, 40, 41, 43, 43, 43, 45, 47, 47, 36, 37, 38, 38, 38, 39, 40, 40,
+            40, 41, 43, 43, 43, 45, 47, 47, 47, 39, 39, 40, 40, 40, 41, 41, 41, 41, 42, 44, 44, 44, 45, 47,
+            47, 47, 47, 41, 42, 42, 42, 42, 42, 42, 42, 42, 43, 45, 45, 45, 46, 47, 47, 47, 48, 48, 41, 42,
+            42, 42, 42, 42, 42, 42, 42, 43, 45, 45, 45, 46, 47, 47, 47, 48, 48, 48, 41, 42, 42, 42, 42, 42,
+            42, 42, 42, 43, 45, 45, 45, 46, 47, 47, 47, 48, 48, 48, 48, 45, 45, 45, 45, 45, 44, 44, 44, 44,
+            45, 46, 46, 46, 47, 47, 47, 47, 48, 49, 49, 49, 50, 49, 48, 47, 47, 47, 47, 46, 46, 46, 47, 47,
+            47, 47, 47, 48, 48, 48, 49, 50, 50, 50, 51, 53, 49, 48, 47, 47, 47, 47, 46, 46, 46, 47, 47, 47,
+            47, 47, 48, 48, 48, 49, 50, 50, 50, 51, 53, 53, 49, 48, 47, 47, 47, 47, 46, 46, 46, 47, 47, 47,
+            47, 47, 48, 48, 48, 49, 50, 50, 50, 51, 53, 53, 53, 49, 48, 47, 47, 47, 46, 46, 46, 46, 46, 47,
+            47, 47, 47, 47, 47, 47, 48, 50, 50, 50, 51, 53, 53, 53, 53, 48, 48, 47, 47, 47, 46, 45, 45, 45,
+            46, 46, 46, 46, 46, 46, 46, 46, 48, 49, 49, 49, 51, 53, 53, 53, 53, 54, 48, 48, 47, 47, 47, 46,
+            45, 45, 45, 46, 46, 46, 46, 46, 46, 46, 46, 48, 49, 49, 49, 51, 53, 53, 53, 53, 54, 54, 48, 48,
+            47, 47, 47, 46, 45, 45, 45, 46, 46, 46, 46, 46, 46, 46, 46, 48, 49, 49, 49, 51, 53, 53, 53, 53,
+            54, 54, 54, 49, 48, 47, 47, 47, 46, 45, 45, 45, 45, 46, 46, 46, 46, 46, 46, 46, 47, 49, 49, 49,
+            51, 53, 53, 53, 54, 55, 55, 55, 56, 49, 48, 47, 47, 47, 46, 45, 45, 45, 45, 45, 45, 45, 45, 45,
+            45, 45, 47, 49, 49, 49, 51, 53, 53, 53, 54, 55, 55, 55, 57, 58, 49, 48, 47, 47, 47, 46, 45, 45,
+            45, 45, 45, 45, 45, 45, 45, 45, 45, 47, 49, 49, 49, 51, 53, 53, 53, 54, 55, 55, 55, 57, 58, 58,
+        ],
+    ],
+    [  # level 11
+        [  # luma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 32, 31, 31, 31, 32, 32, 31, 31, 31, 32, 32, 32, 31, 31, 32,
+            32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 32, 31, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33,
+            31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 33, 33, 33, 33, 33, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 34, 34,
+            34, 34, 35, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 34, 34, 34, 34, 35, 35, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 34, 34, 34, 34, 35, 35, 35, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 33, 33, 34, 34, 34, 34, 35, 35, 35, 35, 32, 32, 33, 33, 33, 33, 33, 33, 33,
+            33, 33, 33, 34, 34, 34, 34, 35, 35, 36, 36, 36, 36, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33,
+            34, 34, 35, 35, 35, 35, 36, 36, 36, 36, 37, 38, 34, 34, 34, 34, 34, 34, 34, 33, 33, 33, 33, 34,
+            35, 35, 35, 35, 36, 36, 37, 37, 37, 38, 39, 39, 34, 34, 34, 34, 34, 34, 34, 33, 33, 33, 33, 34,
+            35, 35, 35, 35, 36, 36, 37, 37, 37, 38, 39, 39, 39, 34, 34, 34, 34, 34, 34, 34, 33, 33, 33, 33,
+            34, 35, 35, 35, 35, 36, 36, 37, 37, 37, 38, 39, 39, 39, 39, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+            34, 34, 34, 35, 36, 36, 36, 36, 37, 37, 37, 37, 38, 40, 41, 41, 41, 42, 35, 35, 35, 35, 35, 35,
+            34, 34, 34, 34, 34, 35, 36, 36, 36, 36, 37, 37, 38, 38, 38, 39, 41, 42, 42, 42, 44, 46, 36, 35,
+            35, 35, 35, 35, 35, 34, 34, 34, 34, 35, 36, 36, 36, 36, 37, 38, 38, 38, 38, 40, 42, 42, 42, 42,
+            45, 47, 48, 36, 35, 35, 35, 35, 35, 35, 34, 34, 34, 34, 35, 36, 36, 36, 36, 37, 38, 38, 38, 38,
+            40, 42, 42, 42, 42, 45, 47, 48, 48, 36, 35, 35, 35, 35, 35, 35, 34, 34, 34, 34, 35, 36, 36, 36,
+            36, 37, 38, 38, 38, 38, 40, 42, 42, 42, 42, 45, 47, 48, 48, 48, 37, 37, 36, 36, 36, 36, 36, 35,
+            35, 35, 35, 36, 37, 37, 37, 37, 38, 39, 39, 39, 39, 41, 42, 43, 43, 43, 45, 48, 49, 49, 49, 50,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 30, 31, 31, 31, 31, 31, 31, 31, 30, 30, 31, 31, 31, 31, 31, 31, 32, 30, 30, 31,
+            31, 31, 31, 31, 31, 32, 32, 30, 30, 31, 31, 31, 31, 31, 31, 32, 32, 32, 31, 32, 32, 32, 32, 32,
+            33, 33, 33, 33, 33, 34, 33, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 36, 37, 33, 34, 34, 34, 34,
+            34, 35, 35, 35, 35, 35, 37, 38, 39, 33, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 37, 38, 39, 39,
+            33, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 37, 38, 39, 39, 39, 34, 35, 36, 36, 36, 36, 36, 37,
+            37, 37, 37, 38, 40, 40, 40, 40, 42, 36, 36, 37, 37, 37, 37, 38, 38, 39, 39, 39, 40, 41, 42, 42,
+            42, 44, 46, 36, 37, 38, 38, 38, 38, 39, 39, 40, 40, 40, 41, 42, 43, 43, 43, 45, 46, 47, 36, 37,
+            38, 38, 38, 38, 39, 39, 40, 40, 40, 41, 42, 43, 43, 43, 45, 46, 47, 47, 36, 37, 38, 38, 38, 38,
+            39, 39, 40, 40, 40, 41, 42, 43, 43, 43, 45, 46, 47, 47, 47, 38, 39, 39, 40, 40, 40, 40, 41, 41,
+            41, 41, 42, 43, 44, 44, 44, 45, 47, 47, 47, 47, 47, 40, 41, 41, 41, 41, 41, 41, 42, 42, 42, 42,
+            43, 44, 44, 44, 44, 45, 47, 47, 47, 47, 48, 48, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 43,
+            44, 45, 45, 45, 46, 47, 47, 47, 47, 48, 48, 48, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 43,
+            44, 45, 45, 45, 46, 47, 47, 47, 47, 48, 48, 48, 48, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+            43, 44, 45, 45, 45, 46, 47, 47, 47, 47, 48, 48, 48, 48, 48, 44, 44, 44, 44, 44, 44, 44, 44, 44,
+            44, 44, 44, 45, 46, 46, 46, 46, 47, 47, 47, 47, 48, 49, 49, 49, 49, 50, 47, 47, 46, 46, 46, 46,
+            46, 46, 45, 45, 45, 46, 46, 47, 47, 47, 47, 47, 47, 47, 47, 48, 49, 50, 50, 50, 51, 52, 49, 48,
+            48, 47, 47, 47, 47, 46, 46, 46, 46, 46, 47, 47, 47, 47, 47, 47, 48, 48, 48, 49, 50, 50, 50, 50,
+            51, 52, 53, 49, 48, 48, 47, 47, 47, 47, 46, 46, 46, 46, 46, 47, 47, 47, 47, 47, 47, 48, 48, 48,
+            49, 50, 50, 50, 50, 51, 52, 53, 53, 49, 48, 48, 47, 47, 47, 47, 46, 46, 46, 46, 46, 47, 47, 47,
+            47, 47, 47, 48, 48, 48, 49, 50, 50, 50, 50, 51, 52, 53, 53, 53, 49, 48, 47, 47, 47, 47, 47, 46,
+            46, 46, 46, 46, 46, 47, 47, 47, 47, 47, 47, 47, 47, 48, 49, 50, 50, 50, 51, 52, 53, 53, 53, 53,
+        ],
+    ],
+    [  # level 12
+        [  # luma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 31, 31, 31, 32, 32, 32, 31, 31, 31,
+            32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32, 31, 31, 31,
+            32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 31, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 34, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 33, 33, 33, 34, 34, 34, 34, 34, 34, 35, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 33, 33, 33, 34, 34, 34, 34, 34, 35, 35, 35, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 33, 33, 33, 34, 34, 34, 34, 34, 35, 35, 35, 35, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 33, 33, 33, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 32, 32,
+            33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 35, 35, 35, 36, 36,
+            36, 36, 36, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 35, 35, 35, 35,
+            35, 35, 36, 36, 36, 36, 36, 37, 38, 34, 34, 34, 34, 34, 34, 34, 34, 34, 33, 33, 33, 33, 33, 34,
+            34, 35, 35, 35, 35, 35, 35, 36, 36, 37, 37, 37, 37, 38, 38, 39, 34, 34, 34, 34, 34, 34, 34, 34,
+            34, 33, 33, 33, 33, 33, 34, 34, 35, 35, 35, 35, 35, 35, 36, 36, 37, 37, 37, 37, 38, 38, 39, 39,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 32, 30, 30, 31, 31, 31, 31,
+            31, 31, 31, 31, 32, 32, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 30, 30, 31, 31, 31,
+            31, 31, 31, 31, 31, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33,
+            32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 35, 33, 33, 33, 34, 34, 34, 34, 34,
+            34, 34, 34, 34, 34, 34, 35, 36, 37, 33, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 36,
+            37, 38, 39, 33, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 36, 37, 38, 39, 39, 33, 34,
+            34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 36, 37, 38, 39, 39, 39, 33, 34, 34, 34, 34, 34,
+            34, 34, 35, 35, 35, 35, 35, 35, 36, 37, 38, 39, 39, 39, 39, 34, 35, 35, 35, 35, 35, 35, 36, 36,
+            36, 36, 36, 36, 36, 37, 38, 39, 40, 40, 40, 40, 41, 35, 36, 36, 36, 37, 37, 37, 37, 37, 37, 38,
+            38, 38, 38, 38, 39, 41, 41, 41, 41, 41, 42, 44, 36, 37, 37, 38, 38, 38, 38, 38, 38, 39, 39, 39,
+            39, 39, 40, 41, 42, 43, 43, 43, 43, 44, 45, 46, 36, 37, 37, 38, 38, 38, 38, 38, 39, 39, 40, 40,
+            40, 40, 40, 41, 42, 43, 43, 43, 43, 44, 46, 47, 47, 36, 37, 37, 38, 38, 38, 38, 38, 39, 39, 40,
+            40, 40, 40, 40, 41, 42, 43, 43, 43, 43, 44, 46, 47, 47, 47, 36, 37, 37, 38, 38, 38, 38, 38, 39,
+            39, 40, 40, 40, 40, 40, 41, 42, 43, 43, 43, 43, 44, 46, 47, 47, 47, 47, 37, 37, 38, 38, 39, 39,
+            39, 39, 39, 40, 40, 40, 40, 40, 41, 42, 43, 43, 43, 43, 43, 44, 46, 47, 47, 47, 47, 47, 38, 39,
+            39, 40, 40, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 42, 43, 44, 44, 44, 44, 45, 46, 47, 47, 47,
+            47, 47, 47, 40, 40, 40, 41, 41, 41, 41, 41, 41, 41, 42, 42, 42, 42, 42, 43, 44, 44, 44, 44, 44,
+            45, 46, 47, 47, 47, 47, 47, 48, 48, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 43,
+            43, 44, 45, 45, 45, 45, 45, 46, 47, 47, 47, 47, 47, 48, 48, 48, 41, 42, 42, 42, 42, 42, 42, 42,
+            42, 42, 42, 42, 42, 42, 43, 43, 44, 45, 45, 45, 45, 45, 46, 47, 47, 47, 47, 47, 48, 48, 48, 48,
+        ],
+    ],
+    [  # level 13
+        [  # luma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 31, 31, 31,
+            31, 31, 32, 32, 31, 31, 31, 31, 31, 32, 32, 32, 31, 31, 31, 31, 31, 32, 32, 32, 32, 31, 31, 31,
+            31, 31, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32,
+            32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31,
+            31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 31, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33,
+            33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 33, 33, 33, 33, 33, 33, 33, 33, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 30, 30, 30, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 32, 32, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            32, 32, 32, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 30, 30,
+            30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 30, 30, 30, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33,
+            33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 35, 36, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 34,
+            34, 34, 34, 34, 34, 34, 34, 34, 34, 35, 36, 37, 37, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+            35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 36, 37, 37, 38, 39, 33, 33, 34, 34, 34, 34, 34, 34, 34,
+            34, 34, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 36, 37, 37, 38, 39, 39, 33, 33, 34, 34, 34, 34,
+            34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 36, 37, 37, 38, 39, 39, 39, 33, 33,
+            34, 34, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 36, 37, 37, 38, 39,
+            39, 39, 39, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35,
+            36, 37, 37, 38, 39, 39, 39, 39, 39, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35,
+            35, 35, 35, 35, 35, 35, 36, 37, 37, 38, 39, 39, 39, 39, 39, 39, 34, 34, 34, 35, 35, 35, 35, 35,
+            35, 35, 35, 35, 35, 36, 36, 36, 36, 36, 36, 36, 36, 37, 37, 38, 39, 40, 40, 40, 40, 40, 40, 40,
+        ],
+    ],
+    [  # level 14
+        [  # luma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31,
+            31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31,
+            31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 31, 31, 31, 31, 31, 31, 31, 32,
+            32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+        ],
+        [  # chroma
+            32, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 30, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 30, 30, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 30,
+            30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 30, 30, 30, 30, 30, 31, 31, 31,
+            31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32,
+        ],
+    ],
+]
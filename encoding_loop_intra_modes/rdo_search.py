@@ -0,0 +1,181 @@
+import collections
+import concurrent.futures
+import numpy as np
+
+from adst_transform import INTRA_TX_TYPES, forward_transform_2d, inverse_transform_2d
+from block_transform import frame_to_blocks, blocks_to_frame
+from integer_transform import coefficient_scale
+from quantizer import quantize_sweep
+
+# Broadcasted rate-distortion search.
+#
+# 5_test_RDO_loop_testing_3_quantization_matrixes_for_reconstructing_original.py
+# loops over three quantization matrices in Python and recomputes the DCT of
+# the same residual in every iteration. Here every candidate
+#
+#   prediction mode x transform type x quantizer (qindex)
+#
+# is evaluated for every block as one tensor operation: the residual of each
+# prediction is transformed once per transform type, the coefficients are
+# quantized at all qindex values in one broadcast, and the cheapest
+# distortion + lambda * rate is picked per block.
+#
+# All transforms are orthonormal, so the distortion is measured directly in
+# the coefficient domain (Parseval) without running inverse transforms on the
+# candidates that lose.
+
+RDOResult = collections.namedtuple(
+    'RDOResult', ['cost', 'mode', 'tx_type', 'qindex', 'levels', 'reconstructed'])
+
+
+def rate_nonzero(levels):
+    """Rate proxy used by the RDO script: number of non-zero quantized coefficients."""
+    return np.count_nonzero(levels, axis=(-2, -1))
+
+
+def rate_bits(levels):
+    """Rate proxy closer to a real entropy coder: ~1 + 2*log2(1 + |level|) bits per non-zero level."""
+    magnitude = np.abs(levels)
+    bits = np.where(magnitude > 0, 1.0 + 2.0 * np.log2(1.0 + magnitude), 0.0)
+    return bits.sum(axis=(-2, -1))
+
+
+RATE_FUNCTIONS = {'nonzero': rate_nonzero, 'bits': rate_bits}
+
+
+def rdo_search(original_blocks, predictions, tx_types=INTRA_TX_TYPES, qindices=(64,),
+               lambda_factor=0.1, bit_depth=8, rate='nonzero'):
+    """Picks the best (mode, transform type, qindex) per block.
+
+    original_blocks: (N, h, w) pixels.
+    predictions: (P, N, h, w), one prediction per candidate mode and block.
+    Distortion is the per-block MSE, as in the RDO script.
+    """
+    original = np.asarray(original_blocks, dtype=np.float64)
+    predictions = np.asarray(predictions, dtype=np.float64)
+    if predictions.ndim == original.ndim:
+        predictions = predictions[np.newaxis]
+    qindices = np.asarray(qindices)
+    num_blocks, height, width = original.shape
+    rate_fn = RATE_FUNCTIONS[rate] if isinstance(rate, str) else rate
+    scale = coefficient_scale(width, height)
+
+    # (P, T, N, h, w): each residual transformed once per transform type
+    residuals = original - predictions
+    coefficients = np.stack([forward_transform_2d(residuals, tx_type) for tx_type in tx_types], axis=1)
+
+    # (Q, P, T, N, h, w): all quantizers at once in the AV1 integer domain
+    levels, dequantized = quantize_sweep(np.round(coefficients * scale), qindices, bit_depth)
+    distortion = np.mean((coefficients - dequantized / scale) ** 2, axis=(-2, -1))
+    cost = distortion + lambda_factor * rate_fn(levels)
+
+    candidates = cost.reshape(-1, num_blocks)
+    best = np.argmin(candidates, axis=0)
+    block_index = np.arange(num_blocks)
+    q_best, mode_best, tx_best = np.unravel_index(best, cost.shape[:3])
+
+    best_levels = levels[q_best, mode_best, tx_best, block_index]
+    best_dequantized = dequantized[q_best, mode_best, tx_best, block_index] / scale
+    reconstructed = np.empty_like(original)
+    for t, tx_type in enumerate(tx_types):
+        selected = tx_best == t
+        if np.any(selected):
+            reconstructed[selected] = (predictions[mode_best[selected], block_index[selected]]
+                                       + inverse_transform_2d(best_dequantized[selected], tx_type))
+
+    return RDOResult(
+        cost=candidates[best, block_index],
+        mode=mode_best,
+        tx_type=tx_best,
+        qindex=qindices[q_best],
+        levels=best_levels,
+        reconstructed=reconstructed,
+    )
+
+
+def dc_predictions(original_blocks):
+    """The scripts' DC predictor: every block predicted by its own mean (not causal)."""
+    original_blocks = np.asarray(original_blocks, dtype=np.float64)
+    return np.broadcast_to(original_blocks.mean(axis=(-2, -1), keepdims=True), original_blocks.shape)[np.newaxis]
+
+
+def _search_tile(args):
+    original_blocks, predictions, kwargs = args
+    if predictions is None:
+        predictions = dc_predictions(original_blocks)
+    return rdo_search(original_blocks, predictions, **kwargs)
+
+
+def rdo_search_frame(frame, prediction_frames=None, block_size=4, tile_rows=16, workers=None, **kwargs):
+    """Runs rdo_search() over a whole frame, tile by tile, optionally in a process pool.
+
+    frame: (H, W) with H and W multiples of block_size.
+    prediction_frames: (P, H, W) candidate predictions, or None for the DC predictor.
+    tile_rows: block rows per tile; also bounds the memory of the candidate tensors.
+    workers: None or 0 runs the tiles serially, otherwise the number of worker processes.
+    Returns an RDOResult whose per-block fields have shape (rows, cols) and whose
+    reconstructed field is the (H, W) reconstructed frame.
+    """
+    grid = frame_to_blocks(frame, block_size)
+    rows, cols = grid.shape[:2]
+    prediction_grids = None
+    if prediction_frames is not None:
+        prediction_grids = np.stack([frame_to_blocks(p, block_size) for p in prediction_frames])
+
+    tasks = []
+    for top in range(0, rows, tile_rows):
+        bottom = min(top + tile_rows, rows)
+        original_blocks = grid[top:bottom].reshape(-1, block_size, block_size)
+        predictions = None
+        if prediction_grids is not None:
+            predictions = prediction_grids[:, top:bottom].reshape(len(prediction_grids), -1, block_size, block_size)
+        tasks.append((original_blocks, predictions, kwargs))
+
+    if workers:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_search_tile, tasks))
+    else:
+        results = [_search_tile(task) for task in tasks]
+
+    fields = {}
+    for name in RDOResult._fields:
+        merged = np.concatenate([getattr(result, name) for result in results])
+        fields[name] = merged.reshape((rows, cols) + merged.shape[1:])
+    fields['reconstructed'] = blocks_to_frame(fields['reconstructed'])
+    return RDOResult(**fields)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Residual block (smooth gradient) and DC prediction from the RDO script
+    residual_block = np.array([
+        [0, 50, 100, 150],
+        [50, 100, 150, 200],
+        [100, 150, 200, 250],
+        [150, 200, 250, 300],
+    ])
+    predicted_block = np.full_like(residual_block, 150)
+    original_block = predicted_block + residual_block
+
+    result = rdo_search(original_block[np.newaxis], predicted_block[np.newaxis, np.newaxis],
+                        qindices=np.arange(0, 256, 8), lambda_factor=0.1)
+    print(f"Best RDO Cost: {result.cost[0]:.3f}")
+    print(f"Best transform type: {INTRA_TX_TYPES[result.tx_type[0]]}, best qindex: {result.qindex[0]}")
+    print("Best Quantized Block:")
+    print(result.levels[0])
+    print("Best Reconstructed Block:")
+    print(np.round(result.reconstructed[0], 2))
+
+    # Whole 720p frame: 4 transform types x 8 qindex values per block
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:720, 0:1280]
+    frame = np.clip(128 + 60 * np.sin(x / 40.0) * np.cos(y / 30.0) + rng.normal(0, 4, x.shape), 0, 255)
+    for workers in (None, 4):
+        start = time.perf_counter()
+        frame_result = rdo_search_frame(frame, qindices=np.arange(0, 256, 32), lambda_factor=2.0,
+                                        rate='bits', workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"\n720p frame, workers={workers}: {elapsed:.2f} s, "
+              f"mean cost {frame_result.cost.mean():.2f}, "
+              f"reconstruction MSE {np.mean((frame_result.reconstructed - frame) ** 2):.2f}")
@@ -0,0 +1,682 @@
+# Reference arithmetic coding
+#
+# Copyright (c) Project Nayuki
+# https://www.nayuki.io/page/reference-arithmetic-coding
+# https://github.com/nayuki/Reference-arithmetic-coding
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# - The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+# - The Software is provided "as is", without warranty of any kind, express or
+#   implied, including but not limited to the warranties of merchantability,
+#   fitness for a particular purpose and noninfringement. In no event shall the
+#   authors or copyright holders be liable for any claim, damages or other
+#   liability, whether in an action of contract, tort or otherwise, arising
+#   from, out of or in connection with the Software or the use or other dealings
+#   in the Software.
+
+import bisect
+import numpy as np
+
+# Arithmetic coding, API compatible with arithmeticcoding.py of Nayuki's
+# Reference-arithmetic-coding (see the copyright and MIT license notice
+# above, which applies to this file), which README.txt used to have copied
+# into site-packages by hand. The coding algorithm is the same, so the bit
+# streams are identical and the scripts only had to drop the site-packages
+# copy.
+#
+# Additions:
+#
+#   write_many / read_many   code a whole array of symbols against a static
+#                            frequency table; the cumulative frequencies are
+#                            read once, the state lives in local variables
+#                            and the output bits are packed with np.packbits
+#   FenwickFrequencyTable    binary indexed tree: get_low, set and increment
+#                            in O(log n), and the decoder's symbol search in
+#                            O(log n) instead of O(log^2 n), for adaptive
+#                            models over wide coefficient alphabets
+
+
+class ArithmeticCoderBase:
+    """Shared state of the encoder and decoder: the range [low, high] of num_state_bits bits."""
+
+    def __init__(self, numbits):
+        if numbits < 1:
+            raise ValueError("State size out of range")
+        self.num_state_bits = numbits
+        self.full_range = 1 << self.num_state_bits
+        self.half_range = self.full_range >> 1
+        self.quarter_range = self.half_range >> 1
+        self.minimum_range = self.quarter_range + 2
+        self.maximum_total = self.minimum_range
+        self.state_mask = self.full_range - 1
+        self.low = 0
+        self.high = self.state_mask
+
+    def update(self, freqs, symbol):
+        """Narrows the range to the symbol's interval and renormalizes."""
+        low = self.low
+        high = self.high
+        if low >= high or (low & self.state_mask) != low or (high & self.state_mask) != high:
+            raise AssertionError("Low or high out of range")
+        range_ = high - low + 1
+        if not (self.minimum_range <= range_ <= self.full_range):
+            raise AssertionError("Range out of range")
+
+        total = freqs.get_total()
+        symlow = freqs.get_low(symbol)
+        symhigh = freqs.get_high(symbol)
+        if symlow == symhigh:
+            raise ValueError("Symbol has zero frequency")
+        if total > self.maximum_total:
+            raise ValueError("Cannot code symbol because total is too large")
+
+        newlow = low + symlow * range_ // total
+        newhigh = low + symhigh * range_ // total - 1
+        self.low = newlow
+        self.high = newhigh
+
+        # While the highest bits are equal
+        while ((self.low ^ self.high) & self.half_range) == 0:
+            self.shift()
+            self.low = ((self.low << 1) & self.state_mask)
+            self.high = ((self.high << 1) & self.state_mask) | 1
+        # While the second highest bit of low is 1 and of high is 0
+        while (self.low & ~self.high & self.quarter_range) != 0:
+            self.underflow()
+            self.low = (self.low << 1) ^ self.half_range
+            self.high = ((self.high ^ self.half_range) << 1) | self.half_range | 1
+
+    def shift(self):
+        raise NotImplementedError()
+
+    def underflow(self):
+        raise NotImplementedError()
+
+    def _cumulative(self, freqs):
+        """Cumulative frequencies of a static table as a list of get_symbol_limit() + 1 ints."""
+        total = freqs.get_total()
+        if total > self.maximum_total:
+            raise ValueError("Cannot code symbol because total is too large")
+        if isinstance(freqs, SimpleFrequencyTable):
+            if freqs.cumulative is None:
+                freqs._init_cumulative()
+            return freqs.cumulative
+        return [freqs.get_low(symbol) for symbol in range(freqs.get_symbol_limit())] + [total]
+
+
+class ArithmeticEncoder(ArithmeticCoderBase):
+    """Encodes symbols and writes the bits to a BitOutputStream."""
+
+    def __init__(self, numbits, bitout):
+        super().__init__(numbits)
+        self.output = bitout
+        # Number of saved underflow bits, emitted inverted after the next shifted bit
+        self.num_underflow = 0
+
+    def write(self, freqs, symbol):
+        if not isinstance(freqs, CheckedFrequencyTable):
+            freqs = CheckedFrequencyTable(freqs)
+        self.update(freqs, symbol)
+
+    def write_many(self, freqs, symbols):
+        """Encodes an array of symbols against a table that does not change meanwhile."""
+        cumulative = self._cumulative(freqs)
+        total = cumulative[-1]
+        limit = len(cumulative) - 1
+        low, high, pending = self.low, self.high, self.num_underflow
+        half, quarter, mask = self.half_range, self.quarter_range, self.state_mask
+        top_shift = self.num_state_bits - 1
+        bits = []
+        emit = bits.append
+        extend = bits.extend
+        for symbol in np.asarray(symbols).ravel().tolist():
+            if not 0 <= symbol < limit:
+                raise ValueError("Symbol out of range")
+            symlow = cumulative[symbol]
+            symhigh = cumulative[symbol + 1]
+            if symlow == symhigh:
+                raise ValueError("Symbol has zero frequency")
+            range_ = high - low + 1
+            high = low + symhigh * range_ // total - 1
+            low = low + symlow * range_ // total
+            while ((low ^ high) & half) == 0:
+                bit = low >> top_shift
+                emit(bit)
+                if pending:
+                    extend([bit ^ 1] * pending)
+                    pending = 0
+                low = (low << 1) & mask
+                high = ((high << 1) & mask) | 1
+            while low & ~high & quarter:
+                pending += 1
+                low = (low << 1) ^ half
+                high = ((high ^ half) << 1) | half | 1
+        self.low, self.high, self.num_underflow = low, high, pending
+        if hasattr(self.output, 'write_many'):
+            self.output.write_many(bits)
+        else:
+            for bit in bits:
+                self.output.write(bit)
+
+    def finish(self):
+        """Terminates the code; the output stream still has to be closed."""
+        self.output.write(1)
+
+    def shift(self):
+        bit = self.low >> (self.num_state_bits - 1)
+        self.output.write(bit)
+        for _ in range(self.num_underflow):
+            self.output.write(bit ^ 1)
+        self.num_underflow = 0
+
+    def underflow(self):
+        self.num_underflow += 1
+
+
+class ArithmeticDecoder(ArithmeticCoderBase):
+    """Decodes symbols from the bits of a BitInputStream."""
+
+    def __init__(self, numbits, bitin):
+        super().__init__(numbits)
+        self.input = bitin
+        self.code = 0
+        for _ in range(self.num_state_bits):
+            self.code = self.code << 1 | self.read_code_bit()
+
+    def read(self, freqs):
+        if not isinstance(freqs, CheckedFrequencyTable):
+            freqs = CheckedFrequencyTable(freqs)
+        total = freqs.get_total()
+        if total > self.maximum_total:
+            raise ValueError("Cannot decode symbol because total is too large")
+        range_ = self.high - self.low + 1
+        offset = self.code - self.low
+        value = ((offset + 1) * total - 1) // range_
+        assert value * range_ // total <= offset
+        assert 0 <= value < total
+
+        # Binary search for the symbol with get_low(symbol) <= value < get_high(symbol)
+        if isinstance(freqs.freqtable, FenwickFrequencyTable):
+            symbol = freqs.freqtable.find(value)
+        else:
+            start = 0
+            end = freqs.get_symbol_limit()
+            while end - start > 1:
+                middle = (start + end) >> 1
+                if freqs.get_low(middle) > value:
+                    end = middle
+                else:
+                    start = middle
+            assert start + 1 == end
+            symbol = start
+
+        assert freqs.get_low(symbol) * range_ // total <= offset < freqs.get_high(symbol) * range_ // total
+        self.update(freqs, symbol)
+        if not (self.low <= self.code <= self.high):
+            raise AssertionError("Code out of range")
+        return symbol
+
+    def read_many(self, freqs, count):
+        """Decodes count symbols against a table that does not change meanwhile."""
+        cumulative = self._cumulative(freqs)
+        total = cumulative[-1]
+        low, high, code = self.low, self.high, self.code
+        half, quarter, mask = self.half_range, self.quarter_range, self.state_mask
+        read_bit = self.read_code_bit
+        search = bisect.bisect_right
+        output = [0] * count
+        for i in range(count):
+            range_ = high - low + 1
+            value = ((code - low + 1) * total - 1) // range_
+            symbol = search(cumulative, value) - 1
+            high = low + cumulative[symbol + 1] * range_ // total - 1
+            low = low + cumulative[symbol] * range_ // total
+            while ((low ^ high) & half) == 0:
+                code = ((code << 1) & mask) | read_bit()
+                low = (low << 1) & mask
+                high = ((high << 1) & mask) | 1
+            while low & ~high & quarter:
+                code = (code & half) | ((code << 1) & (mask >> 1)) | read_bit()
+                low = (low << 1) ^ half
+                high = ((high ^ half) << 1) | half | 1
+            output[i] = symbol
+        self.low, self.high, self.code = low, high, code
+        return np.array(output, dtype=np.int64)
+
+    def shift(self):
+        self.code = ((self.code << 1) & self.state_mask) | self.read_code_bit()
+
+    def underflow(self):
+        self.code = (self.code & self.half_range) | ((self.code << 1) & (self.state_mask >> 1)) | self.read_code_bit()
+
+    def read_code_bit(self):
+        """Next bit of the stream, 0 past its end."""
+        temp = self.input.read()
+        if temp == -1:
+            temp = 0
+        return temp
+
+
+class FrequencyTable:
+    """Interface: symbol frequencies of an alphabet 0 .. get_symbol_limit() - 1."""
+
+    def get_symbol_limit(self):
+        raise NotImplementedError()
+
+    def get(self, symbol):
+        raise NotImplementedError()
+
+    def set(self, symbol, freq):
+        raise NotImplementedError()
+
+    def increment(self, symbol):
+        raise NotImplementedError()
+
+    def get_total(self):
+        raise NotImplementedError()
+
+    def get_low(self, symbol):
+        raise NotImplementedError()
+
+    def get_high(self, symbol):
+        raise NotImplementedError()
+
+
+class FlatFrequencyTable(FrequencyTable):
+    """Immutable table where every symbol has frequency 1."""
+
+    def __init__(self, numsyms):
+        if numsyms < 1:
+            raise ValueError("Number of symbols must be positive")
+        self.numsymbols = numsyms
+
+    def get_symbol_limit(self):
+        return self.numsymbols
+
+    def get(self, symbol):
+        self._check_symbol(symbol)
+        return 1
+
+    def get_total(self):
+        return self.numsymbols
+
+    def get_low(self, symbol):
+        self._check_symbol(symbol)
+        return symbol
+
+    def get_high(self, symbol):
+        self._check_symbol(symbol)
+        return symbol + 1
+
+    def _check_symbol(self, symbol):
+        if not 0 <= symbol < self.numsymbols:
+            raise ValueError("Symbol out of range")
+
+    def __str__(self):
+        return f"FlatFrequencyTable={self.numsymbols}"
+
+    def set(self, symbol, freq):
+        raise NotImplementedError()
+
+    def increment(self, symbol):
+        raise NotImplementedError()
+
+
+class SimpleFrequencyTable(FrequencyTable):
+    """Mutable list of frequencies; cumulative frequencies are rebuilt lazily after a change, O(n)."""
+
+    def __init__(self, freqs):
+        if isinstance(freqs, FrequencyTable):
+            numsym = freqs.get_symbol_limit()
+            self.frequencies = [freqs.get(i) for i in range(numsym)]
+        else:
+            self.frequencies = [int(freq) for freq in freqs]
+
+        if len(self.frequencies) < 1:
+            raise ValueError("At least 1 symbol needed")
+        for freq in self.frequencies:
+            if freq < 0:
+                raise ValueError("Negative frequency")
+
+        self.total = sum(self.frequencies)
+        self.cumulative = None
+
+    def get_symbol_limit(self):
+        return len(self.frequencies)
+
+    def get(self, symbol):
+        self._check_symbol(symbol)
+        return self.frequencies[symbol]
+
+    def set(self, symbol, freq):
+        self._check_symbol(symbol)
+        if freq < 0:
+            raise ValueError("Negative frequency")
+        temp = self.total - self.frequencies[symbol]
+        assert temp >= 0
+        self.total = temp + freq
+        self.frequencies[symbol] = freq
+        self.cumulative = None
+
+    def increment(self, symbol):
+        self._check_symbol(symbol)
+        self.total += 1
+        self.frequencies[symbol] += 1
+        self.cumulative = None
+
+    def get_total(self):
+        return self.total
+
+    def get_low(self, symbol):
+        self._check_symbol(symbol)
+        if self.cumulative is None:
+            self._init_cumulative()
+        return self.cumulative[symbol]
+
+    def get_high(self, symbol):
+        self._check_symbol(symbol)
+        if self.cumulative is None:
+            self._init_cumulative()
+        return self.cumulative[symbol + 1]
+
+    def _init_cumulative(self):
+        cumul = [0]
+        running = 0
+        for freq in self.frequencies:
+            running += freq
+            cumul.append(running)
+        assert running == self.total
+        self.cumulative = cumul
+
+    def _check_symbol(self, symbol):
+        if not 0 <= symbol < len(self.frequencies):
+            raise ValueError("Symbol out of range")
+
+    def __str__(self):
+        return "\n".join(f"{i}\t{freq}" for (i, freq) in enumerate(self.frequencies))
+
+
+class FenwickFrequencyTable(FrequencyTable):
+    """Frequencies in a binary indexed tree: get_low, set, increment and find are O(log n)."""
+
+    def __init__(self, freqs):
+        if isinstance(freqs, FrequencyTable):
+            freqs = [freqs.get(i) for i in range(freqs.get_symbol_limit())]
+        self.frequencies = [int(freq) for freq in freqs]
+        if len(self.frequencies) < 1:
+            raise ValueError("At least 1 symbol needed")
+        if min(self.frequencies) < 0:
+            raise ValueError("Negative frequency")
+        size = len(self.frequencies)
+        # tree[i] (1-based) holds the sum of frequencies (i - (i & -i), i]
+        self.tree = [0] + self.frequencies
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.frequencies)
+        self._top_bit = 1 << (size.bit_length() - 1)
+
+    def get_symbol_limit(self):
+        return len(self.frequencies)
+
+    def get(self, symbol):
+        self._check_symbol(symbol)
+        return self.frequencies[symbol]
+
+    def _add(self, symbol, delta):
+        tree = self.tree
+        size = len(self.frequencies)
+        i = symbol + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+        self.frequencies[symbol] += delta
+        self.total += delta
+
+    def set(self, symbol, freq):
+        self._check_symbol(symbol)
+        if freq < 0:
+            raise ValueError("Negative frequency")
+        self._add(symbol, freq - self.frequencies[symbol])
+
+    def increment(self, symbol):
+        self._check_symbol(symbol)
+        self._add(symbol, 1)
+
+    def get_total(self):
+        return self.total
+
+    def get_low(self, symbol):
+        """Sum of the frequencies of the symbols below symbol."""
+        if not 0 <= symbol <= len(self.frequencies):
+            raise ValueError("Symbol out of range")
+        tree = self.tree
+        result = 0
+        while symbol > 0:
+            result += tree[symbol]
+            symbol -= symbol & -symbol
+        return result
+
+    def get_high(self, symbol):
+        self._check_symbol(symbol)
+        return self.get_low(symbol) + self.frequencies[symbol]
+
+    def find(self, value):
+        """Symbol with get_low(symbol) <= value < get_high(symbol), for 0 <= value < total."""
+        tree = self.tree
+        size = len(self.frequencies)
+        position = 0
+        step = self._top_bit
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= value:
+                position = following
+                value -= tree[following]
+            step >>= 1
+        return position
+
+    def _check_symbol(self, symbol):
+        if not 0 <= symbol < len(self.frequencies):
+            raise ValueError("Symbol out of range")
+
+    def __str__(self):
+        return "\n".join(f"{i}\t{freq}" for (i, freq) in enumerate(self.frequencies))
+
+
+class CheckedFrequencyTable(FrequencyTable):
+    """Wraps a table and checks that its answers are consistent."""
+
+    def __init__(self, freqtab):
+        self.freqtable = freqtab
+
+    def get_symbol_limit(self):
+        result = self.freqtable.get_symbol_limit()
+        if result <= 0:
+            raise AssertionError("Non-positive symbol limit")
+        return result
+
+    def get(self, symbol):
+        result = self.freqtable.get(symbol)
+        if not self._is_symbol_in_range(symbol):
+            raise AssertionError("ValueError expected")
+        if result < 0:
+            raise AssertionError("Negative symbol frequency")
+        return result
+
+    def get_total(self):
+        result = self.freqtable.get_total()
+        if result < 0:
+            raise AssertionError("Negative total frequency")
+        return result
+
+    def get_low(self, symbol):
+        if self._is_symbol_in_range(symbol):
+            low = self.freqtable.get_low(symbol)
+            high = self.freqtable.get_high(symbol)
+            if not (0 <= low <= high <= self.freqtable.get_total()):
+                raise AssertionError("Symbol low cumulative frequency out of range")
+            return low
+        else:
+            self.freqtable.get_low(symbol)
+            raise AssertionError("ValueError expected")
+
+    def get_high(self, symbol):
+        if self._is_symbol_in_range(symbol):
+            low = self.freqtable.get_low(symbol)
+            high = self.freqtable.get_high(symbol)
+            if not (0 <= low <= high <= self.freqtable.get_total()):
+                raise AssertionError("Symbol high cumulative frequency out of range")
+            return high
+        else:
+            self.freqtable.get_high(symbol)
+            raise AssertionError("ValueError expected")
+
+    def __str__(self):
+        return "CheckedFrequencyTable (" + str(self.freqtable) + ")"
+
+    def set(self, symbol, freq):
+        self.freqtable.set(symbol, freq)
+        if not self._is_symbol_in_range(symbol) or freq < 0:
+            raise AssertionError("ValueError expected")
+
+    def increment(self, symbol):
+        self.freqtable.increment(symbol)
+        if not self._is_symbol_in_range(symbol):
+            raise AssertionError("ValueError expected")
+
+    def _is_symbol_in_range(self, symbol):
+        return 0 <= symbol < self.get_symbol_limit()
+
+
+class BitInputStream:
+    """Reads bits MSB first from a binary stream; read() returns -1 at the end."""
+
+    def __init__(self, inp):
+        self.input = inp
+        self.currentbyte = 0
+        self.numbitsremaining = 0
+
+    def read(self):
+        if self.currentbyte == -1:
+            return -1
+        if self.numbitsremaining == 0:
+            temp = self.input.read(1)
+            if len(temp) == 0:
+                self.currentbyte = -1
+                return -1
+            self.currentbyte = temp[0]
+            self.numbitsremaining = 8
+        assert self.numbitsremaining > 0
+        self.numbitsremaining -= 1
+        return (self.currentbyte >> self.numbitsremaining) & 1
+
+    def read_no_eof(self):
+        result = self.read()
+        if result != -1:
+            return result
+        else:
+            raise EOFError()
+
+    def close(self):
+        self.input.close()
+        self.currentbyte = -1
+        self.numbitsremaining = 0
+
+
+class BitOutputStream:
+    """Writes bits MSB first to a binary stream; close() pads the last byte with zeros."""
+
+    def __init__(self, out):
+        self.output = out
+        self.currentbyte = 0
+        self.numbitsfilled = 0
+
+    def write(self, b):
+        if b not in (0, 1):
+            raise ValueError("Argument must be 0 or 1")
+        self.currentbyte = (self.currentbyte << 1) | b
+        self.numbitsfilled += 1
+        if self.numbitsfilled == 8:
+            towrite = bytes((self.currentbyte,))
+            self.output.write(towrite)
+            self.currentbyte = 0
+            self.numbitsfilled = 0
+
+    def write_many(self, bits):
+        """Writes a sequence of 0/1 values, whole bytes at once."""
+        bits = np.asarray(bits, dtype=np.uint8)
+        if bits.size and bits.max() > 1:
+            raise ValueError("Bits must be 0 or 1")
+        # Complete the pending byte bit by bit, then pack the rest
+        head = min((8 - self.numbitsfilled) % 8, bits.size)
+        for bit in bits[:head].tolist():
+            self.write(bit)
+        bits = bits[head:]
+        whole = bits.size - bits.size % 8
+        if whole:
+            self.output.write(np.packbits(bits[:whole]).tobytes())
+        for bit in bits[whole:].tolist():
+            self.write(bit)
+
+    def close(self):
+        while self.numbitsfilled != 0:
+            self.write(0)
+        self.output.close()
+
+
+if __name__ == "__main__":
+    import time
+    from bit_io import BitWriter, BitReader
+
+    # 200000 coefficient-like symbols: per-symbol write()/read() against the batch API
+    rng = np.random.default_rng(0)
+    data = np.minimum(rng.geometric(0.35, 200_000) - 1, 63)
+    freqs = SimpleFrequencyTable(np.bincount(data, minlength=64).tolist())
+    for batch in (False, True):
+        stream = BitWriter()
+        bitout = BitOutputStream(stream)
+        encoder = ArithmeticEncoder(32, bitout)
+        start = time.perf_counter()
+        if batch:
+            encoder.write_many(freqs, data)
+        else:
+            for symbol in data.tolist():
+                encoder.write(freqs, symbol)
+        encoder.finish()
+        bitout.close()
+        encode_time = time.perf_counter() - start
+        encoded = stream.getvalue()
+        decoder = ArithmeticDecoder(32, BitInputStream(BitReader(encoded)))
+        start = time.perf_counter()
+        if batch:
+            decoded = decoder.read_many(freqs, data.size)
+        else:
+            decoded = np.array([decoder.read(freqs) for _ in range(data.size)])
+        decode_time = time.perf_counter() - start
+        print(f"{'write_many/read_many' if batch else 'write/read':20s}: {len(encoded)} bytes, "
+              f"{data.size / encode_time / 1e3:.0f} k symbols/s encode, {data.size / decode_time / 1e3:.0f} k symbols/s "
+              f"decode, lossless: {np.array_equal(decoded, data)}")
+
+    # Adaptive model over a wide alphabet: list rebuild vs Fenwick tree per increment
+    data = rng.integers(0, 4096, 20_000)
+    for table in (SimpleFrequencyTable([1] * 4096), FenwickFrequencyTable([1] * 4096)):
+        stream = BitWriter()
+        bitout = BitOutputStream(stream)
+        encoder = ArithmeticEncoder(32, bitout)
+        start = time.perf_counter()
+        for symbol in data.tolist():
+            encoder.write(table, symbol)
+            table.increment(symbol)
+        encoder.finish()
+        bitout.close()
+        print(f"Adaptive {type(table).__name__}: {len(stream.getvalue())} bytes, "
+              f"{data.size / (time.perf_counter() - start) / 1e3:.1f} k symbols/s")
@@ -0,0 +1,1186 @@
+import collections
+import json
+import os
+import sys
+import numpy as np
+
+from bit_io import BitReader
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'encoding_loop_intra_modes'))
+
+from frame_source import ivf_frames, IVF_SIGNATURE  # noqa: E402
+
+# AV1 bitstream parser for IVF, AVIF and raw OBU files.
+#
+# entropy_coding_ffprobe_bitstream_analyze.py spawns ffprobe for every file
+# and prints its raw JSON. Here the file is memory-mapped (IVF through
+# frame_source.ivf_frames()) and parsed in Python:
+#
+#   IVF       32-byte file header, then one temporal unit per IVF frame
+#   AVIF      ISOBMFF boxes ftyp, meta (hdlr, pitm, iinf/infe, iloc,
+#             iprp/ipco/ipma with av1C and ispe); the primary item's iloc
+#             extents hold the AV1 OBUs of the image
+#   OBU       obu_header() and obu_size of every OBU; the sequence header
+#             and the uncompressed frame header are parsed bit by bit up to
+#             film_grain_params(), tile groups down to each tile's size
+#
+# The frame header needs the state of the 8 reference slots (frame sizes for
+# frame_size_with_refs(), order hints for skip mode, segmentation for the
+# lossless check), so a parser follows the stream from the first temporal
+# unit on, as a decoder does. Tile data itself is not decoded.
+#
+# parse_file() yields TemporalUnit records, file_statistics() reduces them to
+# a JSON-able dict (OBU counts and bytes, frame types, qindex, tiles, bytes
+# per frame) and directory_statistics() does that for every file of a
+# directory in one process, e.g.
+#
+#   python av1_bitstream_parser.py ../original_image_smooth.avif ../img_Johnny_1280x720.ivf
+
+OBU_SEQUENCE_HEADER = 1
+OBU_TEMPORAL_DELIMITER = 2
+OBU_FRAME_HEADER = 3
+OBU_TILE_GROUP = 4
+OBU_METADATA = 5
+OBU_FRAME = 6
+OBU_REDUNDANT_FRAME_HEADER = 7
+OBU_TILE_LIST = 8
+OBU_PADDING = 15
+OBU_NAMES = {
+    OBU_SEQUENCE_HEADER: 'sequence_header', OBU_TEMPORAL_DELIMITER: 'temporal_delimiter',
+    OBU_FRAME_HEADER: 'frame_header', OBU_TILE_GROUP: 'tile_group', OBU_METADATA: 'metadata',
+    OBU_FRAME: 'frame', OBU_REDUNDANT_FRAME_HEADER: 'redundant_frame_header', OBU_TILE_LIST: 'tile_list',
+    OBU_PADDING: 'padding',
+}
+
+KEY_FRAME, INTER_FRAME, INTRA_ONLY_FRAME, SWITCH_FRAME = range(4)
+FRAME_TYPE_NAMES = ('key', 'inter', 'intra_only', 'switch')
+
+NUM_REF_FRAMES = 8
+REFS_PER_FRAME = 7
+ALL_FRAMES = (1 << NUM_REF_FRAMES) - 1
+PRIMARY_REF_NONE = 7
+SELECT_SCREEN_CONTENT_TOOLS = 2
+SELECT_INTEGER_MV = 2
+SUPERRES_NUM = 8
+SUPERRES_DENOM_MIN = 9
+MAX_TILE_WIDTH = 4096
+MAX_TILE_AREA = 4096 * 2304
+MAX_TILE_ROWS = 64
+MAX_TILE_COLS = 64
+MAX_SEGMENTS = 8
+SEG_LVL_ALT_Q = 0
+SEGMENTATION_FEATURE_BITS = (8, 6, 6, 6, 6, 3, 0, 0)
+SEGMENTATION_FEATURE_SIGNED = (1, 1, 1, 1, 1, 0, 0, 0)
+SEGMENTATION_FEATURE_MAX = (255, 63, 63, 63, 63, 7, 0, 0)
+IDENTITY, TRANSLATION, ROTZOOM, AFFINE = range(4)
+GM_ABS_ALPHA_BITS = 12
+GM_ABS_TRANS_ONLY_BITS = 9
+GM_ABS_TRANS_BITS = 12
+# LAST2, LAST3, BWDREF, ALTREF2, ALTREF as offsets from LAST_FRAME (set_frame_refs())
+REF_FRAME_LIST = (1, 2, 4, 5, 6)
+
+ObuHeader = collections.namedtuple(
+    'ObuHeader', ['type', 'temporal_id', 'spatial_id', 'offset', 'header_size', 'size'])
+SequenceHeader = collections.namedtuple('SequenceHeader', [
+    'seq_profile', 'still_picture', 'reduced_still_picture_header', 'timing_info_present_flag',
+    'equal_picture_interval', 'decoder_model_info_present_flag', 'buffer_removal_time_length',
+    'frame_presentation_time_length', 'operating_point_idc', 'seq_level_idx', 'seq_tier',
+    'decoder_model_present_for_this_op', 'frame_width_bits', 'frame_height_bits', 'max_frame_width',
+    'max_frame_height', 'frame_id_numbers_present_flag', 'delta_frame_id_length', 'frame_id_length',
+    'use_128x128_superblock', 'enable_filter_intra', 'enable_intra_edge_filter', 'enable_interintra_compound',
+    'enable_masked_compound', 'enable_warped_motion', 'enable_dual_filter', 'enable_order_hint',
+    'enable_jnt_comp', 'enable_ref_frame_mvs', 'seq_force_screen_content_tools', 'seq_force_integer_mv',
+    'order_hint_bits', 'enable_superres', 'enable_cdef', 'enable_restoration', 'bit_depth', 'mono_chrome',
+    'color_primaries', 'transfer_characteristics', 'matrix_coefficients', 'color_range', 'subsampling_x',
+    'subsampling_y', 'chroma_sample_position', 'separate_uv_delta_q', 'film_grain_params_present',
+])
+FrameHeader = collections.namedtuple('FrameHeader', [
+    'show_existing_frame', 'frame_type', 'show_frame', 'showable_frame', 'error_resilient_mode', 'order_hint',
+    'primary_ref_frame', 'refresh_frame_flags', 'upscaled_width', 'frame_width', 'frame_height',
+    'render_width', 'render_height', 'base_q_idx', 'delta_q', 'using_qmatrix', 'segmentation_enabled',
+    'coded_lossless', 'loop_filter_level', 'cdef_bits', 'tx_mode_select', 'reference_select',
+    'skip_mode_present', 'tile_cols', 'tile_rows', 'tile_cols_log2', 'tile_rows_log2', 'tile_size_bytes',
+    'apply_grain', 'header_bits',
+])
+TileGroup = collections.namedtuple('TileGroup', ['tg_start', 'tg_end', 'size', 'header_size', 'tile_sizes'])
+Frame = collections.namedtuple('Frame', ['header', 'header_size', 'tile_groups'])
+TemporalUnit = collections.namedtuple(
+    'TemporalUnit', ['index', 'offset', 'size', 'obus', 'frames', 'sequence_header'])
+Box = collections.namedtuple('Box', ['type', 'offset', 'header_size', 'size'])
+AVIFItem = collections.namedtuple('AVIFItem', ['item_id', 'item_type', 'extents', 'properties'])
+AV1Config = collections.namedtuple('AV1Config', [
+    'seq_profile', 'seq_level_idx_0', 'seq_tier_0', 'high_bitdepth', 'twelve_bit', 'monochrome',
+    'chroma_subsampling_x', 'chroma_subsampling_y', 'chroma_sample_position', 'config_obus'])
+AVIFInfo = collections.namedtuple('AVIFInfo', ['major_brand', 'compatible_brands', 'primary_item', 'items'])
+
+# State of a reference slot, kept for the frame headers that refer to it
+_RefFrame = collections.namedtuple('_RefFrame', [
+    'frame_type', 'order_hint', 'upscaled_width', 'frame_width', 'frame_height', 'render_width',
+    'render_height', 'segmentation'])
+
+
+def _su(reader, bits):
+    value = reader.read_bits(bits)
+    sign_mask = 1 << (bits - 1)
+    return value - 2 * sign_mask if value & sign_mask else value
+
+
+def _ns(reader, n):
+    w = n.bit_length()
+    m = (1 << w) - n
+    value = reader.read_bits(w - 1)
+    if value < m:
+        return value
+    return (value << 1) - m + reader.read_bits(1)
+
+
+def _uvlc(reader):
+    zeros = 0
+    while not reader.read_bits(1):
+        zeros += 1
+        if zeros >= 32:
+            return (1 << 32) - 1
+    return reader.read_bits(zeros) + (1 << zeros) - 1
+
+
+def _tile_log2(block_size, target):
+    k = 0
+    while (block_size << k) < target:
+        k += 1
+    return k
+
+
+def read_obu_headers(data, offset=0):
+    """Yields the ObuHeader of every OBU in a bytes-like buffer (sizes are payload bytes)."""
+    data = memoryview(data).cast('B')
+    end = len(data)
+    while offset < end:
+        reader = BitReader(data[offset:offset + 10])
+        if reader.read_bits(1):
+            raise ValueError(f"OBU forbidden bit set at offset {offset}")
+        obu_type = reader.read_bits(4)
+        extension_flag = reader.read_bits(1)
+        has_size_field = reader.read_bits(1)
+        reader.read_bits(1)
+        temporal_id = spatial_id = 0
+        if extension_flag:
+            temporal_id = reader.read_bits(3)
+            spatial_id = reader.read_bits(2)
+            reader.read_bits(3)
+        if has_size_field:
+            size = reader.read_leb128()
+            header_size = reader.tell() // 8
+        else:
+            header_size = 1 + extension_flag
+            size = end - offset - header_size
+        if offset + header_size + size > end:
+            raise ValueError(f"OBU at offset {offset} runs past the end of the data ({size} bytes)")
+        yield ObuHeader(obu_type, temporal_id, spatial_id, offset, header_size, size)
+        offset += header_size + size
+
+
+def parse_sequence_header(payload):
+    """SequenceHeader of a sequence header OBU payload (operating point 0)."""
+    reader = BitReader(payload)
+    f = reader.read_bits
+    fields = dict(seq_profile=f(3), still_picture=f(1), reduced_still_picture_header=f(1),
+                  timing_info_present_flag=0, equal_picture_interval=0, decoder_model_info_present_flag=0,
+                  buffer_removal_time_length=0, frame_presentation_time_length=0)
+    buffer_delay_length = 0
+    if fields['reduced_still_picture_header']:
+        operating_point_idc, seq_level_idx, seq_tier, decoder_model_present = [0], [f(5)], [0], [0]
+    else:
+        if f(1):
+            fields['timing_info_present_flag'] = 1
+            f(32)  # num_units_in_display_tick
+            f(32)  # time_scale
+            fields['equal_picture_interval'] = f(1)
+            if fields['equal_picture_interval']:
+                _uvlc(reader)
+            if f(1):
+                fields['decoder_model_info_present_flag'] = 1
+                buffer_delay_length = f(5) + 1
+                f(32)  # num_units_in_decoding_tick
+                fields['buffer_removal_time_length'] = f(5) + 1
+                fields['frame_presentation_time_length'] = f(5) + 1
+        initial_display_delay_present = f(1)
+        operating_point_idc, seq_level_idx, seq_tier, decoder_model_present = [], [], [], []
+        for _ in range(f(5) + 1):
+            operating_point_idc.append(f(12))
+            seq_level_idx.append(f(5))
+            seq_tier.append(f(1) if seq_level_idx[-1] > 7 else 0)
+            present = 0
+            if fields['decoder_model_info_present_flag']:
+                present = f(1)
+                if present:
+                    f(buffer_delay_length)  # decoder_buffer_delay
+                    f(buffer_delay_length)  # encoder_buffer_delay
+                    f(1)  # low_delay_mode_flag
+            decoder_model_present.append(present)
+            if initial_display_delay_present and f(1):
+                f(4)
+    fields.update(operating_point_idc=operating_point_idc, seq_level_idx=seq_level_idx, seq_tier=seq_tier,
+                  decoder_model_present_for_this_op=decoder_model_present)
+    fields['frame_width_bits'] = f(4) + 1
+    fields['frame_height_bits'] = f(4) + 1
+    fields['max_frame_width'] = f(fields['frame_width_bits']) + 1
+    fields['max_frame_height'] = f(fields['frame_height_bits']) + 1
+    reduced = fields['reduced_still_picture_header']
+    fields['frame_id_numbers_present_flag'] = 0 if reduced else f(1)
+    fields['delta_frame_id_length'] = fields['frame_id_length'] = 0
+    if fields['frame_id_numbers_present_flag']:
+        fields['delta_frame_id_length'] = f(4) + 2
+        fields['frame_id_length'] = f(3) + 1 + fields['delta_frame_id_length']
+    fields['use_128x128_superblock'] = f(1)
+    fields['enable_filter_intra'] = f(1)
+    fields['enable_intra_edge_filter'] = f(1)
+    names = ('enable_interintra_compound', 'enable_masked_compound', 'enable_warped_motion', 'enable_dual_filter',
+             'enable_order_hint', 'enable_jnt_comp', 'enable_ref_frame_mvs')
+    fields.update(dict.fromkeys(names, 0))
+    fields['seq_force_screen_content_tools'] = SELECT_SCREEN_CONTENT_TOOLS
+    fields['seq_force_integer_mv'] = SELECT_INTEGER_MV
+    fields['order_hint_bits'] = 0
+    if not reduced:
+        for name in names[:5]:
+            fields[name] = f(1)
+        if fields['enable_order_hint']:
+            fields['enable_jnt_comp'] = f(1)
+            fields['enable_ref_frame_mvs'] = f(1)
+        if not f(1):  # seq_choose_screen_content_tools
+            fields['seq_force_screen_content_tools'] = f(1)
+        if fields['seq_force_screen_content_tools'] > 0:
+            if not f(1):  # seq_choose_integer_mv
+                fields['seq_force_integer_mv'] = f(1)
+        if fields['enable_order_hint']:
+            fields['order_hint_bits'] = f(3) + 1
+    fields['enable_superres'] = f(1)
+    fields['enable_cdef'] = f(1)
+    fields['enable_restoration'] = f(1)
+
+    # color_config()
+    high_bitdepth = f(1)
+    if fields['seq_profile'] == 2 and high_bitdepth:
+        fields['bit_depth'] = 12 if f(1) else 10
+    else:
+        fields['bit_depth'] = 10 if high_bitdepth else 8
+    fields['mono_chrome'] = 0 if fields['seq_profile'] == 1 else f(1)
+    if f(1):  # color_description_present_flag
+        fields['color_primaries'], fields['transfer_characteristics'], fields['matrix_coefficients'] = f(8), f(8), f(8)
+    else:
+        fields['color_primaries'] = fields['transfer_characteristics'] = fields['matrix_coefficients'] = 2
+    fields['chroma_sample_position'] = 0
+    fields['separate_uv_delta_q'] = 0
+    if fields['mono_chrome']:
+        fields['color_range'] = f(1)
+        fields['subsampling_x'] = fields['subsampling_y'] = 1
+    elif (fields['color_primaries'], fields['transfer_characteristics'], fields['matrix_coefficients']) == (1, 13, 0):
+        fields['color_range'] = 1
+        fields['subsampling_x'] = fields['subsampling_y'] = 0
+    else:
+        fields['color_range'] = f(1)
+        if fields['seq_profile'] == 0:
+            subsampling = (1, 1)
+        elif fields['seq_profile'] == 1:
+            subsampling = (0, 0)
+        elif fields['bit_depth'] == 12:
+            subsampling_x = f(1)
+            subsampling = (subsampling_x, f(1) if subsampling_x else 0)
+        else:
+            subsampling = (1, 0)
+        fields['subsampling_x'], fields['subsampling_y'] = subsampling
+        if subsampling == (1, 1):
+            fields['chroma_sample_position'] = f(2)
+    if not fields['mono_chrome']:
+        fields['separate_uv_delta_q'] = f(1)
+    fields['film_grain_params_present'] = f(1)
+    return SequenceHeader(**fields)
+
+
+class AV1Parser:
+    """Follows an OBU stream: sequence header, reference slots and the frame being decoded."""
+
+    def __init__(self, sequence_header=None):
+        self.sequence_header = sequence_header
+        self.ref_frames = [None] * NUM_REF_FRAMES
+        self.frame_header = None
+        self.seen_frame_header = False
+
+    def parse_temporal_unit(self, data, index=0, offset=0):
+        """TemporalUnit of a buffer of OBUs; offset is where the buffer starts in its file."""
+        obus, frames = [], []
+        data = memoryview(data).cast('B')
+        for obu in read_obu_headers(data):
+            obus.append(obu._replace(offset=offset + obu.offset))
+            start = obu.offset + obu.header_size
+            payload = data[start:start + obu.size]
+            if obu.type == OBU_SEQUENCE_HEADER:
+                self.sequence_header = parse_sequence_header(payload)
+            elif obu.type == OBU_TEMPORAL_DELIMITER:
+                self.seen_frame_header = False
+            elif obu.type in (OBU_FRAME_HEADER, OBU_REDUNDANT_FRAME_HEADER, OBU_FRAME):
+                if self.sequence_header is None:
+                    raise ValueError("Frame header before any sequence header")
+                if self.seen_frame_header:
+                    continue  # frame_header_copy()
+                reader = BitReader(payload)
+                header = self._frame_header(reader, obu)
+                frames.append(Frame(header, (header.header_bits + 7) // 8, []))
+                if header.show_existing_frame:
+                    continue
+                self.seen_frame_header = True
+                if obu.type == OBU_FRAME:
+                    reader.byte_align()
+                    header_bytes = reader.tell() // 8
+                    self._tile_group(payload[header_bytes:], frames[-1])
+            elif obu.type == OBU_TILE_GROUP:
+                if not self.seen_frame_header or not frames:
+                    raise ValueError("Tile group without a frame header in its temporal unit")
+                self._tile_group(payload, frames[-1])
+        return TemporalUnit(index, offset, len(data), obus, frames, self.sequence_header)
+
+    # Reference slots
+
+    def _ref(self, slot):
+        ref = self.ref_frames[slot]
+        if ref is None:
+            raise ValueError(f"Frame refers to the empty reference slot {slot}")
+        return ref
+
+    def _relative_distance(self, a, b):
+        if not self.sequence_header.enable_order_hint:
+            return 0
+        diff = a - b
+        m = 1 << (self.sequence_header.order_hint_bits - 1)
+        return (diff & (m - 1)) - (diff & m)
+
+    def _ref_order_hint(self, slot):
+        ref = self.ref_frames[slot]
+        return 0 if ref is None else ref.order_hint
+
+    def _set_frame_refs(self, last_frame_idx, gold_frame_idx, order_hint):
+        ref_frame_idx = [-1] * REFS_PER_FRAME
+        ref_frame_idx[0] = last_frame_idx
+        ref_frame_idx[3] = gold_frame_idx
+        used = [False] * NUM_REF_FRAMES
+        used[last_frame_idx] = used[gold_frame_idx] = True
+        current = 1 << (self.sequence_header.order_hint_bits - 1)
+        shifted = [current + self._relative_distance(self._ref_order_hint(i), order_hint)
+                   for i in range(NUM_REF_FRAMES)]
+
+        def find(backward, latest):
+            ref, best = -1, None
+            for i, hint in enumerate(shifted):
+                if used[i] or (hint >= current) != backward:
+                    continue
+                if ref < 0 or (hint >= best if latest else hint < best):
+                    ref, best = i, hint
+            return ref
+
+        for position, backward, latest in ((6, True, True), (4, True, False), (5, True, False)):
+            ref = find(backward, latest)
+            if ref >= 0:
+                ref_frame_idx[position] = ref
+                used[ref] = True
+        for position in REF_FRAME_LIST:
+            if ref_frame_idx[position] < 0:
+                ref = find(False, True)
+                if ref >= 0:
+                    ref_frame_idx[position] = ref
+                    used[ref] = True
+        earliest = min(range(NUM_REF_FRAMES), key=lambda i: shifted[i])
+        return [earliest if idx < 0 else idx for idx in ref_frame_idx]
+
+    # Uncompressed frame header
+
+    def _frame_size(self, reader, state, override):
+        sh = self.sequence_header
+        if override:
+            state['frame_width'] = reader.read_bits(sh.frame_width_bits) + 1
+            state['frame_height'] = reader.read_bits(sh.frame_height_bits) + 1
+        else:
+            state['frame_width'], state['frame_height'] = sh.max_frame_width, sh.max_frame_height
+        self._superres(reader, state)
+
+    def _superres(self, reader, state):
+        denominator = SUPERRES_NUM
+        if self.sequence_header.enable_superres and reader.read_bits(1):
+            denominator = reader.read_bits(3) + SUPERRES_DENOM_MIN
+        state['upscaled_width'] = state['frame_width']
+        state['frame_width'] = (state['upscaled_width'] * SUPERRES_NUM + denominator // 2) // denominator
+
+    def _render_size(self, reader, state):
+        if reader.read_bits(1):
+            state['render_width'] = reader.read_bits(16) + 1
+            state['render_height'] = reader.read_bits(16) + 1
+        else:
+            state['render_width'], state['render_height'] = state['upscaled_width'], state['frame_height']
+
+    def _frame_size_with_refs(self, reader, state, ref_frame_idx):
+        for i in range(REFS_PER_FRAME):
+            if reader.read_bits(1):  # found_ref
+                ref = self._ref(ref_frame_idx[i])
+                state['upscaled_width'] = ref.upscaled_width
+                state['frame_width'] = ref.upscaled_width
+                state['frame_height'] = ref.frame_height
+                state['render_width'], state['render_height'] = ref.render_width, ref.render_height
+                self._superres(reader, state)
+                return
+        self._frame_size(reader, state, True)
+        self._render_size(reader, state)
+
+    def _tile_info(self, reader, state):
+        sh = self.sequence_header
+        mi_cols = 2 * ((state['frame_width'] + 7) >> 3)
+        mi_rows = 2 * ((state['frame_height'] + 7) >> 3)
+        sb_shift = 5 if sh.use_128x128_superblock else 4
+        sb_cols = (mi_cols + (1 << sb_shift) - 1) >> sb_shift
+        sb_rows = (mi_rows + (1 << sb_shift) - 1) >> sb_shift
+        sb_size = sb_shift + 2
+        max_tile_width_sb = MAX_TILE_WIDTH >> sb_size
+        max_tile_area_sb = MAX_TILE_AREA >> (2 * sb_size)
+        min_log2_tile_cols = _tile_log2(max_tile_width_sb, sb_cols)
+        max_log2_tile_cols = _tile_log2(1, min(sb_cols, MAX_TILE_COLS))
+        max_log2_tile_rows = _tile_log2(1, min(sb_rows, MAX_TILE_ROWS))
+        min_log2_tiles = max(min_log2_tile_cols, _tile_log2(max_tile_area_sb, sb_rows * sb_cols))
+        if reader.read_bits(1):  # uniform_tile_spacing_flag
+            cols_log2 = min_log2_tile_cols
+            while cols_log2 < max_log2_tile_cols and reader.read_bits(1):
+                cols_log2 += 1
+            tile_width_sb = (sb_cols + (1 << cols_log2) - 1) >> cols_log2
+            tile_cols = -(-sb_cols // tile_width_sb)
+            rows_log2 = max(min_log2_tiles - cols_log2, 0)
+            while rows_log2 < max_log2_tile_rows and reader.read_bits(1):
+                rows_log2 += 1
+            tile_height_sb = (sb_rows + (1 << rows_log2) - 1) >> rows_log2
+            tile_rows = -(-sb_rows // tile_height_sb)
+        else:
+            widest_tile_sb, start_sb, tile_cols = 0, 0, 0
+            while start_sb < sb_cols:
+                size_sb = _ns(reader, min(sb_cols - start_sb, max_tile_width_sb)) + 1
+                widest_tile_sb = max(size_sb, widest_tile_sb)
+                start_sb += size_sb
+                tile_cols += 1
+            cols_log2 = _tile_log2(1, tile_cols)
+            if min_log2_tiles > 0:
+                max_tile_area_sb = (sb_rows * sb_cols) >> (min_log2_tiles + 1)
+            else:
+                max_tile_area_sb = sb_rows * sb_cols
+            max_tile_height_sb = max(max_tile_area_sb // widest_tile_sb, 1)
+            start_sb, tile_rows = 0, 0
+            while start_sb < sb_rows:
+                start_sb += _ns(reader, min(sb_rows - start_sb, max_tile_height_sb)) + 1
+                tile_rows += 1
+            rows_log2 = _tile_log2(1, tile_rows)
+        tile_size_bytes = 4
+        if cols_log2 > 0 or rows_log2 > 0:
+            reader.read_bits(rows_log2 + cols_log2)  # context_update_tile_id
+            tile_size_bytes = reader.read_bits(2) + 1
+        state.update(tile_cols=tile_cols, tile_rows=tile_rows, tile_cols_log2=cols_log2,
+                     tile_rows_log2=rows_log2, tile_size_bytes=tile_size_bytes)
+
+    def _quantization_params(self, reader, state):
+        sh = self.sequence_header
+
+        def delta_q():
+            return _su(reader, 7) if reader.read_bits(1) else 0
+
+        state['base_q_idx'] = reader.read_bits(8)
+        deltas = [delta_q(), 0, 0, 0, 0]  # y_dc, u_dc, u_ac, v_dc, v_ac
+        if not sh.mono_chrome:
+            diff_uv_delta = reader.read_bits(1) if sh.separate_uv_delta_q else 0
+            deltas[1], deltas[2] = delta_q(), delta_q()
+            deltas[3:] = [delta_q(), delta_q()] if diff_uv_delta else deltas[1:3]
+        state['delta_q'] = tuple(deltas)
+        state['using_qmatrix'] = reader.read_bits(1)
+        if state['using_qmatrix']:
+            reader.read_bits(4)
+            reader.read_bits(4)
+            if sh.separate_uv_delta_q:
+                reader.read_bits(4)
+
+    def _segmentation_params(self, reader, state):
+        state['segmentation_enabled'] = reader.read_bits(1)
+        features = [[None] * len(SEGMENTATION_FEATURE_BITS) for _ in range(MAX_SEGMENTS)]
+        if state['segmentation_enabled']:
+            update_data = 1
+            if state['primary_ref_frame'] != PRIMARY_REF_NONE:
+                if reader.read_bits(1):  # segmentation_update_map
+                    reader.read_bits(1)  # segmentation_temporal_update
+                update_data = reader.read_bits(1)
+            if update_data:
+                for segment in range(MAX_SEGMENTS):
+                    for feature, bits in enumerate(SEGMENTATION_FEATURE_BITS):
+                        if reader.read_bits(1):
+                            limit = SEGMENTATION_FEATURE_MAX[feature]
+                            if SEGMENTATION_FEATURE_SIGNED[feature]:
+                                value = max(-limit, min(limit, _su(reader, 1 + bits)))
+                            else:
+                                value = min(limit, reader.read_bits(bits))
+                            features[segment][feature] = value
+            else:
+                features = self._ref(state['ref_frame_idx'][state['primary_ref_frame']]).segmentation
+        state['segmentation'] = features
+
+    def _coded_lossless(self, state):
+        if any(state['delta_q']):
+            return False
+        for segment in state['segmentation'] if state['segmentation_enabled'] else [[None]]:
+            qindex = state['base_q_idx']
+            if segment[SEG_LVL_ALT_Q] is not None:
+                qindex = max(0, min(255, qindex + segment[SEG_LVL_ALT_Q]))
+            if qindex:
+                return False
+        return True
+
+    def _loop_filter_params(self, reader, state):
+        levels = [0, 0, 0, 0]
+        if not (state['coded_lossless'] or state['allow_intrabc']):
+            levels[0], levels[1] = reader.read_bits(6), reader.read_bits(6)
+            if not self.sequence_header.mono_chrome and (levels[0] or levels[1]):
+                levels[2], levels[3] = reader.read_bits(6), reader.read_bits(6)
+            reader.read_bits(3)  # loop_filter_sharpness
+            if reader.read_bits(1) and reader.read_bits(1):  # delta_enabled, delta_update
+                for _ in range(NUM_REF_FRAMES + 2):
+                    if reader.read_bits(1):
+                        _su(reader, 7)
+        state['loop_filter_level'] = tuple(levels)
+
+    def _cdef_params(self, reader, state):
+        sh = self.sequence_header
+        state['cdef_bits'] = 0
+        if state['coded_lossless'] or state['allow_intrabc'] or not sh.enable_cdef:
+            return
+        reader.read_bits(2)  # cdef_damping_minus_3
+        state['cdef_bits'] = reader.read_bits(2)
+        strength_bits = 6 if sh.mono_chrome else 12
+        reader.read_bits(strength_bits << state['cdef_bits'])
+
+    def _lr_params(self, reader, state):
+        sh = self.sequence_header
+        all_lossless = state['coded_lossless'] and state['frame_width'] == state['upscaled_width']
+        if all_lossless or state['allow_intrabc'] or not sh.enable_restoration:
+            return
+        lr_types = [reader.read_bits(2) for _ in range(1 if sh.mono_chrome else 3)]
+        if any(lr_types):
+            if sh.use_128x128_superblock:
+                reader.read_bits(1)
+            elif reader.read_bits(1):
+                reader.read_bits(1)
+            if sh.subsampling_x and sh.subsampling_y and any(lr_types[1:]):
+                reader.read_bits(1)
+
+    def _skip_mode_allowed(self, state):
+        sh = self.sequence_header
+        if state['frame_is_intra'] or not state['reference_select'] or not sh.enable_order_hint:
+            return False
+        order_hint = state['order_hint']
+        forward = backward = None
+        hints = [self._ref(idx).order_hint for idx in state['ref_frame_idx']]
+        for hint in hints:
+            if self._relative_distance(hint, order_hint) < 0:
+                if forward is None or self._relative_distance(hint, forward) > 0:
+                    forward = hint
+            elif self._relative_distance(hint, order_hint) > 0:
+                if backward is None or self._relative_distance(hint, backward) < 0:
+                    backward = hint
+        if forward is None:
+            return False
+        if backward is not None:
+            return True
+        return any(self._relative_distance(hint, forward) < 0 for hint in hints)
+
+    def _global_motion_params(self, reader, state):
+        if state['frame_is_intra']:
+            return
+        for _ in range(REFS_PER_FRAME):
+            if not reader.read_bits(1):  # is_global
+                continue
+            if reader.read_bits(1):
+                motion_type = ROTZOOM
+            else:
+                motion_type = TRANSLATION if reader.read_bits(1) else AFFINE
+            indices = []
+            if motion_type >= ROTZOOM:
+                indices += [2, 3]
+                if motion_type == AFFINE:
+                    indices += [4, 5]
+            indices += [0, 1]
+            for index in indices:
+                abs_bits = GM_ABS_ALPHA_BITS
+                if index < 2:
+                    if motion_type == TRANSLATION:
+                        abs_bits = GM_ABS_TRANS_ONLY_BITS - (not state['allow_high_precision_mv'])
+                    else:
+                        abs_bits = GM_ABS_TRANS_BITS
+                # decode_signed_subexp_with_ref(): the bits read only depend on the range
+                self._subexp(reader, 2 * (1 << abs_bits) + 1)
+
+    @staticmethod
+    def _subexp(reader, num_syms):
+        i, mk, k = 0, 0, 3
+        while True:
+            b2 = k + i - 1 if i else k
+            a = 1 << b2
+            if num_syms <= mk + 3 * a:
+                return _ns(reader, num_syms - mk) + mk
+            if not reader.read_bits(1):
+                return reader.read_bits(b2) + mk
+            i += 1
+            mk += a
+
+    def _film_grain_params(self, reader, state):
+        sh = self.sequence_header
+        state['apply_grain'] = 0
+        if not sh.film_grain_params_present or not (state['show_frame'] or state['showable_frame']):
+            return
+        state['apply_grain'] = reader.read_bits(1)
+        if not state['apply_grain']:
+            return
+        reader.read_bits(16)  # grain_seed
+        if state['frame_type'] == INTER_FRAME and not reader.read_bits(1):  # update_grain
+            reader.read_bits(3)  # film_grain_params_ref_idx
+            return
+        num_y_points = reader.read_bits(4)
+        reader.read_bits(16 * num_y_points)
+        chroma_scaling_from_luma = 0 if sh.mono_chrome else reader.read_bits(1)
+        num_cb_points = num_cr_points = 0
+        if not (sh.mono_chrome or chroma_scaling_from_luma or
+                (sh.subsampling_x == 1 and sh.subsampling_y == 1 and num_y_points == 0)):
+            num_cb_points = reader.read_bits(4)
+            reader.read_bits(16 * num_cb_points)
+            num_cr_points = reader.read_bits(4)
+            reader.read_bits(16 * num_cr_points)
+        reader.read_bits(2)  # grain_scaling_minus_8
+        lag = reader.read_bits(2)
+        positions = 2 * lag * (lag + 1)
+        if num_y_points:
+            reader.read_bits(8 * positions)
+            positions += 1
+        for points in (num_cb_points, num_cr_points):
+            if chroma_scaling_from_luma or points:
+                reader.read_bits(8 * positions)
+        reader.read_bits(4)  # ar_coeff_shift_minus_6, grain_scale_shift
+        for points in (num_cb_points, num_cr_points):
+            if points:
+                reader.read_bits(25)  # mult, luma_mult, offset
+        reader.read_bits(2)  # overlap_flag, clip_to_restricted_range
+
+    def _frame_header(self, reader, obu):
+        sh = self.sequence_header
+        state = dict(show_existing_frame=0, frame_type=KEY_FRAME, show_frame=1, showable_frame=0,
+                     error_resilient_mode=1, order_hint=0, primary_ref_frame=PRIMARY_REF_NONE,
+                     refresh_frame_flags=ALL_FRAMES, allow_intrabc=0, allow_high_precision_mv=0,
+                     ref_frame_idx=[0] * REFS_PER_FRAME, reference_select=0, skip_mode_present=0)
+        if not sh.reduced_still_picture_header:
+            state['show_existing_frame'] = reader.read_bits(1)
+            if state['show_existing_frame']:
+                return self._show_existing_frame(reader)
+            state['frame_type'] = reader.read_bits(2)
+            state['show_frame'] = reader.read_bits(1)
+            if state['show_frame'] and sh.decoder_model_info_present_flag and not sh.equal_picture_interval:
+                reader.read_bits(sh.frame_presentation_time_length)
+            if state['show_frame']:
+                state['showable_frame'] = int(state['frame_type'] != KEY_FRAME)
+            else:
+                state['showable_frame'] = reader.read_bits(1)
+            if not (state['frame_type'] == SWITCH_FRAME or
+                    (state['frame_type'] == KEY_FRAME and state['show_frame'])):
+                state['error_resilient_mode'] = reader.read_bits(1)
+        frame_type = state['frame_type']
+        frame_is_intra = state['frame_is_intra'] = frame_type in (KEY_FRAME, INTRA_ONLY_FRAME)
+        if frame_type == KEY_FRAME and state['show_frame']:
+            self.ref_frames = [None if ref is None else ref._replace(order_hint=0) for ref in self.ref_frames]
+        disable_cdf_update = reader.read_bits(1)
+        allow_screen_content_tools = sh.seq_force_screen_content_tools
+        if allow_screen_content_tools == SELECT_SCREEN_CONTENT_TOOLS:
+            allow_screen_content_tools = reader.read_bits(1)
+        force_integer_mv = 0
+        if allow_screen_content_tools:
+            force_integer_mv = sh.seq_force_integer_mv
+            if force_integer_mv == SELECT_INTEGER_MV:
+                force_integer_mv = reader.read_bits(1)
+        if frame_is_intra:
+            force_integer_mv = 1
+        if sh.frame_id_numbers_present_flag:
+            reader.read_bits(sh.frame_id_length)  # current_frame_id
+        if frame_type == SWITCH_FRAME:
+            frame_size_override_flag = 1
+        elif sh.reduced_still_picture_header:
+            frame_size_override_flag = 0
+        else:
+            frame_size_override_flag = reader.read_bits(1)
+        state['order_hint'] = reader.read_bits(sh.order_hint_bits)
+        if not (frame_is_intra or state['error_resilient_mode']):
+            state['primary_ref_frame'] = reader.read_bits(3)
+        if sh.decoder_model_info_present_flag and reader.read_bits(1):  # buffer_removal_time_present_flag
+            for idc, present in zip(sh.operating_point_idc, sh.decoder_model_present_for_this_op):
+                in_temporal_layer = (idc >> obu.temporal_id) & 1
+                in_spatial_layer = (idc >> (obu.spatial_id + 8)) & 1
+                if present and (idc == 0 or (in_temporal_layer and in_spatial_layer)):
+                    reader.read_bits(sh.buffer_removal_time_length)
+        if not (frame_type == SWITCH_FRAME or (frame_type == KEY_FRAME and state['show_frame'])):
+            state['refresh_frame_flags'] = reader.read_bits(8)
+        if (not frame_is_intra or state['refresh_frame_flags'] != ALL_FRAMES) and \
+                state['error_resilient_mode'] and sh.enable_order_hint:
+            for slot in range(NUM_REF_FRAMES):
+                ref_order_hint = reader.read_bits(sh.order_hint_bits)
+                if self.ref_frames[slot] is not None and self.ref_frames[slot].order_hint != ref_order_hint:
+                    self.ref_frames[slot] = None
+
+        if frame_is_intra:
+            self._frame_size(reader, state, frame_size_override_flag)
+            self._render_size(reader, state)
+            if allow_screen_content_tools and state['upscaled_width'] == state['frame_width']:
+                state['allow_intrabc'] = reader.read_bits(1)
+        else:
+            if sh.enable_order_hint and reader.read_bits(1):  # frame_refs_short_signaling
+                last_frame_idx, gold_frame_idx = reader.read_bits(3), reader.read_bits(3)
+                state['ref_frame_idx'] = self._set_frame_refs(last_frame_idx, gold_frame_idx, state['order_hint'])
+                short_signaling = True
+            else:
+                short_signaling = False
+            for i in range(REFS_PER_FRAME):
+                if not short_signaling:
+                    state['ref_frame_idx'][i] = reader.read_bits(3)
+                if sh.frame_id_numbers_present_flag:
+                    reader.read_bits(sh.delta_frame_id_length)
+            if frame_size_override_flag and not state['error_resilient_mode']:
+                self._frame_size_with_refs(reader, state, state['ref_frame_idx'])
+            else:
+                self._frame_size(reader, state, frame_size_override_flag)
+                self._render_size(reader, state)
+            if not force_integer_mv:
+                state['allow_high_precision_mv'] = reader.read_bits(1)
+            if not reader.read_bits(1):  # is_filter_switchable
+                reader.read_bits(2)  # interpolation_filter
+            reader.read_bits(1)  # is_motion_mode_switchable
+            if not state['error_resilient_mode'] and sh.enable_ref_frame_mvs:
+                reader.read_bits(1)  # use_ref_frame_mvs
+
+        if not (sh.reduced_still_picture_header or disable_cdf_update):
+            reader.read_bits(1)  # disable_frame_end_update_cdf
+        self._tile_info(reader, state)
+        self._quantization_params(reader, state)
+        self._segmentation_params(reader, state)
+        delta_q_present = reader.read_bits(1) if state['base_q_idx'] > 0 else 0
+        if delta_q_present:
+            reader.read_bits(2)  # delta_q_res
+            if not state['allow_intrabc'] and reader.read_bits(1):  # delta_lf_present
+                reader.read_bits(3)  # delta_lf_res, delta_lf_multi
+        state['coded_lossless'] = self._coded_lossless(state)
+        self._loop_filter_params(reader, state)
+        self._cdef_params(reader, state)
+        self._lr_params(reader, state)
+        state['tx_mode_select'] = 0 if state['coded_lossless'] else reader.read_bits(1)
+        if not frame_is_intra:
+            state['reference_select'] = reader.read_bits(1)
+        if self._skip_mode_allowed(state):
+            state['skip_mode_present'] = reader.read_bits(1)
+        if not (frame_is_intra or state['error_resilient_mode']) and sh.enable_warped_motion:
+            reader.read_bits(1)  # allow_warped_motion
+        reader.read_bits(1)  # reduced_tx_set
+        self._global_motion_params(reader, state)
+        self._film_grain_params(reader, state)
+        state['header_bits'] = reader.tell()
+
+        self._update_references(state)
+        self.frame_header = FrameHeader(**{name: state.get(name, 0) for name in FrameHeader._fields})
+        return self.frame_header
+
+    def _show_existing_frame(self, reader):
+        sh = self.sequence_header
+        slot = reader.read_bits(3)
+        if sh.decoder_model_info_present_flag and not sh.equal_picture_interval:
+            reader.read_bits(sh.frame_presentation_time_length)
+        if sh.frame_id_numbers_present_flag:
+            reader.read_bits(sh.frame_id_length)  # display_frame_id
+        ref = self._ref(slot)
+        refresh = 0
+        if ref.frame_type == KEY_FRAME:
+            # Showing a key frame resets the references to it (frame loading process)
+            refresh = ALL_FRAMES
+            self.ref_frames = [ref] * NUM_REF_FRAMES
+        return FrameHeader(
+            show_existing_frame=1, frame_type=ref.frame_type, show_frame=1, showable_frame=0,
+            error_resilient_mode=0, order_hint=ref.order_hint, primary_ref_frame=PRIMARY_REF_NONE,
+            refresh_frame_flags=refresh, upscaled_width=ref.upscaled_width, frame_width=ref.frame_width,
+            frame_height=ref.frame_height, render_width=ref.render_width, render_height=ref.render_height,
+            base_q_idx=None, delta_q=None, using_qmatrix=None, segmentation_enabled=None, coded_lossless=None,
+            loop_filter_level=None, cdef_bits=None, tx_mode_select=None, reference_select=None,
+            skip_mode_present=None, tile_cols=0, tile_rows=0, tile_cols_log2=0, tile_rows_log2=0,
+            tile_size_bytes=0, apply_grain=None, header_bits=reader.tell())
+
+    def _update_references(self, state):
+        ref = _RefFrame(state['frame_type'], state['order_hint'], state['upscaled_width'], state['frame_width'],
+                        state['frame_height'], state['render_width'], state['render_height'],
+                        state['segmentation'])
+        for slot in range(NUM_REF_FRAMES):
+            if (state['refresh_frame_flags'] >> slot) & 1:
+                self.ref_frames[slot] = ref
+
+    # Tile groups
+
+    def _tile_group(self, payload, frame):
+        header = self.frame_header
+        reader = BitReader(payload)
+        num_tiles = header.tile_cols * header.tile_rows
+        tg_start, tg_end = 0, num_tiles - 1
+        if num_tiles > 1 and reader.read_bits(1):  # tile_start_and_end_present_flag
+            tile_bits = header.tile_cols_log2 + header.tile_rows_log2
+            tg_start, tg_end = reader.read_bits(tile_bits), reader.read_bits(tile_bits)
+        reader.byte_align()
+        header_size = position = reader.tell() // 8
+        tile_sizes = []
+        for tile in range(tg_start, tg_end + 1):
+            if tile == tg_end:
+                size = len(payload) - position
+            else:
+                size_field = payload[position:position + header.tile_size_bytes]
+                size = int.from_bytes(size_field, 'little') + 1
+                position += header.tile_size_bytes + size
+            if size <= 0:
+                raise ValueError(f"Tile {tile} has {size} bytes, the frame header was not parsed correctly")
+            tile_sizes.append(size)
+        frame.tile_groups.append(TileGroup(tg_start, tg_end, len(payload), header_size, tile_sizes))
+        if tg_end == num_tiles - 1:
+            self.seen_frame_header = False
+
+
+# ISOBMFF / AVIF
+
+def _uint(data, offset, size):
+    return int.from_bytes(data[offset:offset + size], 'big')
+
+
+def read_boxes(data, start=0, end=None):
+    """Yields the Box of every ISOBMFF box between start and end (size includes the box header)."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size = _uint(data, offset, 4)
+        box_type = bytes(data[offset + 4:offset + 8]).decode('latin-1')
+        header_size = 8
+        if size == 1:
+            size = _uint(data, offset + 8, 8)
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            raise ValueError(f"Box '{box_type}' at offset {offset} has an invalid size {size}")
+        yield Box(box_type, offset, header_size, size)
+        offset += size
+
+
+def _children(data, box, full_box=False):
+    start = box.offset + box.header_size + (4 if full_box else 0)
+    return read_boxes(data, start, box.offset + box.size)
+
+
+def _parse_av1c(data, box):
+    start = box.offset + box.header_size
+    if data[start] != 0x81:
+        raise ValueError("av1C box without marker/version 1")
+    b1, b2 = data[start + 1], data[start + 2]
+    return AV1Config(
+        seq_profile=b1 >> 5, seq_level_idx_0=b1 & 0x1F, seq_tier_0=b2 >> 7, high_bitdepth=(b2 >> 6) & 1,
+        twelve_bit=(b2 >> 5) & 1, monochrome=(b2 >> 4) & 1, chroma_subsampling_x=(b2 >> 3) & 1,
+        chroma_subsampling_y=(b2 >> 2) & 1, chroma_sample_position=b2 & 3,
+        config_obus=data[start + 4:box.offset + box.size])
+
+
+def _parse_property(data, box):
+    start = box.offset + box.header_size
+    if box.type == 'av1C':
+        return _parse_av1c(data, box)
+    if box.type == 'ispe':
+        return _uint(data, start + 4, 4), _uint(data, start + 8, 4)
+    if box.type == 'pixi':
+        return tuple(data[start + 5:start + 5 + data[start + 4]].tolist())
+    if box.type == 'colr':
+        return bytes(data[start:start + 4]).decode('latin-1')
+    return box.size
+
+
+def _parse_iloc(data, box):
+    start = box.offset + box.header_size
+    version = data[start]
+    position = start + 4
+    offset_size, length_size = data[position] >> 4, data[position] & 15
+    base_offset_size, index_size = data[position + 1] >> 4, data[position + 1] & 15
+    position += 2
+    id_size = 2 if version < 2 else 4
+    count = _uint(data, position, id_size)
+    position += id_size
+    locations = {}
+    for _ in range(count):
+        item_id = _uint(data, position, id_size)
+        position += id_size
+        construction_method = 0
+        if version in (1, 2):
+            construction_method = data[position + 1] & 15
+            position += 2
+        position += 2  # data_reference_index
+        base_offset = _uint(data, position, base_offset_size)
+        position += base_offset_size
+        extent_count = _uint(data, position, 2)
+        position += 2
+        extents = []
+        for _ in range(extent_count):
+            if version in (1, 2) and index_size:
+                position += index_size
+            extent_offset = _uint(data, position, offset_size)
+            extent_length = _uint(data, position + offset_size, length_size)
+            position += offset_size + length_size
+            extents.append((base_offset + extent_offset, extent_length))
+        locations[item_id] = (construction_method, extents)
+    return locations
+
+
+def _parse_iinf(data, box):
+    start = box.offset + box.header_size
+    count_size = 2 if data[start] == 0 else 4
+    item_types = {}
+    for infe in read_boxes(data, start + 4 + count_size, box.offset + box.size):
+        position = infe.offset + infe.header_size
+        version = data[position]
+        if infe.type != 'infe' or version < 2:
+            continue
+        id_size = 2 if version == 2 else 4
+        item_id = _uint(data, position + 4, id_size)
+        type_offset = position + 4 + id_size + 2
+        item_types[item_id] = bytes(data[type_offset:type_offset + 4]).decode('latin-1')
+    return item_types
+
+
+def _parse_ipma(data, box):
+    start = box.offset + box.header_size
+    version, flags = data[start], _uint(data, start + 1, 3)
+    count = _uint(data, start + 4, 4)
+    position = start + 8
+    associations = {}
+    for _ in range(count):
+        id_size = 2 if version < 1 else 4
+        item_id = _uint(data, position, id_size)
+        position += id_size
+        count = data[position]
+        position += 1
+        indices = []
+        for _ in range(count):
+            if flags & 1:
+                indices.append(_uint(data, position, 2) & 0x7FFF)
+                position += 2
+            else:
+                indices.append(data[position] & 0x7F)
+                position += 1
+        associations[item_id] = indices
+    return associations
+
+
+def parse_avif(data):
+    """AVIFInfo of an AVIF file: brands, primary item and every item's type, iloc extents and properties."""
+    data = memoryview(data).cast('B')
+    major_brand, brands, primary_item = None, [], None
+    item_types, locations, properties, associations = {}, {}, [], {}
+    idat_offset = 0
+    for box in read_boxes(data):
+        start = box.offset + box.header_size
+        if box.type == 'ftyp':
+            major_brand = bytes(data[start:start + 4]).decode('latin-1')
+            brands = [bytes(data[o:o + 4]).decode('latin-1') for o in range(start + 8, box.offset + box.size, 4)]
+        elif box.type == 'meta':
+            for child in _children(data, box, full_box=True):
+                child_start = child.offset + child.header_size
+                if child.type == 'pitm':
+                    primary_item = _uint(data, child_start + 4, 2 if data[child_start] == 0 else 4)
+                elif child.type == 'iinf':
+                    item_types = _parse_iinf(data, child)
+                elif child.type == 'iloc':
+                    locations = _parse_iloc(data, child)
+                elif child.type == 'idat':
+                    idat_offset = child_start
+                elif child.type == 'iprp':
+                    for iprp_child in _children(data, child):
+                        if iprp_child.type == 'ipco':
+                            properties = [(p.type, _parse_property(data, p)) for p in _children(data, iprp_child)]
+                        elif iprp_child.type == 'ipma':
+                            associations.update(_parse_ipma(data, iprp_child))
+    if major_brand is None:
+        raise ValueError("Not an ISOBMFF file (no ftyp box)")
+    items = []
+    for item_id in sorted(set(item_types) | set(locations)):
+        construction_method, extents = locations.get(item_id, (0, []))
+        if construction_method == 1:
+            extents = [(idat_offset + offset, length) for offset, length in extents]
+        item_properties = dict(properties[index - 1] for index in associations.get(item_id, [])
+                               if 0 < index <= len(properties))
+        items.append(AVIFItem(item_id, item_types.get(item_id), extents, item_properties))
+    return AVIFInfo(major_brand, brands, primary_item, items)
+
+
+# Files
+
+def container_type(data):
+    """'ivf', 'avif' (any ISOBMFF file) or 'obu' (low-overhead OBU stream) from the first bytes."""
+    if bytes(data[:4]) == IVF_SIGNATURE:
+        return 'ivf'
+    if bytes(data[4:8]) == b'ftyp':
+        return 'avif'
+    return 'obu'
+
+
+def _item_data(data, extents):
+    if len(extents) == 1:
+        offset, length = extents[0]
+        return data[offset:offset + length]
+    return np.concatenate([data[offset:offset + length] for offset, length in extents])
+
+
+def parse_file(path):
+    """Yields the TemporalUnits of an IVF, AVIF (primary item) or raw OBU file."""
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    parser = AV1Parser()
+    container = container_type(data)
+    if container == 'ivf':
+        frames = ivf_frames(path)
+        next(frames)
+        for frame in frames:
+            yield parser.parse_temporal_unit(frame.data, frame.index, frame.offset)
+    elif container == 'avif':
+        info = parse_avif(data)
+        for item in info.items:
+            if item.item_id == info.primary_item and item.item_type == 'av01':
+                config = item.properties.get('av1C')
+                if config is not None and len(config.config_obus):
+                    parser.parse_temporal_unit(config.config_obus)
+                offset = item.extents[0][0] if item.extents else 0
+                yield parser.parse_temporal_unit(_item_data(data, item.extents), 0, offset)
+    else:
+        starts = [obu.offset for obu in read_obu_headers(data) if obu.type == OBU_TEMPORAL_DELIMITER] or [0]
+        starts[0] = 0
+        for index, (start, end) in enumerate(zip(starts, starts[1:] + [len(data)])):
+            yield parser.parse_temporal_unit(data[start:end], index, start)
+
+
+def _summary(values):
+    if not values:
+        return None
+    return {'min': min(values), 'mean': float(np.mean(values)), 'max': max(values)}
+
+
+def file_statistics(path):
+    """JSON-able statistics of one file: OBUs, frame types, qindex, tiles and bytes per frame."""
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    container = container_type(data)
+    statistics = {'path': path, 'container': container, 'file_bytes': int(len(data))}
+    if container == 'avif':
+        info = parse_avif(data)
+        statistics['avif'] = {
+            'major_brand': info.major_brand, 'compatible_brands': info.compatible_brands,
+            'primary_item': info.primary_item,
+            'items': [{'item_id': item.item_id, 'item_type': item.item_type,
+                       'bytes': sum(length for _, length in item.extents),
+                       'properties': {name: (value._asdict() if isinstance(value, AV1Config) else value)
+                                      for name, value in item.properties.items()}}
+                      for item in info.items],
+        }
+        for item in statistics['avif']['items']:
+            av1c = item['properties'].get('av1C')
+            if av1c is not None:
+                av1c['config_obus'] = len(av1c['config_obus'])
+    obu_counts, obu_bytes, frame_types = collections.Counter(), collections.Counter(), collections.Counter()
+    temporal_unit_bytes, frames = [], []
+    sequence_header = None
+    for unit in parse_file(path):
+        temporal_unit_bytes.append(unit.size)
+        sequence_header = unit.sequence_header
+        for obu in unit.obus:
+            name = OBU_NAMES.get(obu.type, f'reserved_{obu.type}')
+            obu_counts[name] += 1
+            obu_bytes[name] += obu.header_size + obu.size
+        for frame in unit.frames:
+            header = frame.header
+            frame_types['show_existing' if header.show_existing_frame else FRAME_TYPE_NAMES[header.frame_type]] += 1
+            frames.append({
+                'temporal_unit': unit.index,
+                'frame_type': FRAME_TYPE_NAMES[header.frame_type],
+                'show_frame': header.show_frame,
+                'show_existing_frame': header.show_existing_frame,
+                'order_hint': header.order_hint,
+                'width': header.upscaled_width,
+                'height': header.frame_height,
+                'base_q_idx': header.base_q_idx,
+                'tiles': header.tile_cols * header.tile_rows,
+                'bytes': frame.header_size + sum(group.size for group in frame.tile_groups),
+                'tile_bytes': [size for group in frame.tile_groups for size in group.tile_sizes],
+            })
+    coded = [frame for frame in frames if not frame['show_existing_frame']]
+    if sequence_header is not None:
+        statistics['sequence_header'] = {
+            'profile': sequence_header.seq_profile, 'level': sequence_header.seq_level_idx[0],
+            'still_picture': sequence_header.still_picture, 'bit_depth': sequence_header.bit_depth,
+            'mono_chrome': sequence_header.mono_chrome,
+            'subsampling': [sequence_header.subsampling_x, sequence_header.subsampling_y],
+            'max_frame_size': [sequence_header.max_frame_width, sequence_header.max_frame_height],
+            'film_grain_params_present': sequence_header.film_grain_params_present,
+        }
+    statistics.update({
+        'temporal_units': len(temporal_unit_bytes),
+        'coded_frames': len(coded),
+        'shown_frames': sum(frame['show_frame'] for frame in frames),
+        'obu_counts': dict(obu_counts),
+        'obu_bytes': dict(obu_bytes),
+        'frame_types': dict(frame_types),
+        'qindex': _summary([frame['base_q_idx'] for frame in coded]),
+        'tiles': _summary([frame['tiles'] for frame in coded]),
+        'frame_bytes': _summary([frame['bytes'] for frame in coded]),
+        'temporal_unit_bytes': temporal_unit_bytes,
+        'frames': frames,
+    })
+    return statistics
+
+
+def directory_statistics(directory, extensions=('.ivf', '.avif', '.obu')):
+    """{path: file_statistics()} of every matching file under a directory; failures map to {'error': ...}."""
+    results = {}
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            if os.path.splitext(name)[1].lower() in extensions:
+                path = os.path.join(root, name)
+                try:
+                    results[path] = file_statistics(path)
+                except (ValueError, EOFError, OSError) as error:
+                    results[path] = {'path': path, 'error': str(error)}
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    repository = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    parser = argparse.ArgumentParser(description="AV1 bitstream statistics of IVF, AVIF and OBU files.")
+    parser.add_argument('paths', nargs='*', help="files or directories",
+                        default=[os.path.join(repository, 'original_image_smooth.avif'),
+                                 os.path.join(repository, 'img_Johnny_1280x720.ivf')])
+    parser.add_argument('--frames', action='store_true', help="include the per-frame records")
+    parser.add_argument('--output', help="JSON output path (default: print to stdout)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = {}
+    for path in args.paths:
+        if os.path.isdir(path):
+            report.update(directory_statistics(path))
+        else:
+            report[path] = file_statistics(path)
+    elapsed = time.perf_counter() - start
+    if not args.frames:
+        for statistics in report.values():
+            statistics.pop('frames', None)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+    print(f"Parsed {len(report)} files in {elapsed * 1000:.1f} ms", file=sys.stderr)
@@ -0,0 +1,257 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+import arithmeticcoding
+from bit_io import BitWriter, BitReader
+from canonical_huffman import encode_stream, decode_stream
+from coefficient_tokenizer import tokenize, merge_levels
+from range_coder import RangeEncoder, RangeDecoder, cdf_from_counts
+from rans_coder import build_table, rans_encode_bytes, rans_decode_bytes
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'encoding_loop_intra_modes'))
+
+from block_transform import pad_frame, frame_to_blocks, dct2_blocks  # noqa: E402
+from integer_transform import coefficient_scale  # noqa: E402
+from intra_prediction import gather_edges, dc_predict  # noqa: E402
+from quantizer import quantize  # noqa: E402
+
+# Entropy coder benchmark on real coefficients.
+#
+# Frames of img_Johnny_1280x720.ivf are decoded with PyAV (the repository has
+# no AV1 decoder; without PyAV --still-image-fallback benchmarks
+# original_image_smooth.png instead and the report says so), predicted with
+# DC_PRED from the original neighbours, transformed with the 4x4 DCT and
+# quantized at several qindex values. The coefficients before each block's
+# EOB are folded to non-negative symbols (0, -1, 1, -2, ... -> 0, 1, 2, 3,
+# ...); values from ESCAPE_SYMBOL up are coded as that symbol plus an
+# Exp-Golomb remainder whose bits are the same for every coder.
+#
+# Every coder gets the same symbol stream and is timed for encode and decode;
+# the peak memory is traced in a second, untimed run. The JSON report holds
+# bits/symbol (the coded frequency table included) against the Shannon
+# entropy, MB/s of the int16 coefficient input and the peak memory, e.g.
+#
+#   python benchmark_entropy_coders.py --frames 2 --qindex 32 96 160 --output results.json
+
+ESCAPE_SYMBOL = 63
+BLOCK_SIZE = 4
+BYTES_PER_COEFFICIENT = 2
+MODEL_SCALE_BITS = 15
+
+
+def load_luma_frames(count=1, still_image_fallback=False):
+    """Returns up to count 8-bit luma frames of the repository's test clip and their source name.
+
+    Without PyAV this raises ImportError, unless still_image_fallback is set:
+    then the single frame of original_image_smooth.png is returned instead.
+    """
+    try:
+        import av
+    except ImportError:
+        if not still_image_fallback:
+            raise ImportError("PyAV is needed to decode img_Johnny_1280x720.ivf "
+                              "(or use the original_image_smooth.png fallback)") from None
+        import cv2
+        image = cv2.imread(os.path.join(REPO_DIR, 'original_image_smooth.png'), cv2.IMREAD_GRAYSCALE)
+        return [image], 'original_image_smooth.png'
+    frames = []
+    with av.open(os.path.join(REPO_DIR, 'img_Johnny_1280x720.ivf')) as container:
+        for frame in container.decode(video=0):
+            frames.append(frame.to_ndarray(format='gray'))
+            if len(frames) == count:
+                break
+    return frames, 'img_Johnny_1280x720.ivf'
+
+
+def quantized_coefficients(frame, qindex):
+    """DC_PRED residual -> 4x4 DCT -> AV1 quantizer, returns (N, 4, 4) levels."""
+    frame = pad_frame(np.asarray(frame, dtype=np.int32), BLOCK_SIZE)
+    grid = frame_to_blocks(frame, BLOCK_SIZE)
+    rows, cols = grid.shape[:2]
+    ys, xs = [a.ravel() * BLOCK_SIZE for a in np.mgrid[0:rows, 0:cols]]
+    prediction = dc_predict(gather_edges(frame, ys, xs, BLOCK_SIZE, BLOCK_SIZE), BLOCK_SIZE, BLOCK_SIZE)
+    residual = grid.reshape(-1, BLOCK_SIZE, BLOCK_SIZE) - prediction
+    coefficients = np.round(dct2_blocks(residual) * coefficient_scale(BLOCK_SIZE, BLOCK_SIZE))
+    return quantize(coefficients, qindex)
+
+
+def coefficient_symbols(levels):
+    """Folded symbols of the coefficients before EOB and the Exp-Golomb bits of the escapes."""
+    tokens = tokenize(levels)
+    values = merge_levels(tokens.base, tokens.br, tokens.golomb, tokens.sign)
+    folded = np.where(values < 0, -2 * values - 1, 2 * values)
+    symbols = np.minimum(folded, ESCAPE_SYMBOL)
+    escapes = folded[folded >= ESCAPE_SYMBOL] - ESCAPE_SYMBOL
+    escape_bits = int(np.sum(2 * np.floor(np.log2(escapes + 1)).astype(np.int64) + 1))
+    return symbols.astype(np.int64), escape_bits
+
+
+def shannon_entropy(symbols, alphabet_size):
+    probabilities = np.bincount(symbols, minlength=alphabet_size) / symbols.size
+    probabilities = probabilities[probabilities > 0]
+    return float(-np.sum(probabilities * np.log2(probabilities)))
+
+
+# Each coder: encode(symbols, counts) -> bytes incl. its model, decode(bytes, count, alphabet_size) -> symbols.
+# The static models are quantized to MODEL_SCALE_BITS and written in front of
+# the payload as leb128 frequencies, so the decoder rebuilds them from the stream.
+
+def _write_model(frequencies):
+    writer = BitWriter()
+    for frequency in frequencies:
+        writer.write_leb128(int(frequency))
+    return writer.getvalue()
+
+
+def _read_model(data, alphabet_size):
+    """Returns the frequencies written by _write_model() and the payload after them."""
+    reader = BitReader(data)
+    frequencies = np.array([reader.read_leb128() for _ in range(alphabet_size)], dtype=np.int64)
+    return frequencies, data[reader.tell() // 8:]
+
+
+def _huffman_encode(symbols, counts):
+    return encode_stream(symbols, alphabet_size=len(counts))
+
+
+def _huffman_decode(data, count, alphabet_size):
+    return decode_stream(data)
+
+
+def _range_encode(symbols, counts):
+    cdf = cdf_from_counts(counts)
+    encoder = RangeEncoder()
+    encoder.encode_symbols(symbols, cdf)
+    return _write_model(np.diff(cdf, prepend=0)) + encoder.finish()
+
+
+def _range_decode(data, count, alphabet_size):
+    frequencies, payload = _read_model(data, alphabet_size)
+    return RangeDecoder(payload).decode_symbols(count, np.cumsum(frequencies).astype(np.uint16))
+
+
+def _rans_encode(symbols, counts):
+    table = build_table(counts, MODEL_SCALE_BITS)
+    return _write_model(table.freq) + rans_encode_bytes(symbols, table, lanes=32)
+
+
+def _rans_decode(data, count, alphabet_size):
+    frequencies, payload = _read_model(data, alphabet_size)
+    return rans_decode_bytes(payload, count, build_table(frequencies, MODEL_SCALE_BITS), lanes=32)
+
+
+def _arithmetic_encode(symbols, counts):
+    frequencies = build_table(np.maximum(counts, 1), MODEL_SCALE_BITS).freq
+    stream = BitWriter()
+    bitout = arithmeticcoding.BitOutputStream(stream)
+    encoder = arithmeticcoding.ArithmeticEncoder(32, bitout)
+    encoder.write_many(arithmeticcoding.SimpleFrequencyTable(frequencies.tolist()), symbols)
+    encoder.finish()
+    bitout.close()
+    return _write_model(frequencies) + stream.getvalue()
+
+
+def _arithmetic_decode(data, count, alphabet_size):
+    frequencies, payload = _read_model(data, alphabet_size)
+    bitin = arithmeticcoding.BitInputStream(BitReader(payload))
+    decoder = arithmeticcoding.ArithmeticDecoder(32, bitin)
+    return decoder.read_many(arithmeticcoding.SimpleFrequencyTable(frequencies.tolist()), count)
+
+
+CODERS = {
+    'huffman': (_huffman_encode, _huffman_decode),
+    'arithmetic': (_arithmetic_encode, _arithmetic_decode),
+    'range': (_range_encode, _range_decode),
+    'rans': (_rans_encode, _rans_decode),
+}
+
+
+def benchmark_coder(name, symbols, counts, escape_bits):
+    encode, decode = CODERS[name]
+    input_megabytes = symbols.size * BYTES_PER_COEFFICIENT / 1e6
+    # Timed run without tracing (tracemalloc slows the pure-Python coders down many times)
+    start = time.perf_counter()
+    data = encode(symbols, counts)
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = decode(data, symbols.size, len(counts))
+    decode_time = time.perf_counter() - start
+    # Separate traced run for the peak memory
+    tracemalloc.start()
+    decode(encode(symbols, counts), symbols.size, len(counts))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'bytes': len(data),
+        'bits_per_symbol': (8 * len(data) + escape_bits) / symbols.size,
+        'encode_mb_per_s': input_megabytes / encode_time,
+        'decode_mb_per_s': input_megabytes / decode_time,
+        'peak_memory_bytes': peak,
+        'lossless': bool(np.array_equal(decoded, symbols)),
+    }
+
+
+def run_benchmark(frames, qindices, coders=None):
+    """Returns the result records, one per qindex."""
+    if coders is None:
+        coders = list(CODERS)
+    results = []
+    for qindex in qindices:
+        levels = np.concatenate([quantized_coefficients(frame, qindex) for frame in frames])
+        symbols, escape_bits = coefficient_symbols(levels)
+        counts = np.bincount(symbols, minlength=ESCAPE_SYMBOL + 1)
+        record = {
+            'qindex': int(qindex),
+            'coefficients': int(levels.size),
+            'symbols': int(symbols.size),
+            'escape_bits': escape_bits,
+            'entropy_bits_per_symbol': shannon_entropy(symbols, len(counts)) + escape_bits / symbols.size,
+            'coders': {},
+        }
+        for name in coders:
+            record['coders'][name] = benchmark_coder(name, symbols, counts, escape_bits)
+        results.append(record)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the entropy coders on quantized coefficients.")
+    parser.add_argument('--frames', type=int, default=1, help="number of frames to decode")
+    parser.add_argument('--qindex', type=int, nargs='+', default=[32, 96, 160, 224])
+    parser.add_argument('--coders', nargs='+', choices=list(CODERS), default=list(CODERS))
+    parser.add_argument('--output', help="JSON output path (default: print to stdout)")
+    parser.add_argument('--still-image-fallback', action='store_true',
+                        help="without PyAV, benchmark the single original_image_smooth.png frame")
+    args = parser.parse_args()
+
+    frames, source = load_luma_frames(args.frames, args.still_image_fallback)
+    fallback = source == 'original_image_smooth.png'
+    if fallback:
+        print(f"PyAV not available: using {source}, 1 frame instead of {args.frames}", file=sys.stderr)
+    report = {
+        'source': source,
+        'still_image_fallback': fallback,
+        'frames_requested': args.frames,
+        'frames': len(frames),
+        'frame_shape': list(frames[0].shape),
+        'block_size': BLOCK_SIZE,
+        'results': run_benchmark(frames, args.qindex, args.coders),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+
+    for record in report['results']:
+        summary = ", ".join(f"{name} {result['bits_per_symbol']:.3f}" for name, result in record['coders'].items())
+        print(f"qindex {record['qindex']}: {record['symbols']} symbols, entropy "
+              f"{record['entropy_bits_per_symbol']:.3f} bits/symbol | {summary}", file=sys.stderr)
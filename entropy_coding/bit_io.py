@@ -0,0 +1,228 @@
+import numpy as np
+
+# In-memory bit I/O.
+#
+# The arithmetic coding scripts used to write encoded.bin to the working
+# directory, read it back to print it, and build the bit string with
+# ''.join(format(byte, '08b')). BitWriter and BitReader keep everything in a
+# bytearray instead: bits are collected MSB first in an integer accumulator
+# that is flushed to the buffer 64 bits at a time, and the reader refills its
+# accumulator with up to 8 bytes at once. Besides raw bits they handle
+# unsigned/signed Exp-Golomb codes and leb128 (the AV1 OBU size field).
+#
+# BitWriter.write() and BitReader.read() also make them usable as the byte
+# stream behind Nayuki's BitOutputStream / BitInputStream, so nothing goes
+# through the disk and concurrent encodes cannot overwrite each other's file.
+
+ACCUMULATOR_BITS = 64
+
+
+class BitWriter:
+    """Writes bits MSB first into a growing, preallocated bytearray."""
+
+    def __init__(self, capacity=4096):
+        self.buffer = bytearray(capacity)
+        self.size = 0
+        self.accumulator = 0
+        self.bit_count = 0
+
+    def _reserve(self, extra):
+        if self.size + extra > len(self.buffer):
+            self.buffer.extend(bytes(max(len(self.buffer), extra)))
+
+    def _flush_bytes(self):
+        whole = self.bit_count >> 3
+        if whole:
+            remaining = self.bit_count - 8 * whole
+            self._reserve(whole)
+            self.buffer[self.size:self.size + whole] = (self.accumulator >> remaining).to_bytes(whole, 'big')
+            self.size += whole
+            self.accumulator &= (1 << remaining) - 1
+            self.bit_count = remaining
+
+    def write_bits(self, value, count):
+        """Appends the count low bits of value, MSB first (count <= 64)."""
+        if count > ACCUMULATOR_BITS:
+            raise ValueError(f"At most {ACCUMULATOR_BITS} bits per call, got {count}")
+        self.accumulator = (self.accumulator << count) | (value & ((1 << count) - 1))
+        self.bit_count += count
+        if self.bit_count >= ACCUMULATOR_BITS:
+            self._flush_bytes()
+
+    def write_bit(self, bit):
+        self.write_bits(bit, 1)
+
+    def write_ue(self, value):
+        """Unsigned Exp-Golomb: (length - 1) zeros, then value + 1 in binary."""
+        length = (value + 1).bit_length()
+        if 2 * length - 1 <= ACCUMULATOR_BITS:
+            self.write_bits(value + 1, 2 * length - 1)
+        else:
+            self.write_bits(0, length - 1)
+            self.write_bits(value + 1, length)
+
+    def write_se(self, value):
+        """Signed Exp-Golomb: 0, 1, -1, 2, -2, ... map to 0, 1, 2, 3, 4, ..."""
+        self.write_ue(2 * value - 1 if value > 0 else -2 * value)
+
+    def write_leb128(self, value):
+        """Unsigned little-endian base 128, byte aligned, at most 8 bytes as in AV1."""
+        if self.bit_count % 8:
+            raise ValueError("leb128 must start on a byte boundary")
+        if value >= 1 << 56:
+            raise ValueError(f"{value} needs more than 8 leb128 bytes")
+        while True:
+            byte = value & 0x7F
+            value >>= 7
+            self.write_bits(byte | (0x80 if value else 0), 8)
+            if not value:
+                break
+
+    def write_bytes(self, data):
+        """Appends whole bytes; fast path when the writer is byte aligned."""
+        if self.bit_count % 8:
+            for byte in bytes(data):
+                self.write_bits(byte, 8)
+            return
+        self._flush_bytes()
+        self._reserve(len(data))
+        self.buffer[self.size:self.size + len(data)] = data
+        self.size += len(data)
+
+    def byte_align(self):
+        """Pads with zero bits up to the next byte boundary."""
+        if self.bit_count % 8:
+            self.write_bits(0, 8 - self.bit_count % 8)
+
+    def tell(self):
+        """Number of bits written so far."""
+        return 8 * self.size + self.bit_count
+
+    def getvalue(self):
+        """Returns the written bytes, the last partial byte padded with zeros."""
+        self._flush_bytes()
+        tail = b''
+        if self.bit_count:
+            tail = bytes([(self.accumulator << (8 - self.bit_count)) & 0xFF])
+        return bytes(self.buffer[:self.size]) + tail
+
+    # File-like interface for arithmeticcoding.BitOutputStream
+    def write(self, data):
+        self.write_bytes(data)
+        return len(data)
+
+    def close(self):
+        pass
+
+
+class BitReader:
+    """Reads bits MSB first from a bytes-like object without copying it."""
+
+    def __init__(self, data):
+        self.data = memoryview(data).cast('B')
+        self.position = 0
+        self.accumulator = 0
+        self.bit_count = 0
+
+    def _refill(self, needed):
+        while self.bit_count < needed:
+            chunk = self.data[self.position:self.position + 8]
+            if not chunk:
+                raise EOFError("Read past the end of the bit stream")
+            self.accumulator = (self.accumulator << (8 * len(chunk))) | int.from_bytes(chunk, 'big')
+            self.bit_count += 8 * len(chunk)
+            self.position += len(chunk)
+
+    def read_bits(self, count):
+        """Returns the next count bits as an unsigned integer."""
+        if count == 0:
+            return 0
+        self._refill(count)
+        self.bit_count -= count
+        value = self.accumulator >> self.bit_count
+        self.accumulator &= (1 << self.bit_count) - 1
+        return value
+
+    def read_bit(self):
+        return self.read_bits(1)
+
+    def read_ue(self):
+        zeros = 0
+        while not self.read_bits(1):
+            zeros += 1
+        return ((1 << zeros) | self.read_bits(zeros)) - 1
+
+    def read_se(self):
+        value = self.read_ue()
+        return (value + 1) >> 1 if value & 1 else -(value >> 1)
+
+    def read_leb128(self):
+        value = 0
+        for index in range(8):
+            byte = self.read_bits(8)
+            value |= (byte & 0x7F) << (7 * index)
+            if not byte & 0x80:
+                break
+        return value
+
+    def byte_align(self):
+        self.read_bits(self.bit_count % 8)
+
+    def tell(self):
+        """Number of bits consumed so far."""
+        return 8 * self.position - self.bit_count
+
+    def bits_left(self):
+        return 8 * len(self.data) - self.tell()
+
+    # File-like interface for arithmeticcoding.BitInputStream
+    def read(self, size=-1):
+        if self.bit_count % 8:
+            raise ValueError("Byte reads need a byte aligned reader")
+        if size < 0:
+            size = self.bits_left() // 8
+        size = min(size, self.bits_left() // 8)
+        return bytes(self.read_bits(8) for _ in range(size))
+
+    def close(self):
+        pass
+
+
+def to_bit_string(data):
+    """'0'/'1' string of a bytes object, for printing."""
+    bits = np.unpackbits(np.frombuffer(bytes(data), dtype=np.uint8)) + ord('0')
+    return bits.tobytes().decode('ascii')
+
+
+if __name__ == "__main__":
+    import time
+
+    writer = BitWriter()
+    writer.write_bits(0b101, 3)
+    writer.write_ue(7)
+    writer.write_se(-3)
+    writer.byte_align()
+    writer.write_leb128(300)
+    data = writer.getvalue()
+    print(f"Written {writer.tell()} bits: {data.hex()} = {to_bit_string(data)}")
+    reader = BitReader(data)
+    values = [reader.read_bits(3), reader.read_ue(), reader.read_se()]
+    reader.byte_align()
+    values.append(reader.read_leb128())
+    print(f"Read back: {values}")
+
+    # Exp-Golomb coding of one million coefficient magnitudes
+    rng = np.random.default_rng(0)
+    magnitudes = (rng.geometric(0.4, 1_000_000) - 1).tolist()
+    start = time.perf_counter()
+    writer = BitWriter()
+    for value in magnitudes:
+        writer.write_ue(value)
+    data = writer.getvalue()
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    reader = BitReader(data)
+    decoded = [reader.read_ue() for _ in magnitudes]
+    decode_time = time.perf_counter() - start
+    print(f"\n{len(magnitudes)} ue(v) values: {len(data)} bytes, write {encode_time:.2f} s, "
+          f"read {decode_time:.2f} s, lossless: {decoded == magnitudes}")
@@ -0,0 +1,234 @@
+import collections
+import heapq
+import numpy as np
+
+# Canonical, length-limited Huffman coding with table-driven decoding.
+#
+# huffman_test_many_funcs.py builds the codes recursively into a shared
+# mutable default dict, codes to a str of '0'/'1' characters and decodes by
+# walking the tree one bit at a time. Here:
+#
+#   lengths   from a heap over (weight, id) pairs, then limited to
+#             max_length bits with the JPEG (Annex K.3) length adjustment
+#   codes     canonical: sorted by (length, symbol), so only the lengths are
+#             transmitted, 4 bits per symbol in a small header
+#   encode    all codes expanded into one bit matrix and packed with
+#             np.packbits, no per-symbol Python work
+#   decode    a 2^10-entry first-level table gives symbol and length for
+#             every code of up to 10 bits, longer codes go through a
+#             second-level table per 10-bit prefix
+
+MAX_CODE_LENGTH = 15
+PRIMARY_BITS = 10
+
+HuffmanCode = collections.namedtuple('HuffmanCode', ['lengths', 'codes'])
+DecodeTables = collections.namedtuple(
+    'DecodeTables', ['max_length', 'primary_symbol', 'primary_length', 'secondary'])
+
+
+def huffman_lengths(counts):
+    """Unlimited Huffman code lengths from symbol counts (0 for unused symbols)."""
+    counts = np.asarray(counts, dtype=np.int64)
+    used = np.flatnonzero(counts)
+    lengths = np.zeros(len(counts), dtype=np.int32)
+    if len(used) == 1:
+        lengths[used] = 1
+        return lengths
+    # Each heap entry is (weight, tie-breaker, symbols below this node)
+    heap = [(int(counts[s]), int(s), [int(s)]) for s in used]
+    heapq.heapify(heap)
+    while len(heap) > 1:
+        w1, t1, s1 = heapq.heappop(heap)
+        w2, t2, s2 = heapq.heappop(heap)
+        lengths[s1] += 1
+        lengths[s2] += 1
+        heapq.heappush(heap, (w1 + w2, min(t1, t2), s1 + s2))
+    return lengths
+
+
+def limit_lengths(lengths, counts, max_length=MAX_CODE_LENGTH):
+    """Limits code lengths to max_length and gives the shortest codes to the most frequent symbols."""
+    lengths = np.asarray(lengths)
+    if lengths.max() <= max_length:
+        return lengths
+    bits = np.bincount(lengths, minlength=lengths.max() + 1)
+    bits[0] = 0
+    for i in range(len(bits) - 1, max_length, -1):
+        while bits[i] > 0:
+            j = i - 2
+            while bits[j] == 0:
+                j -= 1
+            bits[i] -= 2
+            bits[i - 1] += 1
+            bits[j + 1] += 2
+            bits[j] -= 1
+    used = np.flatnonzero(lengths)
+    order = used[np.lexsort((used, -np.asarray(counts)[used]))]
+    limited = np.zeros_like(lengths)
+    limited[order] = np.repeat(np.arange(len(bits)), bits)[:len(order)]
+    return limited
+
+
+def canonical_codes(lengths):
+    """Assigns canonical codes: shorter codes first, equal lengths in symbol order."""
+    lengths = np.asarray(lengths, dtype=np.int32)
+    codes = np.zeros(len(lengths), dtype=np.int64)
+    code = 0
+    previous_length = 0
+    for symbol in np.lexsort((np.arange(len(lengths)), lengths)):
+        length = int(lengths[symbol])
+        if length == 0:
+            continue
+        code <<= length - previous_length
+        codes[symbol] = code
+        code += 1
+        previous_length = length
+    return codes
+
+
+def build_code(counts, max_length=MAX_CODE_LENGTH):
+    lengths = limit_lengths(huffman_lengths(counts), counts, max_length)
+    return HuffmanCode(lengths, canonical_codes(lengths))
+
+
+def serialize_lengths(lengths):
+    """Header: alphabet size as uint16, then one 4-bit code length per symbol."""
+    lengths = np.asarray(lengths, dtype=np.uint8)
+    if lengths.max(initial=0) > MAX_CODE_LENGTH:
+        raise ValueError(f"Code lengths above {MAX_CODE_LENGTH} do not fit the 4-bit header")
+    nibbles = np.zeros(len(lengths) + len(lengths) % 2, dtype=np.uint8)
+    nibbles[:len(lengths)] = lengths
+    packed = (nibbles[0::2] << 4) | nibbles[1::2]
+    return len(lengths).to_bytes(2, 'little') + packed.tobytes()
+
+
+def deserialize_lengths(data):
+    """Returns (lengths, header size in bytes)."""
+    size = int.from_bytes(bytes(data[:2]), 'little')
+    packed = np.frombuffer(bytes(data[2:2 + (size + 1) // 2]), dtype=np.uint8)
+    lengths = np.stack([packed >> 4, packed & 0x0F], axis=1).ravel()[:size].astype(np.int32)
+    return lengths, 2 + (size + 1) // 2
+
+
+def huffman_encode(symbols, code):
+    """Returns (payload bytes, bit count) for an array of symbols."""
+    symbols = np.asarray(symbols, dtype=np.int64).ravel()
+    lengths = code.lengths[symbols]
+    if np.any(lengths == 0):
+        raise ValueError("Symbol without a code in the stream")
+    codes = code.codes[symbols]
+    max_length = int(lengths.max(initial=1))
+    positions = np.arange(max_length)
+    bit_matrix = (codes[:, np.newaxis] >> (lengths[:, np.newaxis] - 1 - positions)) & 1
+    bits = bit_matrix[positions < lengths[:, np.newaxis]].astype(np.uint8)
+    return np.packbits(bits).tobytes(), int(lengths.sum())
+
+
+def build_decode_tables(code, primary_bits=PRIMARY_BITS):
+    """First-level table indexed by the next primary_bits bits, second level for longer codes."""
+    lengths = np.asarray(code.lengths)
+    max_length = max(int(lengths.max()), primary_bits)
+    primary_symbol = np.full(1 << primary_bits, -1, dtype=np.int64)
+    primary_length = np.zeros(1 << primary_bits, dtype=np.int64)
+    secondary_bits = max_length - primary_bits
+    secondary = {}
+    for symbol in np.flatnonzero(lengths):
+        length = int(lengths[symbol])
+        code_value = int(code.codes[symbol])
+        if length <= primary_bits:
+            first = code_value << (primary_bits - length)
+            primary_symbol[first:first + (1 << (primary_bits - length))] = symbol
+            primary_length[first:first + (1 << (primary_bits - length))] = length
+        else:
+            prefix = code_value >> (length - primary_bits)
+            table = secondary.setdefault(prefix, (np.zeros(1 << secondary_bits, dtype=np.int64),
+                                                  np.zeros(1 << secondary_bits, dtype=np.int64)))
+            rest = code_value & ((1 << (length - primary_bits)) - 1)
+            first = rest << (max_length - length)
+            table[0][first:first + (1 << (max_length - length))] = symbol
+            table[1][first:first + (1 << (max_length - length))] = length
+    secondary = {prefix: (s.tolist(), l.tolist()) for prefix, (s, l) in secondary.items()}
+    return DecodeTables(max_length, primary_symbol.tolist(), primary_length.tolist(), secondary)
+
+
+def huffman_decode(payload, count, code, primary_bits=PRIMARY_BITS):
+    """Decodes count symbols from the packed payload."""
+    tables = build_decode_tables(code, primary_bits)
+    max_length = tables.max_length
+    bits = np.unpackbits(np.frombuffer(bytes(payload), dtype=np.uint8))
+    bits = np.concatenate([bits, np.zeros(max_length, dtype=np.uint8)])
+    # The next max_length bits at every bit position, as one integer each
+    weights = 1 << np.arange(max_length - 1, -1, -1)
+    windows = (np.lib.stride_tricks.sliding_window_view(bits, max_length)[:len(bits) - max_length] @ weights).tolist()
+
+    shift = max_length - primary_bits
+    secondary_mask = (1 << shift) - 1
+    primary_symbol = tables.primary_symbol
+    primary_length = tables.primary_length
+    secondary = tables.secondary
+    output = [0] * count
+    position = 0
+    for i in range(count):
+        window = windows[position]
+        index = window >> shift
+        symbol = primary_symbol[index]
+        if symbol >= 0:
+            position += primary_length[index]
+        else:
+            symbols, lengths = secondary[index]
+            symbol = symbols[window & secondary_mask]
+            position += lengths[window & secondary_mask]
+        output[i] = symbol
+    return np.array(output, dtype=np.int64)
+
+
+def encode_stream(symbols, alphabet_size=None, max_length=MAX_CODE_LENGTH):
+    """Self-contained stream: uint32 symbol count, code length header, packed payload."""
+    symbols = np.asarray(symbols, dtype=np.int64).ravel()
+    if alphabet_size is None:
+        alphabet_size = int(symbols.max(initial=0)) + 1
+    code = build_code(np.bincount(symbols, minlength=alphabet_size), max_length)
+    payload, _ = huffman_encode(symbols, code)
+    return symbols.size.to_bytes(4, 'little') + serialize_lengths(code.lengths) + payload
+
+
+def decode_stream(data):
+    count = int.from_bytes(bytes(data[:4]), 'little')
+    lengths, header_size = deserialize_lengths(data[4:])
+    code = HuffmanCode(lengths, canonical_codes(lengths))
+    return huffman_decode(data[4 + header_size:], count, code)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    flat_block = quantized_block.flatten()
+    symbols, indices, counts = np.unique(flat_block, return_inverse=True, return_counts=True)
+    code = build_code(counts)
+    print("Canonical Huffman Codes for Quantized Block:")
+    for symbol, length, value in zip(symbols, code.lengths, code.codes):
+        print(f"Value: {symbol}, Code: {int(value):0{length}b}")
+    payload, bit_count = huffman_encode(indices, code)
+    decoded_block = symbols[huffman_decode(payload, flat_block.size, code)].reshape(quantized_block.shape)
+    print(f"\nEncoded {flat_block.size} symbols into {bit_count} bits ({len(payload)} bytes)")
+    print("Decoding successful!" if np.array_equal(decoded_block, quantized_block) else "Decoding failed!")
+
+    # One million symbols over a skewed 64-symbol alphabet, so some codes exceed 10 bits
+    rng = np.random.default_rng(0)
+    data = np.minimum(rng.geometric(0.3, 1_000_000) - 1, 63)
+    for max_length in (15, 12):
+        start = time.perf_counter()
+        stream = encode_stream(data, alphabet_size=64, max_length=max_length)
+        encode_time = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = decode_stream(stream)
+        decode_time = time.perf_counter() - start
+        print(f"max_length {max_length}: {len(stream)} bytes ({8 * len(stream) / data.size:.4f} bits/symbol), "
+              f"encode {encode_time:.2f} s, decode {decode_time:.2f} s, lossless: {np.array_equal(decoded, data)}")
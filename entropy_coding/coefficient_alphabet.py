@@ -0,0 +1,142 @@
+import numpy as np
+import arithmeticcoding
+
+# Signed coefficient alphabet for Nayuki's arithmetic coder.
+#
+# entropy_general_simpleProbTable_then_arithmetic_coding_decoding.py codes
+# symbol & 0xFF against a 256-entry table and maps decoded symbols >= 128
+# back to negative values, so any |coefficient| >= 128 decodes wrongly and
+# every block pays for 240 unused symbols. Here coefficients are zig-zag
+# folded to non-negative symbols,
+#
+#   0, -1, 1, -2, 2, ...  ->  0, 1, 2, 3, 4, ...
+#
+# and the alphabet only spans the folded values actually present. If that is
+# more than max_symbols, the last symbol becomes an escape: folded values
+# from the escape up are coded as the escape symbol followed by the
+# remainder as an Exp-Golomb code of equiprobable bits, through the same
+# arithmetic coder. So the frequency table stays small and any coefficient
+# magnitude (10/12-bit residuals included) round-trips.
+
+MAX_SYMBOLS = 256
+
+
+def fold(values):
+    """Zig-zag maps signed integers to non-negative ones."""
+    values = np.asarray(values, dtype=np.int64)
+    return np.where(values < 0, -2 * values - 1, 2 * values)
+
+
+def unfold(symbols):
+    """Inverse of fold()."""
+    symbols = np.asarray(symbols, dtype=np.int64)
+    return np.where(symbols & 1, -((symbols + 1) >> 1), symbols >> 1)
+
+
+class CoefficientAlphabet:
+    """Dense alphabet of folded coefficients, with an escape symbol for the rare large ones."""
+
+    def __init__(self, size, escape=None):
+        if escape is not None and escape != size - 1:
+            raise ValueError("The escape must be the last symbol of the alphabet")
+        self.size = size
+        self.escape = escape
+        self._bit = arithmeticcoding.FlatFrequencyTable(2)
+
+    @classmethod
+    def from_values(cls, values, max_symbols=MAX_SYMBOLS):
+        """Smallest alphabet covering the values, escaping above max_symbols - 1 folded values."""
+        largest = int(fold(values).max(initial=0))
+        if largest < max_symbols:
+            return cls(largest + 1)
+        return cls(max_symbols, escape=max_symbols - 1)
+
+    def symbols(self, values):
+        """Alphabet symbols of the values (escaped values map to the escape symbol)."""
+        folded = fold(values)
+        if self.escape is None:
+            if folded.max(initial=0) >= self.size:
+                raise ValueError(f"Values outside the {self.size}-symbol alphabet and no escape")
+            return folded
+        return np.minimum(folded, self.escape)
+
+    def frequency_table(self, values):
+        """SimpleFrequencyTable of the values' symbols; unused symbols get frequency 0."""
+        counts = np.bincount(self.symbols(values).ravel(), minlength=self.size)
+        return arithmeticcoding.SimpleFrequencyTable(counts.tolist())
+
+    def _write_escape(self, encoder, remainder):
+        # Exp-Golomb: (length - 1) zero bits, then remainder + 1 in binary
+        value = remainder + 1
+        for bit in [0] * (value.bit_length() - 1) + [int(b) for b in bin(value)[2:]]:
+            encoder.write(self._bit, bit)
+
+    def _read_escape(self, decoder):
+        zeros = 0
+        while decoder.read(self._bit) == 0:
+            zeros += 1
+        value = 1
+        for _ in range(zeros):
+            value = (value << 1) | decoder.read(self._bit)
+        return value - 1
+
+    def write(self, encoder, frequencies, value):
+        """Codes one signed coefficient with an ArithmeticEncoder."""
+        folded = 2 * value if value >= 0 else -2 * value - 1
+        if self.escape is not None and folded >= self.escape:
+            encoder.write(frequencies, self.escape)
+            self._write_escape(encoder, folded - self.escape)
+        elif folded < self.size:
+            encoder.write(frequencies, folded)
+        else:
+            raise ValueError(f"{value} is outside the {self.size}-symbol alphabet and there is no escape")
+
+    def read(self, decoder, frequencies):
+        """Decodes one signed coefficient with an ArithmeticDecoder."""
+        folded = decoder.read(frequencies)
+        if folded == self.escape:
+            folded += self._read_escape(decoder)
+        return (folded >> 1) if folded % 2 == 0 else -((folded + 1) >> 1)
+
+    def write_all(self, encoder, frequencies, values):
+        for value in np.asarray(values).ravel().tolist():
+            self.write(encoder, frequencies, value)
+
+    def read_all(self, decoder, frequencies, count):
+        return np.array([self.read(decoder, frequencies) for _ in range(count)], dtype=np.int64)
+
+
+if __name__ == "__main__":
+    from bit_io import BitWriter, BitReader
+
+    def round_trip(values, alphabet):
+        frequencies = alphabet.frequency_table(values)
+        stream = BitWriter()
+        bitout = arithmeticcoding.BitOutputStream(stream)
+        encoder = arithmeticcoding.ArithmeticEncoder(32, bitout)
+        alphabet.write_all(encoder, frequencies, values)
+        encoder.finish()
+        bitout.close()
+        data = stream.getvalue()
+        decoder = arithmeticcoding.ArithmeticDecoder(32, arithmeticcoding.BitInputStream(BitReader(data)))
+        return data, alphabet.read_all(decoder, frequencies, np.size(values)).reshape(np.shape(values))
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    alphabet = CoefficientAlphabet.from_values(quantized_block)
+    data, decoded = round_trip(quantized_block, alphabet)
+    print(f"{alphabet.size}-symbol alphabet: {len(data)} bytes, lossless: {np.array_equal(decoded, quantized_block)}")
+
+    # 12-bit residual coefficients, far outside the old -128..127 range
+    rng = np.random.default_rng(0)
+    residual = np.round(rng.laplace(0, 30, 4096)).astype(np.int64)
+    residual[::512] = rng.integers(-4000, 4000, 8)
+    alphabet = CoefficientAlphabet.from_values(residual, max_symbols=64)
+    data, decoded = round_trip(residual, alphabet)
+    print(f"{alphabet.size}-symbol alphabet with escape, |max| {np.abs(residual).max()}: {len(data)} bytes "
+          f"({8 * len(data) / residual.size:.3f} bits/coefficient), lossless: {np.array_equal(decoded, residual)}")
@@ -0,0 +1,140 @@
+import collections
+import functools
+import numpy as np
+
+# Coefficient tokenization between quantization and entropy coding.
+#
+# The entropy scripts code quantized_block.flatten() in raster order, so the
+# zeros after the last significant coefficient are coded one by one. Here a
+# stack of blocks is reordered with a scan table, cut at the end of block
+# (EOB) and split the way AV1 codes a level:
+#
+#   base       min(|level|, 3)               coeff_base / coeff_base_eob
+#   br         min(|level| - 3, 12), >= 0    coeff_br, in steps of up to 3
+#   golomb     |level| - 15, >= 0            Exp-Golomb remainder
+#   sign       level < 0                     dc_sign / sign_bit
+#
+# All steps run on the whole (N, h, w) stack at once. Only the coefficients
+# before each block's EOB are kept, which usually removes most of the symbols.
+
+NUM_BASE_LEVELS = 2
+COEFF_BASE_RANGE = 12
+SCAN_KINDS = ('default', 'zigzag', 'row', 'col', 'diagonal')
+
+Tokens = collections.namedtuple(
+    'Tokens', ['eob', 'block_index', 'scan_index', 'base', 'br', 'golomb', 'sign'])
+
+
+@functools.lru_cache(maxsize=None)
+def scan_order(kind, height, width):
+    """Raster positions in scan order for one transform size (read-only array).
+
+    default   the AV1 default scan: zig-zag for square sizes, the up-right
+              diagonal for wide and the down-left diagonal for tall blocks
+    zigzag    anti-diagonals with alternating direction
+    row       row by row (AV1 mrow scan)
+    col       column by column (AV1 mcol scan)
+    diagonal  anti-diagonals, each from bottom-left to top-right
+    """
+    rows, cols = np.divmod(np.arange(height * width), width)
+    diagonal = rows + cols
+    if kind == 'default':
+        if height == width:
+            kind = 'zigzag'
+        else:
+            order = np.lexsort((-rows if width > height else rows, diagonal))
+    if kind == 'zigzag':
+        order = np.lexsort((np.where(diagonal % 2 == 0, cols, rows), diagonal))
+    elif kind == 'row':
+        order = np.arange(height * width)
+    elif kind == 'col':
+        order = np.lexsort((rows, cols))
+    elif kind == 'diagonal':
+        order = np.lexsort((-rows, diagonal))
+    elif kind != 'default':
+        raise ValueError(f"Unknown scan {kind}, expected one of {SCAN_KINDS}")
+    order = order.astype(np.int32)
+    order.setflags(write=False)
+    return order
+
+
+def scan_blocks(blocks, kind='default'):
+    """(N, h, w) blocks -> (N, h * w) coefficients in scan order."""
+    blocks = np.asarray(blocks)
+    height, width = blocks.shape[-2:]
+    return blocks.reshape(blocks.shape[:-2] + (height * width,))[..., scan_order(kind, height, width)]
+
+
+def end_of_block(scanned):
+    """Position after the last non-zero coefficient of every scanned block (0 for all-zero blocks)."""
+    nonzero = np.asarray(scanned) != 0
+    length = nonzero.shape[-1]
+    last = length - np.argmax(nonzero[..., ::-1], axis=-1)
+    return np.where(nonzero.any(axis=-1), last, 0)
+
+
+def split_levels(levels):
+    """Splits signed levels into (base, br, golomb, sign) arrays of the same shape."""
+    levels = np.asarray(levels)
+    magnitude = np.abs(levels)
+    base = np.minimum(magnitude, NUM_BASE_LEVELS + 1)
+    br = np.clip(magnitude - NUM_BASE_LEVELS - 1, 0, COEFF_BASE_RANGE)
+    golomb = np.maximum(magnitude - NUM_BASE_LEVELS - COEFF_BASE_RANGE - 1, 0)
+    return base.astype(np.int32), br.astype(np.int32), golomb.astype(np.int64), levels < 0
+
+
+def tokenize(blocks, kind='default'):
+    """Scans, cuts at EOB and splits a stack of quantized blocks into flat token arrays."""
+    blocks = np.asarray(blocks)
+    scanned = scan_blocks(blocks.reshape((-1,) + blocks.shape[-2:]), kind)
+    eob = end_of_block(scanned)
+    kept = np.arange(scanned.shape[-1]) < eob[:, np.newaxis]
+    block_index, scan_index = np.nonzero(kept)
+    base, br, golomb, sign = split_levels(scanned[kept])
+    return Tokens(eob, block_index, scan_index.astype(np.int32), base, br, golomb, sign)
+
+
+def merge_levels(base, br, golomb, sign):
+    """Inverse of split_levels()."""
+    magnitude = base.astype(np.int64) + br + golomb
+    return np.where(sign, -magnitude, magnitude)
+
+
+def detokenize(tokens, shape, kind='default'):
+    """Rebuilds the (N, h, w) block stack from tokenize() output."""
+    num_blocks = len(tokens.eob)
+    height, width = shape
+    scanned = np.zeros((num_blocks, height * width), dtype=np.int64)
+    scanned[tokens.block_index, tokens.scan_index] = merge_levels(tokens.base, tokens.br, tokens.golomb, tokens.sign)
+    blocks = np.zeros_like(scanned)
+    blocks[:, scan_order(kind, height, width)] = scanned
+    return blocks.reshape(num_blocks, height, width)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    for kind in SCAN_KINDS[1:]:
+        print(f"{kind:8s} scan: {scan_order(kind, 4, 4)}")
+    tokens = tokenize(quantized_block[np.newaxis])
+    print(f"\nScanned: {scan_blocks(quantized_block)}")
+    print(f"EOB: {tokens.eob[0]}, base: {tokens.base}, br: {tokens.br}, golomb: {tokens.golomb}")
+
+    # Typical residual: 57600 4x4 blocks of a 720p frame with energy in the low frequencies
+    rng = np.random.default_rng(0)
+    decay = np.array([[4, 2, 1, 0.5], [2, 1, 0.5, 0.3], [1, 0.5, 0.3, 0.2], [0.5, 0.3, 0.2, 0.1]])
+    blocks = np.round(rng.laplace(0, 0.6, size=(57600, 4, 4)) * decay).astype(np.int32)
+    start = time.perf_counter()
+    tokens = tokenize(blocks)
+    elapsed = time.perf_counter() - start
+    restored = detokenize(tokens, (4, 4))
+    print(f"\n{blocks.size} coefficients -> {tokens.base.size} tokens before EOB "
+          f"({blocks.size / tokens.base.size:.1f}x fewer symbols) in {elapsed * 1000:.1f} ms, "
+          f"lossless: {np.array_equal(restored, blocks)}")
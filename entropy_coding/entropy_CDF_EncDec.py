@@ -1,4 +1,5 @@
 import numpy as np
+from symbol_table import SymbolTable
 
 # Define the quantized block
 quantized_block = np.array([
@@ -46,6 +47,7 @@ def create_cdf(symbol_counts):
 
 # Generate the CDF table
 cdf_table, sorted_symbols, lower_bounds, upper_bounds = create_cdf(symbol_counts)
+symbol_table = SymbolTable(sorted_symbols, [symbol_counts[s] for s in sorted_symbols])
 
 
 
@@ -79,13 +81,9 @@ for _ in range(flat_block.size):
     range_size = high - low
     target = (decoded_value - low) / range_size  # Normalize within [0,1)
 
-    symbol_index = None
-    for i, (l, h) in enumerate(zip(lower_bounds, upper_bounds)):
-        if l <= target < h:
-            symbol_index = i
-            break
-
-    if symbol_index is None:
+    # Binary search for the range with lower <= target < upper
+    symbol_index = int(symbol_table.find_fraction(target))
+    if not 0 <= target < 1 or symbol_index >= len(sorted_symbols):
         raise ValueError(f"Decoding error: No symbol found for target {target}")
 
     # Get the actual symbol
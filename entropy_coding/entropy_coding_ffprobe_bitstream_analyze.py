@@ -1,22 +1,16 @@
-import subprocess
+import json
+
+from av1_bitstream_parser import file_statistics
 
 # Path to the uploaded AVIF file
 avif_file_path = "original_image_smooth.avif"
 
-# Run ffprobe to analyze the AVIF file bitstream
-ffprobe_cmd = [
-    "ffprobe",
-    "-show_streams",
-    "-show_format",
-    "-print_format", "json",
-    avif_file_path
-]
-
+# Analyze the AVIF file bitstream in this process (boxes, OBUs and frame
+# headers, see av1_bitstream_parser.py) instead of spawning ffprobe
 try:
-    result = subprocess.run(ffprobe_cmd, capture_output=True, text=True, check=True)
-    ffprobe_output = result.stdout
-except subprocess.CalledProcessError as e:
-    ffprobe_output = f"Error running ffprobe: {e}"
+    statistics = file_statistics(avif_file_path)
+    bitstream_output = json.dumps(statistics, indent=2)
+except (OSError, ValueError) as e:
+    bitstream_output = f"Error parsing {avif_file_path}: {e}"
 
-ffprobe_output[:1000]  # Show first 1000 characters of the output for analysis.
-print(f"ffprobe_output: {ffprobe_output}")
+print(f"bitstream_output: {bitstream_output}")
@@ -1,5 +1,7 @@
 import numpy as np
 import arithmeticcoding
+from bit_io import BitWriter, BitReader, to_bit_string
+from symbol_table import SymbolTable
 
 # Define the quantized block
 quantized_block = np.array([
@@ -38,43 +40,39 @@ def create_cdf(symbol_counts):
     return cdf_table, sorted_symbols, frequencies, total
 
 cdf_table, sorted_symbols, frequencies, total_count = create_cdf(symbol_counts)
+symbol_table = SymbolTable(sorted_symbols)
 
 # Create a frequency table from CDF
 freq_table = arithmeticcoding.SimpleFrequencyTable(frequencies)
 
 # Perform Arithmetic coding (encoding)
-bitout = arithmeticcoding.BitOutputStream(open("encoded.bin", "wb"))
+encoded_stream = BitWriter()
+bitout = arithmeticcoding.BitOutputStream(encoded_stream)
 encoder = arithmeticcoding.ArithmeticEncoder(32, bitout)
 
 # Encode symbols using the CDF-derived frequency table
 for symbol in flat_block:
-    encoder.write(freq_table, sorted_symbols.index(symbol))  # Encode by symbol index
+    encoder.write(freq_table, symbol_table.index(symbol))  # Encode by symbol index
 
 encoder.finish()
 bitout.close()
 
-def print_bitstream(filename):
-    """Reads the encoded file and prints its bitstream."""
-    with open(filename, 'rb') as f:
-        byte_data = f.read()
-        bitstream = ''.join(format(byte, '08b') for byte in byte_data)  # Convert to binary string
-        print(f"\nBitstream ({len(bitstream)} bits):\n{bitstream}")
+encoded_data = encoded_stream.getvalue()
+print("\nEntropy encoding complete. Encoded data:")
+print(encoded_data)
 
-print("\nEntropy encoding complete. Encoded data saved to 'encoded.bin':")
-with open('encoded.bin', 'rb') as f:
-    print(f.read())
-# Call print_bitstream after encoding
-print_bitstream("encoded.bin")
+bitstream = to_bit_string(encoded_data)
+print(f"\nBitstream ({len(bitstream)} bits):\n{bitstream}")
 
 # Perform Arithmetic decoding (decoding)
-bitin = arithmeticcoding.BitInputStream(open("encoded.bin", "rb"))
+bitin = arithmeticcoding.BitInputStream(BitReader(encoded_data))
 decoder = arithmeticcoding.ArithmeticDecoder(32, bitin)
 
 # Decode symbols using the CDF-derived frequency table
 decoded_block = []
 for _ in range(flat_block.size):
     symbol_index = decoder.read(freq_table)  # Read index
-    decoded_block.append(sorted_symbols[symbol_index])  # Convert index back to symbol
+    decoded_block.append(symbol_table.symbol(symbol_index))  # Convert index back to symbol
 
 bitin.close()
 
@@ -16,6 +16,7 @@
 
 import numpy as np
 from collections import Counter
+from symbol_table import SymbolTable
 
 # === Quantized Block (Example AV1 Coefficients) ===
 quantized_block = np.array([
@@ -32,48 +33,44 @@ symbol_counts = Counter(flat_block)
 # Convert to numpy array for calculations
 symbols = sorted(symbol_counts.keys())
 symbol_counts_np = np.array([symbol_counts[s] for s in symbols])
+symbol_table = SymbolTable(symbols, symbol_counts_np)  # O(1) symbol -> index, O(log n) slot -> index
 print(f"symbols: {symbols}, symbol_counts_np: {symbol_counts_np}")
 
 # === Step 2: rANS Encoding Function ===
-def C_rANS(s, state, symbol_counts):
+def C_rANS(s, state, table):
     """
-    rANS Encoding step: Compresses symbol `s` into `state`.
+    rANS Encoding step: Compresses symbol index `s` into `state` with the counts of SymbolTable `table`.
     """
-    total_counts = np.sum(symbol_counts)  # M
-    cumul_counts = np.insert(np.cumsum(symbol_counts), 0, 0)  # Cumulative frequencies
+    total_counts = table.total  # M
+    cumul_counts = table.start  # Cumulative frequencies
 
-    s_count = symbol_counts[s]  # Symbol frequency
+    s_count = table.counts[s]  # Symbol frequency
     next_state = (state // s_count) * total_counts + cumul_counts[s] + (state % s_count)
-    print(f"IN: State: {state}, S: {s}, s_count: {s_count}, symbol_counts: {symbol_counts}, PARAM: cumul_counts: {cumul_counts}, OUT: next_state: {next_state}")
+    print(f"IN: State: {state}, S: {s}, s_count: {s_count}, symbol_counts: {table.counts}, PARAM: cumul_counts: {cumul_counts}, OUT: next_state: {next_state}")
     return next_state
 
 # === Step 3: rANS Decoding Function ===
-def D_rANS(state, symbol_counts):
+def D_rANS(state, table):
     """
-    rANS Decoding step: Extracts a symbol from `state` and updates the state.
+    rANS Decoding step: Extracts a symbol from `state` with SymbolTable `table` and updates the state.
     """
-    total_counts = np.sum(symbol_counts)  # M
-    cumul_counts = np.insert(np.cumsum(symbol_counts), 0, 0)  # Cumulative frequencies
+    total_counts = table.total  # M
+    cumul_counts = table.start  # Cumulative frequencies
 
-    # Cumulative frequency inverse function
-    def cumul_inverse(y): 
-        for i, _s in enumerate(cumul_counts): 
-            if y < _s:
-                return i - 1
-
-    slot = state % total_counts  # Compute the slot     
-    s = cumul_inverse(slot)  # Decode the symbol
-    prev_state = (state // total_counts) * symbol_counts[s] + slot - cumul_counts[s]  # Update state
-    print(f"IN: State: {state}, symbol_counts: {symbol_counts}, OUT: symbols[s]: {symbols[s]}, prev_state: {prev_state}")
-    return symbols[s], prev_state
+    slot = state % total_counts  # Compute the slot
+    s = int(table.find(slot))  # Cumulative frequency inverse: binary search, or a table for M = 2^k
+    prev_state = (state // total_counts) * table.counts[s] + slot - cumul_counts[s]  # Update state
+    print(f"IN: State: {state}, symbol_counts: {table.counts}, OUT: symbols[s]: {table.symbols[s]}, prev_state: {prev_state}")
+    return int(table.symbols[s]), prev_state
 
 # === Step 4: Encode the Data ===
 state = 0  # Initial state
 encoded_data = []
 
 for symbol in reversed(flat_block):  # Encode in reverse order
-    print(f"IN: symbol: {symbol}, symbols.index(symbol): {symbols.index(symbol)}")
-    state = C_rANS(symbols.index(symbol), state, symbol_counts_np)
+    index = symbol_table.index(symbol)
+    print(f"IN: symbol: {symbol}, symbol_table.index(symbol): {index}")
+    state = C_rANS(index, state, symbol_table)
     encoded_data.append(state)  # Store intermediate states
 
 # Store final state
@@ -84,7 +81,7 @@ decoded_data = []
 state = encoded_data.pop(0)  # Retrieve final state
 
 for _ in range(len(flat_block)):
-    symbol, state = D_rANS(state, symbol_counts_np)
+    symbol, state = D_rANS(state, symbol_table)
     decoded_data.append(symbol)
 
 decoded_block = np.array(decoded_data).reshape(quantized_block.shape)  # Restore shape
@@ -1,5 +1,7 @@
 import numpy as np
 import arithmeticcoding
+from bit_io import BitWriter, BitReader
+from coefficient_alphabet import CoefficientAlphabet
 
 # Define the quantized block
 quantized_block = np.array([
@@ -11,44 +13,35 @@ quantized_block = np.array([
 
 print(f"\nOriginal block:\n{quantized_block}")
 
-# Flatten the block and count symbol frequencies
+# Flatten the block and fold the signed coefficients (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)
 flat_block = quantized_block.flatten()
-unique, counts = np.unique(flat_block, return_counts=True)
-symbol_counts = dict(zip(unique, counts))
+alphabet = CoefficientAlphabet.from_values(flat_block)
 
-# Create a frequency table (required for arithmetic coding)
-def create_frequencies(symbol_counts):
-    freq_table = arithmeticcoding.SimpleFrequencyTable([1] * 256)  # Initialize with uniform frequencies
-    for symbol, count in symbol_counts.items():
-        freq_table.set(symbol & 0xFF, count)
-    return freq_table
-
-freq_table = create_frequencies(symbol_counts)
+# Create a frequency table (required for arithmetic coding) over the folded symbols present
+freq_table = alphabet.frequency_table(flat_block)
+print(f"\nAlphabet: {alphabet.size} folded symbols, escape: {alphabet.escape}")
 
 # Perform Arithmetic coding (encoding)
-bitout = arithmeticcoding.BitOutputStream(open("encoded.bin", "wb"))
+encoded_stream = BitWriter()
+bitout = arithmeticcoding.BitOutputStream(encoded_stream)
 encoder = arithmeticcoding.ArithmeticEncoder(32, bitout)
 
 # Encode symbols
-for symbol in flat_block:
-    encoder.write(freq_table, symbol & 0xFF)
+alphabet.write_all(encoder, freq_table, flat_block)
 
 encoder.finish()
 bitout.close()
 
-print("\nEntropy encoding complete. Encoded data saved to 'encoded.bin':")
-with open('encoded.bin', 'rb') as f:
-    print(f.read())
+encoded_data = encoded_stream.getvalue()
+print("\nEntropy encoding complete. Encoded data:")
+print(encoded_data)
 
 # Perform Arithmetic decoding (decoding)
-bitin = arithmeticcoding.BitInputStream(open("encoded.bin", "rb"))
+bitin = arithmeticcoding.BitInputStream(BitReader(encoded_data))
 decoder = arithmeticcoding.ArithmeticDecoder(32, bitin)
 
 # Decode symbols
-decoded_block = []
-for _ in range(flat_block.size):
-    symbol = decoder.read(freq_table)
-    decoded_block.append(symbol if symbol < 128 else symbol - 256)  # Handle negative values
+decoded_block = alphabet.read_all(decoder, freq_table, flat_block.size)
 
 bitin.close()
 
@@ -0,0 +1,234 @@
+import numpy as np
+
+# Integer range coder in the style of AV1's od_ec (libaom entenc.c/entdec.c).
+#
+# entropy_CDF_EncDec.py narrows a float interval [low, high) and runs out of
+# precision after a few dozen symbols. This coder keeps the state in
+# integers:
+#
+#   CDFs      15-bit, as in the AV1 spec: cdf[i] = 32768 * P(symbol <= i),
+#             the last entry of an N-symbol CDF is 32768
+#   range     16 bits, renormalized with a shift after every symbol
+#   low       a sliding window whose top bits are emitted one byte at a time;
+#             a carry out of the window is propagated back into the bytes
+#             already written to the output bytearray
+#
+# Every symbol costs O(1) work in the encoder and O(position of the symbol
+# in the CDF) comparisons in the decoder, which is what AV1 does (CDFs have
+# at most 16 entries). Each symbol keeps a minimum share of the range
+# (EC_MIN_PROB), so even symbols with a zero probability stay codable, but
+# like in AV1 no CDF entry may be 0 (the first symbol needs cdf[0] >= 1).
+
+CDF_PROB_BITS = 15
+CDF_PROB_TOP = 1 << CDF_PROB_BITS
+EC_PROB_SHIFT = 6
+EC_MIN_PROB = 4
+EC_WINDOW_SIZE = 32
+EC_LOTS_OF_BITS = 0x4000
+
+
+def _scaled(rng, inverse_cdf, symbols_left):
+    """Part of the range above the symbol boundary with inverse CDF value inverse_cdf."""
+    return ((rng >> 8) * (inverse_cdf >> EC_PROB_SHIFT) >> (7 - EC_PROB_SHIFT)) + EC_MIN_PROB * symbols_left
+
+
+class RangeEncoder:
+    """Encodes symbols against 15-bit CDFs into a bytearray."""
+
+    def __init__(self):
+        self.output = bytearray()
+        self.low = 0
+        self.rng = 0x8000
+        self.cnt = -9
+
+    def _emit(self, value):
+        # value may hold a carry in bit 8, which ripples back through 0xFF bytes
+        if value > 0xFF:
+            index = len(self.output) - 1
+            while self.output[index] == 0xFF:
+                self.output[index] = 0
+                index -= 1
+            self.output[index] += 1
+            value &= 0xFF
+        self.output.append(value)
+
+    def _normalize(self, low, rng):
+        d = 16 - rng.bit_length()
+        c = self.cnt
+        s = c + d
+        if s >= 0:
+            c += 16
+            mask = (1 << c) - 1
+            if s >= 8:
+                self._emit(low >> c)
+                low &= mask
+                c -= 8
+                mask >>= 8
+            self._emit(low >> c)
+            s = c + d - 24
+            low &= mask
+        self.low = low << d
+        self.rng = rng << d
+        self.cnt = s
+
+    def encode_symbol(self, symbol, cdf, nsyms=None):
+        """Encodes symbol with the CDF cdf[0..nsyms-1] (extra entries such as a counter are ignored)."""
+        if nsyms is None:
+            nsyms = len(cdf)
+        low = self.low
+        rng = self.rng
+        n = nsyms - 1
+        v = _scaled(rng, CDF_PROB_TOP - int(cdf[symbol]), n - symbol)
+        if symbol > 0:
+            u = _scaled(rng, CDF_PROB_TOP - int(cdf[symbol - 1]), n - symbol + 1)
+            low += rng - u
+            rng = u - v
+        else:
+            rng -= v
+        self._normalize(low, rng)
+
+    def encode_bool(self, bit, probability_zero=16384):
+        """Encodes one bit, probability_zero is P(bit == 0) in 1/32768."""
+        self.encode_symbol(int(bit), (probability_zero, CDF_PROB_TOP), 2)
+
+    def encode_literal(self, value, bits):
+        """Encodes an unsigned bits-wide value with equiprobable bits, MSB first."""
+        for shift in range(bits - 1, -1, -1):
+            self.encode_bool((value >> shift) & 1)
+
+    def encode_symbols(self, symbols, cdf):
+        """Encodes a sequence of symbols that all use one static CDF."""
+        cdf = [int(c) for c in cdf]
+        nsyms = len(cdf)
+        for symbol in np.asarray(symbols).tolist():
+            self.encode_symbol(symbol, cdf, nsyms)
+
+    def finish(self):
+        """Flushes the final state and returns the coded bytes."""
+        low = self.low
+        c = self.cnt
+        s = 10 + c
+        mask = 0x3FFF
+        e = ((low + mask) & ~mask) | (mask + 1)
+        if s > 0:
+            n = (1 << (c + 16)) - 1
+            while s > 0:
+                self._emit(e >> (c + 16))
+                e &= n
+                s -= 8
+                c -= 8
+                n >>= 8
+        return bytes(self.output)
+
+
+class RangeDecoder:
+    """Decodes symbols written by RangeEncoder, given the same CDFs in the same order."""
+
+    def __init__(self, data):
+        self.data = bytes(data)
+        self.position = 0
+        self.dif = (1 << (EC_WINDOW_SIZE - 1)) - 1
+        self.rng = 0x8000
+        self.cnt = -15
+        self._refill()
+
+    def _refill(self):
+        s = EC_WINDOW_SIZE - 9 - (self.cnt + 15)
+        data = self.data
+        while s >= 0 and self.position < len(data):
+            self.dif ^= data[self.position] << s
+            self.position += 1
+            self.cnt += 8
+            s -= 8
+        if self.position >= len(data):
+            self.cnt = EC_LOTS_OF_BITS
+
+    def decode_symbol(self, cdf, nsyms=None):
+        """Returns the next symbol coded with cdf[0..nsyms-1]."""
+        if nsyms is None:
+            nsyms = len(cdf)
+        dif = self.dif
+        rng = self.rng
+        n = nsyms - 1
+        c = dif >> (EC_WINDOW_SIZE - 16)
+        v = rng
+        symbol = -1
+        while True:
+            u = v
+            symbol += 1
+            v = _scaled(rng, CDF_PROB_TOP - int(cdf[symbol]), n - symbol)
+            if c >= v:
+                break
+        rng = u - v
+        dif -= v << (EC_WINDOW_SIZE - 16)
+
+        d = 16 - rng.bit_length()
+        self.cnt -= d
+        self.dif = ((dif + 1) << d) - 1
+        self.rng = rng << d
+        if self.cnt < 0:
+            self._refill()
+        return symbol
+
+    def decode_bool(self, probability_zero=16384):
+        return self.decode_symbol((probability_zero, CDF_PROB_TOP), 2)
+
+    def decode_literal(self, bits):
+        value = 0
+        for _ in range(bits):
+            value = (value << 1) | self.decode_bool()
+        return value
+
+    def decode_symbols(self, count, cdf):
+        """Decodes count symbols that all use one static CDF."""
+        cdf = [int(c) for c in cdf]
+        nsyms = len(cdf)
+        return np.array([self.decode_symbol(cdf, nsyms) for _ in range(count)])
+
+
+def cdf_from_counts(counts):
+    """Builds a 15-bit CDF (last entry 32768, no entry below 1) from symbol counts."""
+    counts = np.asarray(counts, dtype=np.int64)
+    return np.maximum(np.cumsum(counts) * CDF_PROB_TOP // counts.sum(), 1).astype(np.uint16)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    flat_block = quantized_block.flatten()
+    symbols, indices, counts = np.unique(flat_block, return_inverse=True, return_counts=True)
+    cdf = cdf_from_counts(counts)
+    print(f"Symbols: {symbols}\nCDF: {cdf}")
+
+    encoder = RangeEncoder()
+    encoder.encode_symbols(indices, cdf)
+    encoded = encoder.finish()
+    print(f"\nEncoded {flat_block.size} symbols into {len(encoded)} bytes: {encoded.hex()}")
+    decoded_block = symbols[RangeDecoder(encoded).decode_symbols(flat_block.size, cdf)].reshape(quantized_block.shape)
+    print(f"Decoded block:\n{decoded_block}")
+    print("Decoding successful!" if np.array_equal(decoded_block, quantized_block) else "Decoding failed!")
+
+    # One million coefficient-like symbols (geometric distribution, 16-symbol alphabet)
+    rng = np.random.default_rng(0)
+    data = np.minimum(rng.geometric(0.35, 1_000_000) - 1, 15)
+    cdf = cdf_from_counts(np.bincount(data, minlength=16))
+    start = time.perf_counter()
+    encoder = RangeEncoder()
+    encoder.encode_symbols(data, cdf)
+    encoded = encoder.finish()
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = RangeDecoder(encoded).decode_symbols(data.size, cdf)
+    decode_time = time.perf_counter() - start
+    probabilities = np.bincount(data, minlength=16) / data.size
+    entropy = -np.sum(probabilities[probabilities > 0] * np.log2(probabilities[probabilities > 0]))
+    print(f"\n{data.size} symbols: {len(encoded)} bytes ({8 * len(encoded) / data.size:.4f} bits/symbol, "
+          f"entropy {entropy:.4f}), encode {encode_time:.2f} s, decode {decode_time:.2f} s, "
+          f"lossless: {np.array_equal(decoded, data)}")
@@ -0,0 +1,163 @@
+import collections
+import numpy as np
+from symbol_table import SymbolTable
+
+# Interleaved rANS with renormalization (in the style of ryg_rans / rans_word).
+#
+# entropy_general_cumProbTable_then_rANS_coding_decoding.py keeps the rANS
+# state as an unbounded Python int, rebuilds the cumulative counts on every
+# call and decodes with a linear search. Here:
+#
+#   state      32 bits, kept in [L, L << 16) with L = 2^16
+#   output     16-bit words, one word at most per symbol and lane
+#   precision  frequencies normalized to M = 2^scale_bits (at most 2^16)
+#   decode     slot = state & (M - 1) indexes a slot -> symbol table, O(1)
+#
+# Symbol i is coded by lane i % lanes. All lanes advance together, so every
+# encode and decode step is a handful of NumPy operations over the lane
+# vector. Words are stored so that the decoder reads them strictly forwards:
+# first the final lane states, then per step the refill words of the lanes
+# that need one, in lane order.
+
+RANS_L = 1 << 16
+WORD_BITS = 16
+WORD_MASK = (1 << WORD_BITS) - 1
+
+RANSTable = collections.namedtuple('RANSTable', ['freq', 'start', 'slot_to_symbol', 'scale_bits'])
+
+
+def build_table(counts, scale_bits=15):
+    """Normalizes symbol counts to 2^scale_bits (every seen symbol keeps freq >= 1)."""
+    if not 1 <= scale_bits <= 16:
+        raise ValueError("scale_bits must be in 1..16 for a 32-bit state with 16-bit words")
+    counts = np.asarray(counts, dtype=np.int64)
+    total = 1 << scale_bits
+    freq = np.where(counts > 0, np.maximum(counts * total // counts.sum(), 1), 0)
+    # Give the rounding error to the most frequent symbol
+    freq[np.argmax(freq)] += total - freq.sum()
+    if freq.min() < 0 or np.count_nonzero(freq) < np.count_nonzero(counts):
+        raise ValueError(f"Too many symbols for scale_bits={scale_bits}")
+    symbols = SymbolTable(np.arange(len(freq)), freq)
+    return RANSTable(freq.astype(np.uint64), symbols.start[:-1].astype(np.uint64), symbols.slot_table(), scale_bits)
+
+
+def rans_encode(symbols, table, lanes=32):
+    """Encodes symbols (ints < len(table.freq)) and returns the uint16 word stream."""
+    symbols = np.asarray(symbols, dtype=np.int64)
+    count = symbols.size
+    steps = -(-count // lanes)
+    # Idle lanes of the last step carry a symbol with a non-zero frequency
+    padded = np.full(steps * lanes, int(np.argmax(table.freq)), dtype=np.int64)
+    padded[:count] = symbols
+    groups = padded.reshape(steps, lanes)
+    active_last = np.arange(lanes) < count - (steps - 1) * lanes
+
+    scale_bits = np.uint64(table.scale_bits)
+    word_bits = np.uint64(WORD_BITS)
+    x_max_factor = np.uint64((RANS_L >> table.scale_bits) << WORD_BITS)
+    state = np.full(lanes, RANS_L, dtype=np.uint64)
+    chunks = []
+    for step in range(steps - 1, -1, -1):
+        active = active_last if step == steps - 1 else None
+        group = groups[step]
+        freq = table.freq[group]
+        start = table.start[group]
+        emit = state >= x_max_factor * freq
+        if active is not None:
+            emit &= active
+        # Reverse lane order here, the whole stream is reversed at the end
+        chunks.append((state[emit] & np.uint64(WORD_MASK))[::-1])
+        state = np.where(emit, state >> word_bits, state)
+        coded = ((state // freq) << scale_bits) + state % freq + start
+        state = coded if active is None else np.where(active, coded, state)
+
+    words = np.concatenate(chunks)[::-1] if chunks else np.zeros(0, dtype=np.uint64)
+    header = np.stack([state >> word_bits, state & np.uint64(WORD_MASK)], axis=1).ravel()
+    return np.concatenate([header, words]).astype(np.uint16)
+
+
+def rans_decode(words, count, table, lanes=32):
+    """Decodes count symbols from a word stream written by rans_encode() with the same lanes."""
+    words = np.asarray(words, dtype=np.uint64)
+    state = (words[0:2 * lanes:2] << np.uint64(WORD_BITS)) | words[1:2 * lanes:2]
+    position = 2 * lanes
+    steps = -(-count // lanes)
+    output = np.zeros(steps * lanes, dtype=np.int32)
+    active_last = np.arange(lanes) < count - (steps - 1) * lanes
+
+    mask = np.uint64((1 << table.scale_bits) - 1)
+    scale_bits = np.uint64(table.scale_bits)
+    word_bits = np.uint64(WORD_BITS)
+    for step in range(steps):
+        slot = state & mask
+        symbol = table.slot_to_symbol[slot]
+        decoded = table.freq[symbol] * (state >> scale_bits) + slot - table.start[symbol]
+        refill = decoded < RANS_L
+        if step == steps - 1:
+            decoded = np.where(active_last, decoded, state)
+            refill &= active_last
+        needed = int(np.count_nonzero(refill))
+        if needed:
+            decoded[refill] = (decoded[refill] << word_bits) | words[position:position + needed]
+            position += needed
+        state = decoded
+        output[step * lanes:(step + 1) * lanes] = symbol
+    return output[:count]
+
+
+def rans_encode_bytes(symbols, table, lanes=32):
+    """Like rans_encode() but returns little-endian bytes."""
+    return rans_encode(symbols, table, lanes).astype('<u2').tobytes()
+
+
+def rans_decode_bytes(data, count, table, lanes=32):
+    return rans_decode(np.frombuffer(data, dtype='<u2'), count, table, lanes)
+
+
+if __name__ == "__main__":
+    import time
+    from range_coder import RangeEncoder, RangeDecoder, cdf_from_counts
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    flat_block = quantized_block.flatten()
+    symbols, indices, counts = np.unique(flat_block, return_inverse=True, return_counts=True)
+    table = build_table(counts)
+    words = rans_encode(indices, table, lanes=4)
+    decoded_block = symbols[rans_decode(words, flat_block.size, table, lanes=4)].reshape(quantized_block.shape)
+    print(f"Encoded {flat_block.size} symbols into {words.size} words (4 lanes, incl. 8 state words)")
+    print(f"Decoded block:\n{decoded_block}")
+    print("Decoding successful!" if np.array_equal(decoded_block, quantized_block) else "Decoding failed!")
+
+    # One million coefficient-like symbols: rANS lanes vs the range coder
+    rng = np.random.default_rng(0)
+    data = np.minimum(rng.geometric(0.35, 1_000_000) - 1, 15)
+    counts = np.bincount(data, minlength=16)
+    table = build_table(counts)
+    print()
+    for lanes in (4, 32, 1024):
+        start = time.perf_counter()
+        encoded = rans_encode_bytes(data, table, lanes)
+        encode_time = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = rans_decode_bytes(encoded, data.size, table, lanes)
+        decode_time = time.perf_counter() - start
+        print(f"rANS {lanes:4d} lanes: {len(encoded)} bytes, encode {encode_time:.2f} s, "
+              f"decode {decode_time:.2f} s, lossless: {np.array_equal(decoded, data)}")
+
+    cdf = cdf_from_counts(counts)
+    start = time.perf_counter()
+    encoder = RangeEncoder()
+    encoder.encode_symbols(data, cdf)
+    encoded = encoder.finish()
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = RangeDecoder(encoded).decode_symbols(data.size, cdf)
+    decode_time = time.perf_counter() - start
+    print(f"Range coder:      {len(encoded)} bytes, encode {encode_time:.2f} s, "
+          f"decode {decode_time:.2f} s, lossless: {np.array_equal(decoded, data)}")
@@ -0,0 +1,134 @@
+import numpy as np
+
+# Shared symbol table for the entropy coders.
+#
+# The scripts map coefficients to coder indices with sorted_symbols.index()
+# or symbols.index() and decode with a linear walk over the cumulative
+# counts, so every symbol costs O(alphabet). SymbolTable does both lookups in
+# constant or logarithmic time:
+#
+#   symbol -> index   dense array over [min symbol, max symbol], shifted by
+#                     the offset so negative coefficients index it directly
+#   index -> symbol   array of the symbols in coder order
+#   slot -> index     np.searchsorted over the cumulative counts, for scalars
+#                     or whole arrays of slots; when the total is a power of
+#                     two a slot -> index table of `total` entries is built
+#                     once and the lookup is a single indexing operation
+#
+# The coder order is the order in which the symbols are given (sorted by
+# value, by frequency, ...), so the scripts keep their own tables.
+
+
+class SymbolTable:
+    """Distinct integer symbols in coder order, with optional counts."""
+
+    def __init__(self, symbols, counts=None):
+        self.symbols = np.asarray(symbols, dtype=np.int64).ravel()
+        if self.symbols.size == 0:
+            raise ValueError("A symbol table needs at least one symbol")
+        self.offset = int(self.symbols.min())
+        self.dense = np.full(int(self.symbols.max()) - self.offset + 1, -1, dtype=np.int64)
+        self.dense[self.symbols - self.offset] = np.arange(self.symbols.size)
+        if np.count_nonzero(self.dense >= 0) != self.symbols.size:
+            raise ValueError("Symbols must be distinct")
+        if counts is None:
+            counts = np.ones(self.symbols.size, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.int64).ravel()
+        if self.counts.shape != self.symbols.shape:
+            raise ValueError("Need one count per symbol")
+        self.start = np.concatenate(([0], np.cumsum(self.counts)))
+        self.total = int(self.start[-1])
+        self._slots = None
+
+    @classmethod
+    def from_values(cls, values, order='value'):
+        """Table of the distinct values with their counts, ordered by 'value' or by 'frequency' (rarest first)."""
+        symbols, counts = np.unique(np.asarray(values, dtype=np.int64), return_counts=True)
+        if order == 'frequency':
+            ranking = np.argsort(counts, kind='stable')
+            symbols, counts = symbols[ranking], counts[ranking]
+        elif order != 'value':
+            raise ValueError(f"Unknown order {order}, expected 'value' or 'frequency'")
+        return cls(symbols, counts)
+
+    def __len__(self):
+        return self.symbols.size
+
+    def index(self, symbol):
+        """Coder index of one symbol, O(1)."""
+        position = int(symbol) - self.offset
+        if not 0 <= position < self.dense.size or self.dense[position] < 0:
+            raise KeyError(symbol)
+        return int(self.dense[position])
+
+    def indices(self, values):
+        """Coder indices of an array of symbols."""
+        positions = np.asarray(values, dtype=np.int64) - self.offset
+        inside = (positions >= 0) & (positions < self.dense.size)
+        result = np.full(positions.shape, -1, dtype=np.int64)
+        result[inside] = self.dense[positions[inside]]
+        if np.any(result < 0):
+            raise KeyError(f"Not in the table: {np.unique(np.asarray(values)[result < 0])}")
+        return result
+
+    def symbol(self, index):
+        return int(self.symbols[index])
+
+    def symbols_at(self, indices):
+        """Symbols of an array of coder indices."""
+        return self.symbols[np.asarray(indices, dtype=np.int64)]
+
+    def find(self, slots):
+        """Index whose cumulative range [start[i], start[i + 1]) holds each slot (scalar or array)."""
+        if self.total & (self.total - 1) == 0:
+            return self.slot_table()[slots]
+        return np.searchsorted(self.start, slots, side='right') - 1
+
+    def find_fraction(self, targets):
+        """Like find() for targets in [0, 1), against the bounds start / total."""
+        return np.searchsorted(self.start / self.total, targets, side='right') - 1
+
+    def slot_table(self):
+        """slot -> index array of total entries; only built for power-of-two totals."""
+        if self.total & (self.total - 1):
+            raise ValueError(f"Direct slot table needs a power-of-two total, got {self.total}")
+        if self._slots is None:
+            self._slots = np.repeat(np.arange(self.symbols.size, dtype=np.int32), self.counts)
+            self._slots.setflags(write=False)
+        return self._slots
+
+
+if __name__ == "__main__":
+    import time
+
+    # Quantized block used by the entropy coding scripts
+    quantized_block = np.array([
+        [  0, -32,   3,  -2],
+        [-32, -10,   0,   0],
+        [  3,   0,  -2,   0],
+        [ -2,   0,   0,  -1]
+    ])
+    table = SymbolTable.from_values(quantized_block, order='frequency')
+    print(f"Symbols (rarest first): {table.symbols.tolist()}, counts: {table.counts.tolist()}")
+    print(f"Indices of the block:\n{table.indices(quantized_block)}")
+    print(f"Slots 0..{table.total - 1} -> symbols: {table.symbols_at(table.find(np.arange(table.total))).tolist()}")
+
+    # Wide coefficient alphabet: list.index() against the dense table
+    rng = np.random.default_rng(0)
+    values = np.round(rng.laplace(0, 40, 200_000)).astype(np.int64)
+    table = SymbolTable.from_values(values)
+    symbols = table.symbols.tolist()
+    start = time.perf_counter()
+    slow = [symbols.index(v) for v in values[:20_000].tolist()]
+    list_time = (time.perf_counter() - start) * values.size / 20_000
+    start = time.perf_counter()
+    fast = table.indices(values)
+    table_time = time.perf_counter() - start
+    print(f"\n{values.size} symbols over an alphabet of {len(table)}: list.index() {list_time:.2f} s (estimated), "
+          f"dense table {table_time * 1000:.1f} ms, equal: {slow == fast[:20_000].tolist()}")
+    slots = rng.integers(0, table.total, values.size)
+    start = time.perf_counter()
+    found = table.find(slots)
+    search_time = time.perf_counter() - start
+    print(f"searchsorted slot lookup: {search_time * 1000:.1f} ms, "
+          f"all in range: {bool(np.all((table.start[found] <= slots) & (slots < table.start[found + 1])))}")